@@ -0,0 +1,93 @@
+"""Benchmarks building FASTA/FASTQ examples as `bytes` against encoding `str` examples.
+
+Parsers that consume `bytes` have to encode `str` examples first, which costs one more
+full copy of every example.
+
+With hypothesis-bio installed (e.g. `pip install -e .`), run `python benchmarks/bench_as_bytes.py`.
+"""
+
+import time
+import tracemalloc
+
+from hypothesis import HealthCheck, Phase, given, settings
+
+from hypothesis_bio import dna, fasta, fasta_entry, fastq, fastq_entry
+
+EXAMPLES = 20
+SIZE = 1000000
+
+
+def run_examples(strategy, encode, max_examples):
+    @settings(
+        max_examples=max_examples,
+        database=None,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+        deadline=None,
+    )
+    @given(strategy)
+    def run(example):
+        if encode:
+            example = example.encode("ascii")
+        assert isinstance(example, bytes)
+
+    run()
+
+
+def measure(strategy, encode):
+    """Returns the time per example and the peak memory of generating one example.
+
+    Hypothesis keeps hold of earlier examples during a run, so the peak memory is
+    measured on a run of a single example.
+    """
+    start = time.perf_counter()
+    run_examples(strategy, encode, EXAMPLES)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run_examples(strategy, encode, 1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed / EXAMPLES, peak
+
+
+def main():
+    sequences = dna(min_size=SIZE, max_size=SIZE, bulk=True)
+    cases = [
+        (
+            "fasta",
+            lambda as_bytes: fasta(
+                fasta_entry(
+                    sequence_source=sequences, wrap_length=80, as_bytes=as_bytes
+                ),
+                min_reads=3,
+                max_reads=3,
+                as_bytes=as_bytes,
+            ),
+        ),
+        (
+            "fastq",
+            lambda as_bytes: fastq(
+                fastq_entry(min_size=SIZE, max_size=SIZE, as_bytes=as_bytes),
+                min_reads=3,
+                max_reads=3,
+                as_bytes=as_bytes,
+            ),
+        ),
+    ]
+
+    print(
+        "{:>8} {:>10} {:>14} {:>16}".format("format", "mode", "ms/example", "peak MB")
+    )
+    for name, strategy in cases:
+        for mode, as_bytes in [("str", False), ("as_bytes", True)]:
+            seconds, peak = measure(strategy(as_bytes), encode=not as_bytes)
+            print(
+                "{:>8} {:>10} {:>14.1f} {:>16.1f}".format(
+                    name, mode, seconds * 1000, peak / 1e6
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmarks generating 1 Gb of Nanopore-style long reads with `nanopore_fastq`.
+
+Reads of 10 to 500 kb and their quality strings are expanded from bulk blocks of
+bytes, so the throughput is bound by copying rather than by Hypothesis draws.
+
+With hypothesis-bio installed (e.g. `pip install -e .`), run `python benchmarks/bench_long_reads.py`.
+"""
+
+import time
+
+from hypothesis import HealthCheck, Phase, given, settings
+
+from hypothesis_bio import nanopore_fastq
+
+TOTAL_BASES = 10 ** 9
+# Hypothesis holds on to memory for the length of a run, so the total is split
+BATCH_BASES = 10 ** 8
+
+
+class Done(BaseException):
+    """Stops the run once enough bases were generated."""
+
+
+def generate(strategy, total_bases):
+    """Draws examples until `total_bases` bases were generated, returning how many examples that took."""
+    state = {"bases": 0, "examples": 0}
+
+    @settings(
+        max_examples=10 ** 6,
+        database=None,
+        print_blob=False,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+        deadline=None,
+    )
+    @given(strategy)
+    def run(fastq_bytes):
+        # the quality lines are as long as the sequence lines
+        lines = fastq_bytes.split(b"\n")
+        state["bases"] += sum(len(line) for line in lines[1::4])
+        state["examples"] += 1
+        if state["bases"] >= total_bases:
+            raise Done
+
+    try:
+        run()
+    except Done:
+        pass
+    return state
+
+
+def main():
+    for as_bytes in [True, False]:
+        strategy = nanopore_fastq(min_reads=1, max_reads=10, as_bytes=as_bytes)
+        if not as_bytes:
+            strategy = strategy.map(lambda fastq: fastq.encode("ascii"))
+        bases = examples = 0
+        start = time.perf_counter()
+        while bases < TOTAL_BASES:
+            state = generate(strategy, min(BATCH_BASES, TOTAL_BASES - bases))
+            bases += state["bases"]
+            examples += state["examples"]
+        elapsed = time.perf_counter() - start
+        print(
+            "{:>8}: {:.2f} Gb in {} files, {:.1f} s, {:.1f} Mb/s".format(
+                "bytes" if as_bytes else "str",
+                bases / 1e9,
+                examples,
+                elapsed,
+                bases / elapsed / 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
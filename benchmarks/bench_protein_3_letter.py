@@ -0,0 +1,88 @@
+"""Benchmarks rendering titin-sized proteins as 3-letter abbreviations.
+
+Compares concatenating one abbreviation per residue, as `protein` used to, with
+`str.translate` over a prebuilt table, with and without separators.
+
+With hypothesis-bio installed (e.g. `pip install -e .`), run `python benchmarks/bench_protein_3_letter.py`.
+"""
+
+import random
+import time
+
+from hypothesis import HealthCheck, Phase, given, settings
+
+from hypothesis_bio import protein, swissprot_aa_frequencies
+from hypothesis_bio.sequences import _three_letter_table
+from hypothesis_bio.utilities import protein_1to3
+
+REPEATS = 20
+SIZE = 30000  # about the length of titin
+
+
+def concatenated(sequence):
+    sequence_3 = ""
+    for s in sequence:
+        sequence_3 += protein_1to3[s.upper()]
+    return sequence_3
+
+
+def translated(sequence):
+    return sequence.translate(_three_letter_table(False))
+
+
+def separated(sequence):
+    return sequence.translate(_three_letter_table(False, "-"))[:-1]
+
+
+def time_per_call(render, sequences):
+    start = time.perf_counter()
+    for sequence in sequences:
+        render(sequence)
+    return (time.perf_counter() - start) / len(sequences)
+
+
+def time_per_example(strategy):
+    @settings(
+        max_examples=REPEATS,
+        database=None,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+        deadline=None,
+    )
+    @given(strategy)
+    def run(example):
+        assert len(example) >= 3 * SIZE
+
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    residues = "ACDEFGHIKLMNPQRSTVWYacdefghiklmnpqrstvwy"
+    sequences = [
+        "".join(random.choice(residues) for _ in range(SIZE)) for _ in range(REPEATS)
+    ]
+
+    print("{:>24} {:>12}".format("rendering", "ms/protein"))
+    for name, render in [
+        ("concatenated", concatenated),
+        ("translated", translated),
+        ("translated, separated", separated),
+    ]:
+        seconds = time_per_call(render, sequences)
+        print("{:>24} {:>12.2f}".format(name, seconds * 1000))
+
+    seconds = time_per_example(
+        protein(
+            min_size=SIZE,
+            max_size=SIZE,
+            single_letter_protein=False,
+            aa_frequencies=swissprot_aa_frequencies,
+        )
+    )
+    print("{:>24} {:>12.2f}".format("protein() example", seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
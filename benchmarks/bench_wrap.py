@@ -0,0 +1,44 @@
+"""Benchmarks `hypothesis_bio.utilities.wrap` against `textwrap.fill`.
+
+With hypothesis-bio installed (e.g. `pip install -e .`), run `python benchmarks/bench_wrap.py`.
+"""
+
+import random
+import timeit
+from textwrap import fill
+
+from hypothesis_bio.utilities import wrap
+
+SIZES = [1000, 100000, 10000000]
+WIDTH = 80
+
+
+def throughput(function, sequence, repeat=3):
+    number = max(1, 10000000 // len(sequence))
+    best = min(timeit.repeat(lambda: function(sequence), number=number, repeat=repeat))
+    return len(sequence) * number / best / 1e6
+
+
+def main():
+    print(
+        "{:>10} {:>16} {:>16} {:>16}".format(
+            "size", "textwrap MB/s", "wrap str MB/s", "wrap bytes MB/s"
+        )
+    )
+    for size in SIZES:
+        sequence = "".join(random.choice("ACGT") for _ in range(size))
+        encoded = sequence.encode("ascii")
+        textwrap_speed = throughput(
+            lambda s: fill(s, WIDTH, break_on_hyphens=False), sequence, repeat=1
+        )
+        str_speed = throughput(lambda s: wrap(s, WIDTH), sequence)
+        bytes_speed = throughput(lambda s: wrap(s, WIDTH), encoded)
+        print(
+            "{:>10} {:>16.1f} {:>16.1f} {:>16.1f}".format(
+                size, textwrap_speed, str_speed, bytes_speed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,18 @@ module.exports = {
         title: "API Reference",
         collapsable: false,
         children: [
+          "/api/alignments",
           "/api/blast6",
+          "/api/codon_tables",
           "/api/fasta",
           "/api/fastq",
+          "/api/markov",
+          "/api/quality_models",
+          "/api/read_simulation",
+          "/api/references",
           "/api/sequence_identifiers",
-          "/api/sequences"
+          "/api/sequences",
+          "/api/variants"
         ]
       }
     ],
@@ -8,8 +8,15 @@ __email__ = "benjamindlee@me.com"
 MAX_ASCII = 126
 
 from .__version__ import __version__
+from .alignments import *
 from .blast6 import *
+from .codon_tables import *
 from .fasta import *
 from .fastq import *
+from .markov import *
+from .quality_models import *
+from .read_simulation import *
+from .references import *
 from .sequence_identifiers import *
 from .sequences import *
+from .variants import *
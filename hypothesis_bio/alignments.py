@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""Strategies for generating pairs of sequences together with their true alignment."""
+
+from collections import Counter, namedtuple
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import (
+    composite,
+    integers,
+    lists,
+    randoms,
+    sampled_from,
+    tuples,
+)
+
+from .utilities import cigar_string
+
+__all__ = ["AlignedPair", "alignment_score", "aligned_pair"]
+
+AlignedPair = namedtuple("AlignedPair", ["query", "target", "cigar", "score"])
+AlignedPair.__doc__ = """Two sequences and the alignment they were built from.
+
+- `query`: The query sequence.
+- `target`: The target sequence.
+- `cigar`: The CIGAR string aligning `query` to the whole of `target`.
+- `score`: The score of that alignment. An optimal alignment scores at least as much.
+"""
+
+
+def _substitution_matrix(
+    alphabet: str, match: int, mismatch: int
+) -> Dict[Tuple[str, str], int]:
+    """Builds a matrix scoring every identical pair `match` and every other pair `mismatch`."""
+    return {
+        (first, second): match if first == second else mismatch
+        for first in alphabet
+        for second in alphabet
+    }
+
+
+def alignment_score(
+    query: str,
+    target: str,
+    operations: List[Tuple[int, str]],
+    matrix: Mapping[Tuple[str, str], int],
+    gap_open: int,
+    gap_extend: int,
+) -> int:
+    """Scores an alignment given as a list of `(length, operation)` CIGAR operations.
+
+    The aligned columns are gathered into two strings and scored by counting each
+    distinct pair of characters once, so the matrix is looked up once per pair
+    rather than once per column. A gap of length `n` scores `gap_open + n * gap_extend`.
+
+    ### Arguments
+    - `query`: The query sequence.
+    - `target`: The target sequence.
+    - `operations`: The alignment, as `(length, operation)` tuples with operations `M`, `=`, `X`, `I` or `D`.
+    - `matrix`: A dictionary mapping `(query character, target character)` pairs to scores.
+    - `gap_open`: The score for opening a gap.
+    - `gap_extend`: The score for each character in a gap.
+    """
+    query_columns = []
+    target_columns = []
+    score = 0
+    query_index = target_index = 0
+    for length, operation in operations:
+        if operation in "M=X":
+            query_columns.append(query[query_index : query_index + length])
+            target_columns.append(target[target_index : target_index + length])
+            query_index += length
+            target_index += length
+        else:
+            score += gap_open + length * gap_extend
+            if operation == "I":
+                query_index += length
+            else:
+                target_index += length
+    pairs = Counter(zip("".join(query_columns), "".join(target_columns)))
+    return score + sum(count * matrix[pair] for pair, count in pairs.items())
+
+
+@composite
+def aligned_pair(
+    draw,
+    alphabet: str = "ACGT",
+    min_operations: int = 1,
+    max_operations: int = 20,
+    max_run: int = 20,
+    matrix: Optional[Mapping[Tuple[str, str], int]] = None,
+    match: int = 2,
+    mismatch: int = -3,
+    gap_open: int = -5,
+    gap_extend: int = -2,
+    extended_cigar: bool = False,
+) -> AlignedPair:
+    """Generates a query and target sequence together with their true global alignment and its score.
+
+    The alignment is drawn first, as a list of runs of matches, mismatches,
+    insertions and deletions, and both sequences are built from it, so no aligner is
+    run to find the truth. The result is an `AlignedPair` named tuple of the query,
+    the target, the CIGAR string and the score of the alignment under the given
+    scoring scheme. Examples shrink towards fewer, shorter runs of matches.
+
+    The bases filling each run come from a pseudo-random generator seeded by
+    Hypothesis, so long runs cost a single draw.
+
+    ### Arguments
+    - `alphabet`: The characters to build sequences from. Needs at least two for mismatches.
+    - `min_operations`: The fewest runs in the alignment.
+    - `max_operations`: The most runs in the alignment.
+    - `max_run`: The longest run.
+    - `matrix`: A dictionary mapping `(query character, target character)` pairs to scores, for every pair of characters in `alphabet`. If `None`, pairs score `match` or `mismatch`.
+    - `match`: The score of identical characters if `matrix` is `None`.
+    - `mismatch`: The score of different characters if `matrix` is `None`.
+    - `gap_open`: The score for opening a gap.
+    - `gap_extend`: The score for each character in a gap, so that a gap of length `n` scores `gap_open + n * gap_extend`.
+    - `extended_cigar`: Whether to write matches as `=` and mismatches as `X` instead of both as `M`.
+    """
+    if len(set(alphabet)) < 2:
+        raise InvalidArgument(
+            "alphabet={!r} must have at least two distinct characters".format(alphabet)
+        )
+    if max_run < 1:
+        raise InvalidArgument("max_run={} must be positive".format(max_run))
+    if matrix is None:
+        matrix = _substitution_matrix(alphabet, match, mismatch)
+    else:
+        missing = [
+            (first, second)
+            for first in alphabet
+            for second in alphabet
+            if (first, second) not in matrix
+        ]
+        if missing:
+            raise InvalidArgument(
+                "matrix has no score for the pairs {}".format(missing)
+            )
+
+    runs = draw(
+        lists(
+            tuples(sampled_from("=XID"), integers(min_value=1, max_value=max_run)),
+            min_size=min_operations,
+            max_size=max_operations,
+        )
+    )
+    rng = draw(randoms(use_true_random=True))
+
+    query = []
+    target = []
+    operations = []
+    for operation, length in runs:
+        bases = "".join(rng.choices(alphabet, k=length))
+        if operation == "=":
+            query.append(bases)
+            target.append(bases)
+        elif operation == "X":
+            target.append(bases)
+            query.append(
+                "".join(
+                    rng.choice([other for other in alphabet if other != base])
+                    for base in bases
+                )
+            )
+        elif operation == "I":
+            query.append(bases)
+        else:
+            target.append(bases)
+        if not extended_cigar and operation in "=X":
+            operation = "M"
+        # adjacent gaps of the same kind are one longer gap, in the CIGAR and the score
+        if operations and operations[-1][1] == operation:
+            length += operations.pop()[0]
+        operations.append((length, operation))
+
+    query_sequence = "".join(query)
+    target_sequence = "".join(target)
+    return AlignedPair(
+        query=query_sequence,
+        target=target_sequence,
+        cigar=cigar_string(operations),
+        score=alignment_score(
+            query_sequence,
+            target_sequence,
+            operations,
+            matrix,
+            gap_open,
+            gap_extend,
+        ),
+    )
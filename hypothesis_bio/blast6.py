@@ -1,8 +1,30 @@
 # -*- coding: utf-8 -*-
 
-"""Constants for generating BLAST+6 files."""
+"""Strategies and constants for generating BLAST+6 files."""
 
-from hypothesis.strategies import characters, floats, from_type
+from collections import namedtuple
+from math import log
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import (
+    characters,
+    composite,
+    floats,
+    from_type,
+    integers,
+    lists,
+    randoms,
+)
+
+from .sequence_identifiers import sequence_identifier
+
+__all__ = [
+    "BLAST6_HEADERS",
+    "BLAST6_DEFAULT_HEADERS",
+    "BLAST6_DEFAULT_COLUMNS",
+    "blast6_table",
+]
 
 BLAST6_HEADERS = {
     "qseqid": characters(min_codepoint=32, max_codepoint=126),
@@ -45,7 +67,7 @@ BLAST6_HEADERS = {
     "sblastnames": characters(min_codepoint=32, max_codepoint=126),
     "sskingdoms": characters(min_codepoint=32, max_codepoint=126),
     "stitle": characters(min_codepoint=32, max_codepoint=126),
-    "scharacters(min_codepoint=32, max_codepoint=126)and": str,
+    "sstrand": characters(min_codepoint=32, max_codepoint=126),
     "salltitles": characters(min_codepoint=32, max_codepoint=126),
     "qcovs": from_type(int),
     "qcovhsp": from_type(int),
@@ -81,3 +103,371 @@ BLAST6_DEFAULT_HEADERS = [
 """List of strategies to generate the default BLAST+6 headers.
 Useful to use as input to the `columns` keyword argument to `hypothesis-csv`'s `csv` function.
 """
+
+BLAST6_DEFAULT_COLUMNS = [
+    "qseqid",
+    "sseqid",
+    "pident",
+    "length",
+    "mismatch",
+    "gapopen",
+    "qstart",
+    "qend",
+    "sstart",
+    "send",
+    "evalue",
+    "bitscore",
+]
+"""Names of the columns BLAST+ writes with `-outfmt 6` when no columns are given."""
+
+# (staxid, scientific name, common name, BLAST name, super kingdom)
+_TAXA = [
+    ("9606", "Homo sapiens", "human", "primates", "Eukaryota"),
+    ("10090", "Mus musculus", "house mouse", "rodents", "Eukaryota"),
+    ("7227", "Drosophila melanogaster", "fruit fly", "flies", "Eukaryota"),
+    ("4932", "Saccharomyces cerevisiae", "baker's yeast", "ascomycetes", "Eukaryota"),
+    ("562", "Escherichia coli", "E. coli", "enterobacteria", "Bacteria"),
+    ("1773", "Mycobacterium tuberculosis", "N/A", "high GC Gram+", "Bacteria"),
+    ("2287", "Saccharolobus solfataricus", "N/A", "crenarchaeotes", "Archaea"),
+    ("11676", "Human immunodeficiency virus 1", "HIV-1", "viruses", "Viruses"),
+]
+
+# scoring of the default blastn task (reward 2, penalty -3, gap costs 5 and 2)
+_REWARD, _PENALTY, _GAP_OPEN, _GAP_EXTEND = 2, -3, 5, 2
+_LAMBDA, _K = 0.625, 0.41
+
+Blast6Hit = namedtuple(
+    "Blast6Hit",
+    [
+        "query",
+        "subject",
+        "bitscore",
+        "qstart",
+        "qend",
+        "sstart",
+        "send",
+        "nident",
+        "mismatch",
+        "gaps",
+        "gapopen",
+        "positive",
+        "score",
+        "evalue",
+        "runs",
+    ],
+)
+
+
+def _composition(rng, total: int, parts: int) -> List[int]:
+    """Splits `total` into `parts` positive integers."""
+    cuts = sorted(rng.sample(range(1, total), parts - 1))
+    return [end - start for start, end in zip([0] + cuts, cuts + [total])]
+
+
+def _below(rng, n: int) -> int:
+    """Draws an integer from `[0, n)`, faster than `randrange` for the many draws per hit."""
+    return int(rng.random() * n)
+
+
+def _hit(rng, query: int, subject: int, qlen: int, slen: int, db_size: int):
+    """Draws one high-scoring pair, deriving every statistic from its alignment counts.
+
+    The alignment has `aligned` matched or mismatched columns, at most a quarter of
+    them mismatches and a tenth of them gaps, which keeps the raw score positive.
+    Only the number of gap runs on each side is drawn here; their lengths are left
+    to `_aligned_sequences`, for the files that need them.
+    """
+    aligned = 1 + _below(rng, min(qlen, slen))
+    mismatch = _below(rng, aligned // 4 + 1)
+    nident = aligned - mismatch
+    # gaps in the subject lengthen the query span and vice versa
+    subject_gaps = _below(rng, min(aligned // 10, qlen - aligned) + 1)
+    query_gaps = _below(rng, min(aligned // 10 - subject_gaps, slen - aligned) + 1)
+    subject_runs = 1 + _below(rng, subject_gaps) if subject_gaps else 0
+    query_runs = 1 + _below(rng, query_gaps) if query_gaps else 0
+    gaps = subject_gaps + query_gaps
+
+    qspan = aligned + subject_gaps
+    sspan = aligned + query_gaps
+    qstart = 1 + _below(rng, qlen - qspan + 1)
+    sstart = 1 + _below(rng, slen - sspan + 1)
+    send = sstart + sspan - 1
+    if rng.random() < 0.5:
+        sstart, send = send, sstart
+
+    gapopen = subject_runs + query_runs
+    score = (
+        _REWARD * nident
+        + _PENALTY * mismatch
+        - _GAP_OPEN * gapopen
+        - _GAP_EXTEND * gaps
+    )
+    bitscore = (_LAMBDA * score - log(_K)) / log(2)
+    return Blast6Hit(
+        query=query,
+        subject=subject,
+        bitscore=bitscore,
+        qstart=qstart,
+        qend=qstart + qspan - 1,
+        sstart=sstart,
+        send=send,
+        nident=nident,
+        mismatch=mismatch,
+        gaps=gaps,
+        gapopen=gapopen,
+        positive=nident,
+        score=score,
+        evalue=qlen * db_size * 2 ** -bitscore,
+        runs=((subject_gaps, subject_runs), (query_gaps, query_runs)),
+    )
+
+
+def _aligned_sequences(rng, hit: Blast6Hit) -> Tuple[str, str, str]:
+    """Lays out the aligned query and subject sequences of a hit and its BTOP string."""
+    aligned = hit.nident + hit.mismatch
+    mismatches = set(rng.sample(range(aligned), hit.mismatch))
+    runs = []
+    for side, (gaps, num_runs) in zip("sq", hit.runs):
+        if gaps:
+            runs += [(side, length) for length in _composition(rng, gaps, num_runs)]
+    rng.shuffle(runs)
+    gaps_before = dict(zip(sorted(rng.sample(range(1, aligned), len(runs))), runs))
+    bases = rng.choices("ACGT", k=aligned + hit.gaps)
+
+    query = []
+    subject = []
+    btop = []
+    identical = 0
+    used = 0
+    for column in range(aligned):
+        if column in gaps_before:
+            side, length = gaps_before[column]
+            gap_bases = bases[aligned + used : aligned + used + length]
+            used += length
+            if identical:
+                btop.append(str(identical))
+                identical = 0
+            for base in gap_bases:
+                pair = ("-", base) if side == "q" else (base, "-")
+                query.append(pair[0])
+                subject.append(pair[1])
+                btop.append(pair[0] + pair[1])
+        base = bases[column]
+        if column in mismatches:
+            other = "ACGT"["ACGT".index(base) - rng.randint(1, 3)]
+            query.append(base)
+            subject.append(other)
+            if identical:
+                btop.append(str(identical))
+                identical = 0
+            btop.append(base + other)
+        else:
+            query.append(base)
+            subject.append(base)
+            identical += 1
+    if identical:
+        btop.append(str(identical))
+    return "".join(query), "".join(subject), "".join(btop)
+
+
+def _query_coverages(hits: List[Blast6Hit], qlens: List[int]) -> List[str]:
+    """Computes `qcovs`, the share of the query covered by all hits to the same subject."""
+    intervals = {}  # type: Dict[Tuple[int, int], List[Tuple[int, int]]]
+    for hit in hits:
+        intervals.setdefault((hit.query, hit.subject), []).append(
+            (hit.qstart, hit.qend)
+        )
+    coverage = {}
+    for pair, spans in intervals.items():
+        covered = 0
+        reached = 0
+        for start, end in sorted(spans):
+            if end > reached:
+                covered += end - max(start - 1, reached)
+                reached = end
+        coverage[pair] = str(round(100 * covered / qlens[pair[0]]))
+    return [coverage[(hit.query, hit.subject)] for hit in hits]
+
+
+def _format_evalue(evalue: float) -> str:
+    return "0.0" if evalue < 1e-180 else "{:.2g}".format(evalue)
+
+
+class _Table:
+    """The hits of a BLAST+6 file, transposed into one tuple per field.
+
+    Aligned sequences and BTOP strings are only laid out once a column asks for them.
+    """
+
+    def __init__(self, hits, qids, sids, qlens, slens, taxa, rng):
+        self.hits = hits
+        self.fields = dict(zip(Blast6Hit._fields, zip(*hits)))
+        self.qids = [qids[query] for query in self.fields["query"]]
+        self.sids = [sids[subject] for subject in self.fields["subject"]]
+        self.qlens = [qlens[query] for query in self.fields["query"]]
+        self.slens = [slens[subject] for subject in self.fields["subject"]]
+        self.taxa = [taxa[subject] for subject in self.fields["subject"]]
+        self.all_qlens = qlens
+        self.lengths = [
+            nident + mismatch + gaps
+            for nident, mismatch, gaps in zip(
+                self.fields["nident"], self.fields["mismatch"], self.fields["gaps"]
+            )
+        ]
+        self.rng = rng
+        self._alignments = None  # type: Optional[List[Tuple[str, str, str]]]
+
+    def field(self, name: str) -> List[str]:
+        return list(map(str, self.fields[name]))
+
+    def plus_strand(self) -> List[bool]:
+        return [
+            sstart <= send
+            for sstart, send in zip(self.fields["sstart"], self.fields["send"])
+        ]
+
+    def alignment(self, index: int) -> List[str]:
+        if self._alignments is None:
+            self._alignments = [_aligned_sequences(self.rng, hit) for hit in self.hits]
+        return [alignment[index] for alignment in self._alignments]
+
+
+def _subject_gis(table: _Table) -> List[str]:
+    return [str(subject + 1) for subject in table.fields["subject"]]
+
+
+def _titles(table: _Table) -> List[str]:
+    return [
+        "{} {}".format(sid, taxon[1]) for sid, taxon in zip(table.sids, table.taxa)
+    ]
+
+
+def _percentages(
+    numerators: Sequence[int], lengths: List[int], digits: int
+) -> List[str]:
+    template = "{{:.{}f}}".format(digits).format
+    return [
+        template(100 * numerator / length)
+        for numerator, length in zip(numerators, lengths)
+    ]
+
+
+_COLUMNS = {
+    "qseqid": lambda t: t.qids,
+    "qgi": lambda t: [str(query + 1) for query in t.fields["query"]],
+    "qacc": lambda t: t.qids,
+    "qaccver": lambda t: t.qids,
+    "qlen": lambda t: [str(qlen) for qlen in t.qlens],
+    "sseqid": lambda t: t.sids,
+    "sallseqid": lambda t: t.sids,
+    "sgi": _subject_gis,
+    "sallgi": _subject_gis,
+    "sacc": lambda t: t.sids,
+    "saccver": lambda t: t.sids,
+    "sallacc": lambda t: t.sids,
+    "slen": lambda t: [str(slen) for slen in t.slens],
+    "qstart": lambda t: t.field("qstart"),
+    "qend": lambda t: t.field("qend"),
+    "sstart": lambda t: t.field("sstart"),
+    "send": lambda t: t.field("send"),
+    "qseq": lambda t: t.alignment(0),
+    "sseq": lambda t: t.alignment(1),
+    "evalue": lambda t: list(map(_format_evalue, t.fields["evalue"])),
+    "bitscore": lambda t: list(map("{:.1f}".format, t.fields["bitscore"])),
+    "score": lambda t: t.field("score"),
+    "length": lambda t: list(map(str, t.lengths)),
+    "pident": lambda t: _percentages(t.fields["nident"], t.lengths, 3),
+    "nident": lambda t: t.field("nident"),
+    "mismatch": lambda t: t.field("mismatch"),
+    "positive": lambda t: t.field("positive"),
+    "gapopen": lambda t: t.field("gapopen"),
+    "gaps": lambda t: t.field("gaps"),
+    "ppos": lambda t: _percentages(t.fields["positive"], t.lengths, 2),
+    "frames": lambda t: ["1/1" if plus else "1/-1" for plus in t.plus_strand()],
+    "qframe": lambda t: ["1"] * len(t.hits),
+    "sframe": lambda t: ["1" if plus else "-1" for plus in t.plus_strand()],
+    "sstrand": lambda t: ["plus" if plus else "minus" for plus in t.plus_strand()],
+    "btop": lambda t: t.alignment(2),
+    "staxids": lambda t: [taxon[0] for taxon in t.taxa],
+    "sscinames": lambda t: [taxon[1] for taxon in t.taxa],
+    "scomnames": lambda t: [taxon[2] for taxon in t.taxa],
+    "sblastnames": lambda t: [taxon[3] for taxon in t.taxa],
+    "sskingdoms": lambda t: [taxon[4] for taxon in t.taxa],
+    "stitle": _titles,
+    "salltitles": _titles,
+    "qcovs": lambda t: _query_coverages(t.hits, t.all_qlens),
+    "qcovhsp": lambda t: [
+        str(round(100 * (qend - qstart + 1) / qlen))
+        for qstart, qend, qlen in zip(t.fields["qstart"], t.fields["qend"], t.qlens)
+    ],
+}
+
+
+@composite
+def blast6_table(
+    draw,
+    columns: Optional[Sequence[str]] = None,
+    min_hits: int = 1,
+    max_hits: int = 100,
+    max_queries: int = 10,
+    max_subjects: int = 10,
+    max_sequence_length: int = 1000,
+    db_size: int = 10 ** 9,
+    as_bytes: bool = False,
+) -> Union[str, bytes]:
+    """Generates BLAST+ tabular (`-outfmt 6`) files whose columns agree with each other.
+
+    Every row is a hit derived from one drawn alignment, so `qstart <= qend`,
+    `length = nident + mismatch + gaps`, `pident = 100 * nident / length`, spans fit
+    within `qlen` and `slen`, minus strand hits have `sstart > send`, and the score,
+    bit score and e-value follow from the alignment under blastn's default scoring.
+    Rows are grouped by query and sorted by decreasing bit score, like BLAST writes
+    them.
+
+    Hits are drawn from a pseudo-random generator seeded by Hypothesis, so large
+    files cost a handful of draws and shrink towards fewer hits and shorter IDs.
+    Each requested column is built as a whole and the file is rendered with one join,
+    and aligned sequences, BTOP strings and `qcovs` are only computed if requested.
+
+    ### Arguments
+    - `columns`: The names of the columns to write, in order. Defaults to the 12 standard columns, `BLAST6_DEFAULT_COLUMNS`. Any key of `BLAST6_HEADERS` may be used.
+    - `min_hits`: The fewest rows to generate.
+    - `max_hits`: The most rows to generate.
+    - `max_queries`: The most distinct queries.
+    - `max_subjects`: The most distinct subjects.
+    - `max_sequence_length`: The longest query or subject sequence.
+    - `db_size`: The number of letters in the database searched, which scales the e-values.
+    - `as_bytes`: Whether to build the file as `bytes` instead of `str`.
+    """
+    if columns is None:
+        columns = BLAST6_DEFAULT_COLUMNS
+    unknown = [name for name in columns if name not in _COLUMNS]
+    if unknown:
+        raise InvalidArgument("Unknown BLAST+6 columns {}".format(unknown))
+    if max_sequence_length < 1:
+        raise InvalidArgument(
+            "max_sequence_length={} must be positive".format(max_sequence_length)
+        )
+
+    identifiers = sequence_identifier(min_size=1, max_size=20)
+    qids = draw(lists(identifiers, min_size=1, max_size=max_queries, unique=True))
+    sids = draw(lists(identifiers, min_size=1, max_size=max_subjects, unique=True))
+    num_hits = draw(integers(min_value=min_hits, max_value=max_hits))
+    rng = draw(randoms(use_true_random=True))
+
+    qlens = [rng.randint(1, max_sequence_length) for _ in qids]
+    slens = [rng.randint(1, max_sequence_length) for _ in sids]
+    taxa = [rng.choice(_TAXA) for _ in sids]
+    hits = []
+    for _ in range(num_hits):
+        query = rng.randrange(len(qids))
+        subject = rng.randrange(len(sids))
+        hits.append(_hit(rng, query, subject, qlens[query], slens[subject], db_size))
+    hits.sort(key=lambda hit: (hit.query, -hit.bitscore))
+
+    if not hits:
+        return b"" if as_bytes else ""
+    table = _Table(hits, qids, sids, qlens, slens, taxa, rng)
+    rows = zip(*[_COLUMNS[name](table) for name in columns])
+    lines = "".join(["\t".join(row) + "\n" for row in rows])
+    return lines.encode("utf-8") if as_bytes else lines
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+"""[Genetic codes](https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi) for translating and back-translating coding sequences."""
+
+from collections import namedtuple
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
+from typing import Dict
+
+__all__ = [
+    "CodonTable",
+    "unambiguous_dna_by_id",
+    "codon_table",
+    "translate",
+    "back_translate",
+]
+
+CodonTable = namedtuple(
+    "CodonTable",
+    ["id", "name", "forward_table", "back_table", "start_codons", "stop_codons"],
+)
+CodonTable.__doc__ = """A genetic code.
+
+- `id`: The NCBI translation table number.
+- `name`: The NCBI name of the table.
+- `forward_table`: Read-only mapping of every codon to its amino acid (`*` for stops).
+- `back_table`: Read-only mapping of every amino acid (and `*`) to one of its codons.
+- `start_codons`: Sorted tuple of the start codons.
+- `stop_codons`: Sorted tuple of the stop codons.
+"""
+
+# Codons in the order used by the NCBI translation table definitions
+_BASES = "TCAG"
+_CODONS = ["".join(codon) for codon in product(_BASES, repeat=3)]
+
+# from ftp://ftp.ncbi.nih.gov/entrez/misc/data/gc.prt
+# id: (name, amino acids, starts), both strings are in `_CODONS` order. A `*` in the
+# starts string marks a stop codon that is otherwise read through as an amino acid.
+_NCBI_TABLES = {
+    1: (
+        "Standard",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**--*----M---------------M----------------------------",
+    ),
+    2: (
+        "Vertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+        "----------**--------------------MMMM----------**---M------------",
+    ),
+    3: (
+        "Yeast Mitochondrial",
+        "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**----------------------MM---------------M------------",
+    ),
+    4: (
+        "Mold Mitochondrial; Protozoan Mitochondrial; Coelenterate Mitochondrial; "
+        "Mycoplasma; Spiroplasma",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--MM------**-------M------------MMMM---------------M------------",
+    ),
+    5: (
+        "Invertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+        "---M------**--------------------MMMM---------------M------------",
+    ),
+    6: (
+        "Ciliate Nuclear; Dasycladacean Nuclear; Hexamita Nuclear",
+        "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    9: (
+        "Echinoderm Mitochondrial; Flatworm Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "----------**-----------------------M---------------M------------",
+    ),
+    10: (
+        "Euplotid Nuclear",
+        "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**-----------------------M----------------------------",
+    ),
+    11: (
+        "Bacterial, Archaeal and Plant Plastid",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**--*----M------------MMMM---------------M------------",
+    ),
+    12: (
+        "Alternative Yeast Nuclear",
+        "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*----M---------------M----------------------------",
+    ),
+    13: (
+        "Ascidian Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",
+        "---M------**----------------------MM---------------M------------",
+    ),
+    14: (
+        "Alternative Flatworm Mitochondrial",
+        "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "-----------*-----------------------M----------------------------",
+    ),
+    15: (
+        "Blepharisma Macronuclear",
+        "FFLLSSSSYY*QCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------*---*--------------------M----------------------------",
+    ),
+    16: (
+        "Chlorophycean Mitochondrial",
+        "FFLLSSSSYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------*---*--------------------M----------------------------",
+    ),
+    21: (
+        "Trematode Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "----------**-----------------------M---------------M------------",
+    ),
+    22: (
+        "Scenedesmus obliquus Mitochondrial",
+        "FFLLSS*SYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "------*---*---*--------------------M----------------------------",
+    ),
+    23: (
+        "Thraustochytrium Mitochondrial",
+        "FF*LSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--*-------**--*-----------------M--M---------------M------------",
+    ),
+    24: (
+        "Rhabdopleuridae Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+        "---M------**-------M---------------M---------------M------------",
+    ),
+    25: (
+        "Candidate Division SR1 and Gracilibacteria",
+        "FFLLSSSSYY**CCGWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**-----------------------M---------------M------------",
+    ),
+    26: (
+        "Pachysolen tannophilus Nuclear",
+        "FFLLSSSSYY**CC*WLLLAPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*----M---------------M----------------------------",
+    ),
+    27: (
+        "Karyorelict Nuclear",
+        "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    28: (
+        "Condylostoma Nuclear",
+        "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*--------------------M----------------------------",
+    ),
+    29: (
+        "Mesodinium Nuclear",
+        "FFLLSSSSYYYYCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    30: (
+        "Peritrich Nuclear",
+        "FFLLSSSSYYEECC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    31: (
+        "Blastocrithidia Nuclear",
+        "FFLLSSSSYYEECCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**-----------------------M----------------------------",
+    ),
+    32: (
+        "Balanophoraceae Plastid",
+        "FFLLSSSSYY*WCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------*---*----M------------MMMM---------------M------------",
+    ),
+    33: (
+        "Cephalodiscidae Mitochondrial",
+        "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSKVVVVAAAADDEEGGGG",
+        "---M-------*-------M---------------M---------------M------------",
+    ),
+}
+
+ambiguous_dna_values = {
+    "A": "A",
+    "C": "C",
+    "G": "G",
+    "T": "T",
+    "M": "AC",
+    "R": "AG",
+    "W": "AT",
+    "S": "CG",
+    "Y": "CT",
+    "K": "GT",
+    "V": "ACG",
+    "H": "ACT",
+    "D": "AGT",
+    "B": "CGT",
+    "X": "ACGT",
+    "N": "ACGT",
+}
+"""Dictionary mapping IUPAC nucleotide codes to the bases they stand for."""
+
+# ambiguous amino acid codes, used when an ambiguous codon spans several amino acids
+_ambiguous_amino_acids = {
+    frozenset("DN"): "B",
+    frozenset("EQ"): "Z",
+    frozenset("IL"): "J",
+}
+
+
+def _build_table(table_id: int, forward: Dict[str, str], starts, stops) -> CodonTable:
+    back = {}  # type: Dict[str, str]
+    for codon in sorted(forward):
+        back.setdefault(forward[codon], codon)
+    # stop codons that are read through still need to back-translate `*`
+    if stops:
+        back.setdefault("*", min(stops))
+    return CodonTable(
+        id=table_id,
+        name=_NCBI_TABLES[table_id][0],
+        forward_table=MappingProxyType(forward),
+        back_table=MappingProxyType(back),
+        start_codons=tuple(sorted(starts)),
+        stop_codons=tuple(sorted(stops)),
+    )
+
+
+def _unambiguous_table(table_id: int) -> CodonTable:
+    _, amino_acids, starts = _NCBI_TABLES[table_id]
+    forward = {}
+    start_codons = []
+    stop_codons = []
+    for codon, amino_acid, start in zip(_CODONS, amino_acids, starts):
+        forward[codon] = amino_acid
+        if start == "M":
+            start_codons.append(codon)
+        if amino_acid == "*" or start == "*":
+            stop_codons.append(codon)
+    return _build_table(table_id, forward, start_codons, stop_codons)
+
+
+unambiguous_dna_by_id = {
+    table_id: _unambiguous_table(table_id) for table_id in _NCBI_TABLES
+}
+"""Dictionary mapping NCBI table numbers to their unambiguous [`CodonTable`](#codontable)s."""
+
+
+def _ambiguous_table(table_id: int) -> CodonTable:
+    unambiguous = unambiguous_dna_by_id[table_id]
+    starts = set(unambiguous.start_codons)
+    stops = set(unambiguous.stop_codons)
+
+    forward = {}
+    start_codons = []
+    stop_codons = []
+    for codon in product(ambiguous_dna_values, repeat=3):
+        expansions = [
+            "".join(bases)
+            for bases in product(*(ambiguous_dna_values[base] for base in codon))
+        ]
+        amino_acids = frozenset(unambiguous.forward_table[c] for c in expansions)
+        codon = "".join(codon)
+
+        if len(amino_acids) == 1:
+            forward[codon] = next(iter(amino_acids))
+        else:
+            forward[codon] = _ambiguous_amino_acids.get(amino_acids, "X")
+        if starts.issuperset(expansions):
+            start_codons.append(codon)
+        if stops.issuperset(expansions):
+            stop_codons.append(codon)
+    return _build_table(table_id, forward, start_codons, stop_codons)
+
+
+@lru_cache(maxsize=None)
+def codon_table(table: int = 1, allow_ambiguous=False) -> CodonTable:
+    """Returns the [`CodonTable`](#codontable) for an NCBI translation table.
+
+    Ambiguous tables cover every codon written with IUPAC codes. An ambiguous codon is
+    a start or stop codon if every codon it stands for is, and translates to the
+    amino acid they all share (or `B`, `Z`, `J` or `X` if they differ). They are built
+    the first time they are requested.
+
+    ### Arguments
+    - `table`: The NCBI translation table number.
+    - `allow_ambiguous`: Whether to return the table including ambiguous codons.
+    """
+    if table not in _NCBI_TABLES:
+        raise ValueError(
+            "{} is not an NCBI translation table, choose from {}".format(
+                table, sorted(_NCBI_TABLES)
+            )
+        )
+    if allow_ambiguous:
+        return _ambiguous_table(table)
+    return unambiguous_dna_by_id[table]
+
+
+def translate(sequence: str, table: int = 1, to_stop=False) -> str:
+    """Translates a coding sequence into its protein sequence.
+
+    The sequence may use lowercase, `U` and IUPAC codes; stop codons translate to `*`.
+
+    ### Arguments
+    - `sequence`: The coding sequence to translate. Its length must be a multiple of 3.
+    - `table`: The NCBI translation table number.
+    - `to_stop`: Whether to stop translating at the first stop codon.
+    """
+    if len(sequence) % 3 != 0:
+        raise ValueError(
+            "Sequence length {} is not a multiple of three".format(len(sequence))
+        )
+    sequence = sequence.upper().replace("U", "T")
+    forward = codon_table(table, allow_ambiguous=True).forward_table
+    codons = [sequence[i : i + 3] for i in range(0, len(sequence), 3)]
+    try:
+        protein = "".join(map(forward.__getitem__, codons))
+    except KeyError as error:
+        raise ValueError("{} is not a valid codon".format(error.args[0]))
+
+    if to_stop:
+        return protein.split("*", 1)[0]
+    return protein
+
+
+@lru_cache(maxsize=None)
+def _back_translation(table: int) -> Dict[int, str]:
+    return {
+        ord(amino_acid): codon
+        for amino_acid, codon in codon_table(table).back_table.items()
+    }
+
+
+def back_translate(protein: str, table: int = 1) -> str:
+    """Back-translates a protein sequence into one of the coding sequences encoding it.
+
+    Every amino acid is always encoded by the same codon: the first in alphabetical
+    order. `*` is encoded by a stop codon. In tables 27, 28 and 31 every stop codon
+    also encodes an amino acid, which is what [`translate`](#translate) returns, so
+    `*` does not round-trip for them.
+
+    ### Arguments
+    - `protein`: The protein sequence to back-translate, in single-letter codes.
+    - `table`: The NCBI translation table number.
+    """
+    sequence = protein.upper().translate(_back_translation(table))
+    if len(sequence) != 3 * len(protein):
+        raise ValueError(
+            "{!r} contains amino acids not encoded by table {}".format(protein, table)
+        )
+    return sequence
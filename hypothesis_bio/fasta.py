@@ -2,14 +2,69 @@
 
 """Strategies for generating [FASTA](https://en.wikipedia.org/wiki/FASTA_format) formatted sequences."""
 
-from textwrap import fill
-from typing import Optional
+from typing import BinaryIO, Dict, Optional, Set, Union
 
 from hypothesis import assume
+from hypothesis.strategies import (
+    SearchStrategy,
+    characters,
+    composite,
+    integers,
+    sampled_from,
+    text,
+)
+
+from .sequences import _dna_alphabet, dna
+from .utilities import (
+    StreamedFile,
+    bulk_bytes,
+    draw_size,
+    stream_entries,
+    to_bytes,
+    translate_uniform,
+    unique_entry,
+    wrap,
+)
 
-from hypothesis.strategies import SearchStrategy, characters, composite, integers, sampled_from, text
 
-from .sequences import dna
+@composite
+def _random_layout(draw, sequence, allow_windows_line_endings=True):
+    """Splits a sequence into lines of random widths.
+
+    The number of line breaks is drawn first, then that many distinct positions
+    between characters with a partial Fisher-Yates shuffle, so the layout can never
+    start with a line break or contain two adjacent ones. The result is assembled with
+    a single join.
+
+    ### Arguments
+    - `sequence`: The `str` or `bytes`-like sequence to lay out.
+    - `allow_windows_line_endings`: Whether to allow `\\r\\n` in the linebreaks.
+    """
+    line_endings = ["\n", "\r\n"] if allow_windows_line_endings else ["\n"]
+    joiner = ""
+    if not isinstance(sequence, str):
+        line_endings = [line_ending.encode() for line_ending in line_endings]
+        joiner = b""
+
+    # a break at gap i goes between characters i and i + 1
+    gaps = max(0, len(sequence) - 1)
+    moved = {}  # type: Dict[int, int]
+    breaks = []
+    for i in range(draw(integers(min_value=0, max_value=gaps))):
+        j = draw(integers(min_value=i, max_value=gaps - 1))
+        breaks.append(moved.get(j, j) + 1)
+        moved[j] = moved.get(i, i)
+    breaks.sort()
+
+    pieces = []
+    position = 0
+    for line_break in breaks:
+        pieces.append(sequence[position:line_break])
+        pieces.append(draw(sampled_from(line_endings)))
+        position = line_break
+    pieces.append(sequence[position:])
+
+    return joiner.join(pieces)
 
 
 @composite
@@ -19,7 +74,8 @@ def fasta_entry(
     sequence_source: SearchStrategy = None,
     wrap_length: Optional[int] = None,
     allow_windows_line_endings=True,
-) -> str:
+    as_bytes=False,
+) -> Union[str, bytes]:
     """Generates individual FASTA entries.
 
     ::: warning Warning
@@ -29,45 +85,50 @@ def fasta_entry(
     ### Arguments
 
     - `comment_source`: The source of the comments. Defaults to `text(alphabet=characters(min_codepoint=32, max_codepoint=126))`)
-    - `sequence_source`: The source of the sequence. Defaults to [`dna`](#dna).
+    - `sequence_source`: The source of the sequence. Defaults to [`dna`](#dna), which with `as_bytes` is drawn directly as `bytes`.
     - `wrap_length`: The width to wrap the sequence on. If `None`, mixed sizes are used.
     - `allow_windows_line_endings`: Whether to allow `\\r\\n` in the linebreaks.
+    - `as_bytes`: Whether to build the entry as `bytes` instead of `str`. Sources may then also produce `bytes`.
     """
     if comment_source is None:
         comment_source = text(alphabet=characters(min_codepoint=32, max_codepoint=126))
-    if sequence_source is None:
-        sequence_source = dna()
-
     comment = draw(comment_source)
-    sequence = draw(sequence_source)
+    if sequence_source is not None:
+        sequence = draw(sequence_source)
+    elif as_bytes:
+        # drawn straight into bytes, like the default FASTQ read, rather than encoded
+        size = draw_size(draw, 0, None)
+        block = draw(bulk_bytes(min_size=size, max_size=size))
+        sequence = translate_uniform(block, _dna_alphabet())
+    else:
+        sequence = draw(dna())
+    if as_bytes:
+        comment = to_bytes(comment)
+        sequence = to_bytes(sequence)
+    elif not isinstance(sequence, str):
+        sequence = str(sequence, "ascii")
 
     # the nice case where the user gave the wrap size
     if wrap_length is not None:
         # default to 80 if wrap length is set as 0
         if wrap_length <= 0:
             wrap_length = 80
-        sequence = fill(sequence, wrap_length, break_on_hyphens=False)
+        sequence = wrap(sequence, wrap_length)
 
     # the pathological case
     elif wrap_length is None:
+        sequence = draw(_random_layout(sequence, allow_windows_line_endings))
+
+    # sanity checks (the layout never creates these, but the sources might)
+    if as_bytes:
+        assume(
+            b"\n\r" not in sequence
+            and b"\n\n" not in sequence
+            and b"\r\r" not in sequence
+        )
+        assume(not sequence.startswith(b"\r") and not sequence.startswith(b"\n"))
+        return b"".join([b">", comment, b"\n", sequence])
 
-        # choose where to wrap
-        indices = [
-            draw(integers(min_value=0, max_value=len(sequence)))
-            for i in range(draw(integers(min_value=0, max_value=len(sequence))))
-        ]
-        indices = list(set(indices))
-
-        # randomly put in the line endings
-        for index in indices:
-            line_ending = (
-                draw(sampled_from(["\r\n", "\n"]))
-                if allow_windows_line_endings
-                else "\n"
-            )
-            sequence = sequence[:index] + line_ending + sequence[index:]
-
-    # sanity checks
     assume("\n\r" not in sequence and "\n\n" not in sequence and "\r\r" not in sequence)
     assume(not sequence.startswith("\r") and not sequence.startswith("\n"))
 
@@ -80,17 +141,68 @@ def fasta(
     entry_source: Optional[SearchStrategy] = None,
     min_reads: int = 1,
     max_reads: int = 100,
-) -> str:
+    as_bytes=False,
+    unique_ids=False,
+) -> Union[str, bytes]:
     """Generates string representations of FASTA files.
 
     ### Arguments
     - `entry_source`: The search strategy to use for generating FASTA entries. The default (`None`) will use [`fasta_entry`](#fasta_entry) with default settings.
     - `min_reads`: Minimum number of FASTA entries to generate.
     - `max_reads`: Maximum number of FASTA entries to generate.
+    - `as_bytes`: Whether to build the file as `bytes` instead of `str`.
+    - `unique_ids`: Whether every entry must have a different identifier (the header up to its first space). Repeated identifiers get a `_<n>` suffix rather than being redrawn.
+    """
+    if entry_source is None:
+        entry_source = fasta_entry(as_bytes=as_bytes)
+
+    num_reads = draw(integers(min_value=min_reads, max_value=max_reads))
+    entries = [draw(entry_source) for i in range(num_reads)]
+    if unique_ids:
+        seen = set()  # type: Set[int]
+        entries = [unique_entry(entry, seen) for entry in entries]
+
+    if as_bytes:
+        return b"\n".join([to_bytes(entry) for entry in entries])
+    return "\n".join(entries)
+
+
+@composite
+def fasta_file(
+    draw,
+    entry_source: Optional[SearchStrategy] = None,
+    min_reads: int = 1,
+    max_reads: int = 100,
+    destination: Optional[BinaryIO] = None,
+    unique_ids: bool = False,
+) -> StreamedFile:
+    """Generates FASTA files by writing entries to disk one at a time.
+
+    Unlike [`fasta`](#fasta), the file is never held in memory as a whole, which makes it suitable for testing parsers on very large inputs.
+    The result is a `StreamedFile` named tuple with the `path` of the file, the `handle` it was written to, and the number of entries and bytes written.
+
+    ::: warning Warning
+    If no `destination` is given, a new temporary file is created for every example and deleted once the example finishes, so copy it if you need to keep it.
+    A `destination` is rewound and truncated at the start of every example, so it only holds the latest one.
+    :::
+
+    ### Arguments
+    - `entry_source`: The search strategy to use for generating FASTA entries. The default (`None`) will use [`fasta_entry`](#fasta_entry) with default settings.
+    - `min_reads`: Minimum number of FASTA entries to generate.
+    - `max_reads`: Maximum number of FASTA entries to generate.
+    - `destination`: A seekable binary file object, such as an `io.BufferedWriter`, to write to instead of a temporary file.
+    - `unique_ids`: Whether every entry must have a different identifier. See [`fasta`](#fasta).
     """
     if entry_source is None:
-        entry_source = fasta_entry()
+        entry_source = fasta_entry(as_bytes=True)
 
     num_reads = draw(integers(min_value=min_reads, max_value=max_reads))
 
-    return "\n".join([draw(entry_source) for i in range(num_reads)])
+    return stream_entries(
+        draw,
+        entry_source,
+        num_reads,
+        destination=destination,
+        suffix=".fasta",
+        unique_ids=unique_ids,
+    )
@@ -2,16 +2,137 @@
 
 """Strategies for generating [FASTQ](https://en.wikipedia.org/wiki/FASTQ_format) formatted sequence and quality data."""
 
-from textwrap import fill
-from typing import Optional
+from collections import namedtuple
+from functools import lru_cache
+from typing import BinaryIO, Mapping, Optional, Sequence, Set, Tuple, Union
 
-from hypothesis import assume
- 
-from hypothesis.strategies import SearchStrategy, characters, composite, integers, text
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import SearchStrategy, composite, integers, just
 
 from . import MAX_ASCII
-from .sequence_identifiers import sequence_identifier
-from .sequences import dna
+from .quality_models import QualityModel
+from .sequence_identifiers import (
+    illumina_run_identifiers,
+    illumina_sequence_identifier,
+    nanopore_run_identifiers,
+    sequence_identifier,
+)
+from .sequences import _dna_alphabet
+from .utilities import (
+    StreamedFile,
+    bulk_bytes,
+    draw_size,
+    reverse_complement,
+    sampling_table,
+    stream_entries,
+    stream_paired_entries,
+    to_bytes,
+    translate_uniform,
+    unique_entry,
+    weighted_choices,
+    wrap,
+)
+
+_QualityEncoder = namedtuple("_QualityEncoder", ["encode", "width", "header"])
+"""How blocks of raw bytes become quality strings, using `header` leading bytes for the
+whole string and `width` bytes per score."""
+
+
+@lru_cache(maxsize=None)
+def _quality_alphabet(min_score: int, max_score: int, offset: int) -> str:
+    """Orders the quality characters that raw bytes are translated into.
+
+    Like Hypothesis' text strategies, the characters are ordered to shrink towards `0`.
+    """
+    min_codepoint = min_score + offset
+    max_codepoint = max_score + offset
+
+    if min_score > max_score:
+        raise InvalidArgument(
+            "Cannot have max_score={} < min_score={}".format(max_score, min_score)
+        )
+    if min_codepoint < 0:
+        raise InvalidArgument(
+            "{} is smaller than the minimum ASCII value 0".format(min_codepoint)
+        )
+    if max_codepoint > MAX_ASCII:
+        raise ValueError(
+            "{} is larger than the maximum ASCII value {}".format(
+                max_codepoint, MAX_ASCII
+            )
+        )
+
+    codepoints = sorted(
+        range(min_codepoint, max_codepoint + 1),
+        key=lambda c: (c < ord("0"), abs(c - ord("0"))),
+    )
+    return bytes(codepoints).decode("ascii")
+
+
+@lru_cache(maxsize=None)
+def _score_table(min_score: int, max_score: int, offset: int) -> bytes:
+    """Builds the table translating scores into quality characters, clamping them to the range."""
+    _quality_alphabet(min_score, max_score, offset)  # validates the range
+    return bytes(min(max(score, min_score), max_score) + offset for score in range(256))
+
+
+@lru_cache(maxsize=None)
+def _weighted_score_table(
+    scores: Tuple[int, ...], min_score: int, max_score: int, offset: int
+) -> bytes:
+    """Builds the table translating indices of `scores` into quality characters."""
+    _quality_alphabet(min_score, max_score, offset)  # validates the range
+    characters = bytes(
+        min(max(score, min_score), max_score) + offset for score in scores
+    )
+    return characters + bytes(256 - len(characters))
+
+
+def _quality_encoder(
+    min_score: int,
+    max_score: int,
+    offset: int,
+    model: Optional[QualityModel] = None,
+    score_weights: Optional[Mapping[int, float]] = None,
+) -> _QualityEncoder:
+    """Decides how a block of raw bytes becomes a quality string."""
+    if model is not None and score_weights is not None:
+        raise InvalidArgument("Cannot use both a quality model and score weights")
+    if score_weights is not None:
+        scores = tuple(sorted(score_weights))
+        sampler = sampling_table(
+            tuple(score_weights[score] for score in scores), bits=16
+        )
+        table = _weighted_score_table(scores, min_score, max_score, offset)
+        return _QualityEncoder(
+            lambda block: weighted_choices(block, sampler).translate(table), 2, 0
+        )
+    if model is not None:
+        table = _score_table(min_score, max_score, offset)
+        # the leading byte picks the read level, separately from every score
+        return _QualityEncoder(
+            lambda block: model.scores(block[1:], block[0]).translate(table), 1, 1
+        )
+    alphabet = _quality_alphabet(min_score, max_score, offset)
+    return _QualityEncoder(lambda block: translate_uniform(block, alphabet), 1, 0)
+
+
+@composite
+def _read(
+    draw,
+    min_size: int,
+    max_size: Optional[int],
+    alphabet: str,
+    quality: _QualityEncoder,
+):
+    """Generates a sequence and its quality string together from one block of bytes."""
+    size = draw_size(draw, min_size, max_size)
+    block_size = (1 + quality.width) * size + quality.header
+    block = draw(bulk_bytes(min_size=block_size, max_size=block_size))
+    return (
+        translate_uniform(block[:size], alphabet),
+        quality.encode(block[size:]),
+    )
 
 
 @composite
@@ -22,6 +143,8 @@ def fastq_quality(
     min_score: int = 0,
     max_score: int = 93,
     offset: int = 33,
+    model: Optional[QualityModel] = None,
+    score_weights: Optional[Mapping[int, float]] = None,
 ) -> str:
     """Generates quality strings for the FASTQ format.
 
@@ -31,6 +154,8 @@ def fastq_quality(
     - `min_score`: Lowest quality (PHRED) score to use.
     - `max_score`: Highest quality (PHRED) score to use.
     - `offset`: ASCII encoding offset.
+    - `model`: The [quality model](/api/quality_models) deciding how scores are distributed along the string, such as `cycle_decay_quality()`. Its scores are clamped to `[min_score, max_score]`. If `None`, every score is equally likely.
+    - `score_weights`: Dictionary mapping scores to their relative frequency, for a distribution that is the same at every position. Scores are clamped to `[min_score, max_score]`. Cannot be combined with `model`.
 
     ::: tip Note
 
@@ -41,25 +166,10 @@ def fastq_quality(
 
     :::
     """
-    min_codepoint = min_score + offset
-    max_codepoint = max_score + offset
-
-    if max_codepoint > MAX_ASCII:
-        raise ValueError(
-            "{} is larger than the maximum ASCII value {}".format(
-                max_codepoint, MAX_ASCII
-            )
-        )
-
-    return draw(
-        text(
-            alphabet=characters(
-                min_codepoint=min_codepoint, max_codepoint=max_codepoint
-            ),
-            min_size=min_size,
-            max_size=max_size,
-        )
-    )
+    quality = _quality_encoder(min_score, max_score, offset, model, score_weights)
+    block_size = quality.width * draw_size(draw, min_size, max_size) + quality.header
+    block = draw(bulk_bytes(min_size=block_size, max_size=block_size))
+    return quality.encode(block).decode("ascii")
 
 
 @composite
@@ -74,7 +184,10 @@ def fastq_entry(
     identifier_source: Optional[SearchStrategy] = None,
     additional_description: bool = True,
     wrap_length: int = 80,
-) -> str:
+    as_bytes: bool = False,
+    quality_model: Optional[QualityModel] = None,
+    score_weights: Optional[Mapping[int, float]] = None,
+) -> Union[str, bytes]:
     """Generates entries in FASTQ format.
 
     ### Arguments
@@ -83,10 +196,13 @@ def fastq_entry(
     - `min_score`: Lowest quality (PHRED) score to use.
     - `max_score`: Highest quality (PHRED) score to use.
     - `offset`: ASCII encoding offset for quality string.
-    - `sequence_source`: Search strategy to generate the sequence from. By default [`dna()`](#dna) will be used.
+    - `sequence_source`: Search strategy to generate the sequence from. By default a [`dna()`](#dna) sequence is drawn together with its quality string.
     - `identifier_source`: Search strategy to generate the sequence identifier from. If `None` then random text will be generated.
     - `additional_description`: Add sequence ID and comment after `+` on third line.
     - `wrap_length`: Number of characters to wrap the sequence and quality strings on. Set to 0 to disable wrapping.
+    - `as_bytes`: Whether to build the entry as `bytes` instead of `str`. Sources may then also produce `bytes`.
+    - `quality_model`: The [quality model](/api/quality_models) of the quality string. See [`fastq_quality`](#fastq_quality).
+    - `score_weights`: Dictionary mapping scores to their relative frequency. See [`fastq_quality`](#fastq_quality).
 
     ::: tip Note
 
@@ -99,29 +215,43 @@ def fastq_entry(
     """
     if identifier_source is None:
         identifier_source = sequence_identifier()
-    if sequence_source is None:
-        sequence_source = dna(min_size=min_size, max_size=max_size)
+    encoder = _quality_encoder(
+        min_score, max_score, offset, quality_model, score_weights
+    )
 
     seq_id = draw(identifier_source)
-    sequence = draw(sequence_source)
-
-    quality = draw(
-        fastq_quality(
-            min_size=len(sequence),
-            max_size=len(sequence),
-            min_score=min_score,
-            max_score=max_score,
-            offset=offset,
-        )
-    )
-    assume(len(quality) == len(sequence))
+    if sequence_source is None:
+        # the default sequence and its quality string are drawn in one go
+        sequence, quality = draw(_read(min_size, max_size, _dna_alphabet(), encoder))
+    else:
+        sequence = draw(sequence_source)
+        block_size = encoder.width * len(sequence) + encoder.header
+        quality = draw(bulk_bytes(min_size=block_size, max_size=block_size))
+        quality = encoder.encode(quality)
+
+    if as_bytes:
+        seq_id = to_bytes(seq_id)
+        sequence = to_bytes(sequence)
+    else:
+        quality = quality.decode("ascii")
+        if not isinstance(sequence, str):
+            sequence = str(sequence, "ascii")
+
+    description = seq_id if additional_description else seq_id[:0]
+
+    return _format_entry(seq_id, sequence, quality, description, wrap_length)
 
-    description = seq_id if additional_description else ""
 
+def _format_entry(seq_id, sequence, quality, description, wrap_length):
+    """Lays out one FASTQ entry; the fields are either all `str` or all `bytes`."""
     if wrap_length > 0:
-        sequence = fill(sequence, wrap_length, break_on_hyphens=False)
-        quality = fill(quality, wrap_length, break_on_hyphens=False)
+        sequence = wrap(sequence, wrap_length)
+        quality = wrap(quality, wrap_length)
 
+    if isinstance(seq_id, bytes):
+        return b"".join(
+            [b"@", seq_id, b"\n", sequence, b"\n+", description, b"\n", quality]
+        )
     return "@{seq_id}\n{sequence}\n+{description}\n{quality}".format(
         seq_id=seq_id, sequence=sequence, quality=quality, description=description
     )
@@ -133,17 +263,309 @@ def fastq(
     entry_source: Optional[SearchStrategy] = None,
     min_reads: int = 1,
     max_reads: int = 100,
-) -> str:
+    as_bytes: bool = False,
+    illumina_run: bool = False,
+    unique_ids: bool = False,
+) -> Union[str, bytes]:
     """Generates string representations of FASTQ files.
 
     ### Arguments
     - `entry_source`: The search strategy to use for generating FASTQ entries. The default (`None`) will use [`fastq_entry`](#fastq_entry) with default settings.
     - `min_reads`: Minimum number of FASTQ entries to generate.
     - `max_reads`: Maximum number of FASTQ entries to generate.
+    - `as_bytes`: Whether to build the file as `bytes` instead of `str`.
+    - `illumina_run`: Whether the entries look like the sorted output of one Illumina run, sharing their instrument, run, flowcell and lane with increasing tile and x/y positions. See [`illumina_run_identifiers`](/api/sequence_identifiers#illumina_run_identifiers). Cannot be combined with `entry_source`.
+    - `unique_ids`: Whether every entry must have a different identifier (the header up to its first space). Repeated identifiers get a `_<n>` suffix rather than being redrawn.
+    """
+    if illumina_run and entry_source is not None:
+        raise InvalidArgument(
+            "Cannot use illumina_run with an entry_source, which draws its own identifiers"
+        )
+    if entry_source is None:
+        entry_source = fastq_entry(as_bytes=as_bytes)
+
+    num_reads = draw(integers(min_value=min_reads, max_value=max_reads))
+
+    if illumina_run:
+        identifiers = draw(
+            illumina_run_identifiers(min_size=num_reads, max_size=num_reads)
+        )
+        entries = [
+            draw(fastq_entry(identifier_source=just(seq_id), as_bytes=as_bytes))
+            for seq_id in identifiers
+        ]
+    else:
+        entries = [draw(entry_source) for i in range(num_reads)]
+    if unique_ids:
+        seen = set()  # type: Set[int]
+        entries = [unique_entry(entry, seen) for entry in entries]
+
+    if as_bytes:
+        return b"\n".join([to_bytes(entry) for entry in entries])
+    return "\n".join(entries)
+
+
+@composite
+def nanopore_fastq(
+    draw,
+    min_reads: int = 1,
+    max_reads: int = 10,
+    min_size: int = 10000,
+    max_size: int = 500000,
+    min_score: int = 0,
+    max_score: int = 50,
+    quality_model: Optional[QualityModel] = None,
+    score_weights: Optional[Mapping[int, float]] = None,
+    wrap_length: int = 0,
+    as_bytes: bool = False,
+) -> Union[str, bytes]:
+    """Generates long-read FASTQ files that look like the output of one Nanopore run.
+
+    Every read shares the run's run ID and sample ID, with identifiers from
+    [`nanopore_run_identifiers`](/api/sequence_identifiers#nanopore_run_identifiers).
+    Like basecalled reads, the sequences are uppercase `ACGT` only.
+    Each read and its quality string are expanded from one bulk block of bytes, so
+    reads of hundreds of kilobases cost a handful of draws.
+
+    ### Arguments
+    - `min_reads`: Minimum number of FASTQ entries to generate.
+    - `max_reads`: Maximum number of FASTQ entries to generate.
+    - `min_size`: Minimum length of the reads.
+    - `max_size`: Maximum length of the reads.
+    - `min_score`: Lowest quality (PHRED) score to use.
+    - `max_score`: Highest quality (PHRED) score to use.
+    - `quality_model`: The [quality model](/api/quality_models) of the quality strings. See [`fastq_quality`](#fastq_quality).
+    - `score_weights`: Dictionary mapping scores to their relative frequency. See [`fastq_quality`](#fastq_quality).
+    - `wrap_length`: Number of characters to wrap the sequence and quality strings on. Defaults to 0, leaving them unwrapped like Nanopore basecallers do.
+    - `as_bytes`: Whether to build the file as `bytes` instead of `str`.
+    """
+    encoder = _quality_encoder(min_score, max_score, 33, quality_model, score_weights)
+    num_reads = draw(integers(min_value=min_reads, max_value=max_reads))
+    identifiers = draw(nanopore_run_identifiers(min_size=num_reads, max_size=num_reads))
+    entries = []
+    for seq_id in identifiers:
+        # basecalled reads are plain uppercase ACGT, without gaps or ambiguity codes
+        sequence, quality = draw(_read(min_size, max_size, "ACGT", encoder))
+        if as_bytes:
+            seq_id = to_bytes(seq_id)
+        else:
+            sequence = sequence.decode("ascii")
+            quality = quality.decode("ascii")
+        entries.append(
+            _format_entry(seq_id, sequence, quality, seq_id[:0], wrap_length)
+        )
+    return (b"\n" if as_bytes else "\n").join(entries)
+
+
+@composite
+def fastq_file(
+    draw,
+    entry_source: Optional[SearchStrategy] = None,
+    min_reads: int = 1,
+    max_reads: int = 100,
+    destination: Optional[BinaryIO] = None,
+    unique_ids: bool = False,
+) -> StreamedFile:
+    """Generates FASTQ files by writing entries to disk one at a time.
+
+    Unlike [`fastq`](#fastq), the file is never held in memory as a whole, which makes it suitable for testing parsers on very large inputs.
+    The result is a `StreamedFile` named tuple with the `path` of the file, the `handle` it was written to, and the number of entries and bytes written.
+
+    ::: warning Warning
+    If no `destination` is given, a new temporary file is created for every example and deleted once the example finishes, so copy it if you need to keep it.
+    A `destination` is rewound and truncated at the start of every example, so it only holds the latest one.
+    :::
+
+    ### Arguments
+    - `entry_source`: The search strategy to use for generating FASTQ entries. The default (`None`) will use [`fastq_entry`](#fastq_entry) with default settings.
+    - `min_reads`: Minimum number of FASTQ entries to generate.
+    - `max_reads`: Maximum number of FASTQ entries to generate.
+    - `destination`: A seekable binary file object, such as an `io.BufferedWriter`, to write to instead of a temporary file.
+    - `unique_ids`: Whether every entry must have a different identifier. See [`fastq`](#fastq).
     """
     if entry_source is None:
-        entry_source = fastq_entry()
+        entry_source = fastq_entry(as_bytes=True)
 
     num_reads = draw(integers(min_value=min_reads, max_value=max_reads))
 
-    return "\n".join([draw(entry_source) for i in range(num_reads)])
+    return stream_entries(
+        draw,
+        entry_source,
+        num_reads,
+        destination=destination,
+        suffix=".fastq",
+        unique_ids=unique_ids,
+    )
+
+
+def _mate_identifiers(seq_id: str) -> Tuple[str, str]:
+    """Derives the identifiers of both reads of a pair from one identifier.
+
+    Casava 1.8 identifiers (`name 1:N:0:index`) differ only in the read number in
+    their comment; any other identifier gets the older `/1` and `/2` suffixes.
+    """
+    name, space, comment = seq_id.partition(" ")
+    if comment[:2] in ("1:", "2:"):
+        return name + " 1" + comment[1:], name + " 2" + comment[1:]
+    return name + "/1" + space + comment, name + "/2" + space + comment
+
+
+@composite
+def fastq_pair(
+    draw,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+    min_insert_size: Optional[int] = None,
+    max_insert_size: int = 500,
+    min_score: int = 0,
+    max_score: int = 93,
+    offset: int = 33,
+    quality_model: Optional[QualityModel] = None,
+    score_weights: Optional[Mapping[int, float]] = None,
+    identifier_source: Optional[SearchStrategy] = None,
+    additional_description: bool = True,
+    wrap_length: int = 80,
+    interleaved: bool = False,
+    as_bytes: bool = False,
+) -> Union[Tuple[str, str], Tuple[bytes, bytes], str, bytes]:
+    """Generates the two FASTQ entries of a paired-end read.
+
+    Both reads are taken from the ends of one DNA template (the insert): the first read
+    is the start of the template, the second the start of its reverse complement. Both
+    are as long as the drawn read size, or as the template if that is shorter. Their
+    identifiers match: Illumina (Casava 1.8) identifiers differ only in their read
+    number, any other identifier gets a `/1` or `/2` suffix.
+
+    ### Arguments
+    - `min_size`: Minimum length of the reads.
+    - `max_size`: Maximum length of the reads.
+    - `min_insert_size`: Minimum length of the template the reads are taken from. Defaults to `min_size`, and at least 1, so reads are never shorter than `min_size`.
+    - `max_insert_size`: Maximum length of the template the reads are taken from.
+    - `min_score`: Lowest quality (PHRED) score to use.
+    - `max_score`: Highest quality (PHRED) score to use.
+    - `offset`: ASCII encoding offset for quality strings.
+    - `quality_model`: The [quality model](/api/quality_models) of the quality strings. See [`fastq_quality`](#fastq_quality).
+    - `score_weights`: Dictionary mapping scores to their relative frequency. See [`fastq_quality`](#fastq_quality).
+    - `identifier_source`: Search strategy to generate the identifier of the pair from. Defaults to [`illumina_sequence_identifier`](/api/sequence_identifiers#illumina_sequence_identifier).
+    - `additional_description`: Add sequence ID and comment after `+` on third line.
+    - `wrap_length`: Number of characters to wrap the sequence and quality strings on. Set to 0 to disable wrapping.
+    - `interleaved`: Whether to return both entries as one newline-separated string instead of a tuple.
+    - `as_bytes`: Whether to build the entries as `bytes` instead of `str`.
+
+    ::: tip Tip
+    Use `fastq_file(entry_source=fastq_pair(interleaved=True))` to stream an interleaved FASTQ file to disk.
+    :::
+    """
+    if identifier_source is None:
+        identifier_source = illumina_sequence_identifier(read_num=1)
+    encoder = _quality_encoder(
+        min_score, max_score, offset, quality_model, score_weights
+    )
+
+    seq_id = draw(identifier_source)
+    if not isinstance(seq_id, str):
+        seq_id = bytes(seq_id).decode("utf-8")
+    if min_insert_size is None:
+        min_insert_size = max(1, min_size)
+    read_size = draw_size(draw, min_size, max_size)
+    insert_size = draw(integers(min_value=min_insert_size, max_value=max_insert_size))
+    size = min(read_size, insert_size)
+
+    # the template and both quality strings come from one block of bytes
+    quality_size = encoder.width * size + encoder.header
+    block_size = insert_size + 2 * quality_size
+    block = draw(bulk_bytes(min_size=block_size, max_size=block_size))
+    template = translate_uniform(block[:insert_size], "ACGT")
+    sequences = [
+        template[:size],
+        reverse_complement(template[insert_size - size :]),
+    ]
+    qualities = [
+        encoder.encode(block[insert_size : insert_size + quality_size]),
+        encoder.encode(block[insert_size + quality_size :]),
+    ]
+
+    entries = []
+    for mate_id, sequence, quality in zip(
+        _mate_identifiers(seq_id), sequences, qualities
+    ):
+        if as_bytes:
+            mate_id = to_bytes(mate_id)
+        else:
+            sequence = sequence.decode("ascii")
+            quality = quality.decode("ascii")
+        description = mate_id if additional_description else mate_id[:0]
+        entries.append(
+            _format_entry(mate_id, sequence, quality, description, wrap_length)
+        )
+
+    if interleaved:
+        return (b"\n" if as_bytes else "\n").join(entries)
+    return tuple(entries)
+
+
+@composite
+def paired_fastq(
+    draw,
+    pair_source: Optional[SearchStrategy] = None,
+    min_pairs: int = 1,
+    max_pairs: int = 100,
+    as_bytes: bool = False,
+) -> Union[Tuple[str, str], Tuple[bytes, bytes]]:
+    """Generates the two files of a paired-end FASTQ data set, the first and second reads of every pair in the same order.
+
+    ### Arguments
+    - `pair_source`: The search strategy to use for generating read pairs. The default (`None`) will use [`fastq_pair`](#fastq_pair) with default settings.
+    - `min_pairs`: Minimum number of read pairs to generate.
+    - `max_pairs`: Maximum number of read pairs to generate.
+    - `as_bytes`: Whether to build the files as `bytes` instead of `str`.
+    """
+    if pair_source is None:
+        pair_source = fastq_pair(as_bytes=as_bytes)
+
+    num_pairs = draw(integers(min_value=min_pairs, max_value=max_pairs))
+    pairs = [draw(pair_source) for i in range(num_pairs)]
+
+    if as_bytes:
+        return (
+            b"\n".join([to_bytes(pair[0]) for pair in pairs]),
+            b"\n".join([to_bytes(pair[1]) for pair in pairs]),
+        )
+    return "\n".join([pair[0] for pair in pairs]), "\n".join(
+        [pair[1] for pair in pairs]
+    )
+
+
+@composite
+def paired_fastq_files(
+    draw,
+    pair_source: Optional[SearchStrategy] = None,
+    min_pairs: int = 1,
+    max_pairs: int = 100,
+    destinations: Optional[Sequence[Optional[BinaryIO]]] = None,
+) -> Tuple[StreamedFile, StreamedFile]:
+    """Generates the two files of a paired-end FASTQ data set by writing read pairs to disk one at a time.
+
+    Like [`fastq_file`](#fastq_file), only one pair is held in memory at a time.
+    The result is a tuple of two `StreamedFile` named tuples, one for the first reads and one for the second reads.
+
+    ::: warning Warning
+    Without `destinations`, two new temporary files are created for every example and deleted once the example finishes.
+    Given `destinations` are rewound and truncated at the start of every example.
+    :::
+
+    ### Arguments
+    - `pair_source`: The search strategy to use for generating read pairs. The default (`None`) will use [`fastq_pair`](#fastq_pair) with default settings.
+    - `min_pairs`: Minimum number of read pairs to generate.
+    - `max_pairs`: Maximum number of read pairs to generate.
+    - `destinations`: Two seekable binary file objects to write the first and second reads to instead of temporary files.
+    """
+    if pair_source is None:
+        pair_source = fastq_pair(as_bytes=True)
+
+    num_pairs = draw(integers(min_value=min_pairs, max_value=max_pairs))
+
+    first, second = stream_paired_entries(
+        draw, pair_source, num_pairs, destinations=destinations, suffix=".fastq"
+    )
+    return first, second
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""Strategies for generating DNA from [Markov chains](https://en.wikipedia.org/wiki/Markov_chain) fitted to real sequences."""
+
+import hashlib
+import json
+import os
+from collections import Counter, namedtuple
+from typing import Iterable, List, Optional, Union
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import composite
+
+from .references import reference_pool
+from .utilities import bulk_bytes, sampling_table
+
+__all__ = [
+    "MarkovModel",
+    "MAX_MARKOV_ORDER",
+    "DEFAULT_CACHE_DIRECTORY",
+    "fit_markov_model",
+    "markov_dna",
+]
+
+
+class MarkovModel(namedtuple("MarkovModel", ["order", "counts"])):
+    """A *k*-th order Markov model of DNA.
+
+    - `order`: The number *k* of preceding bases the next base depends on, at most [`MAX_MARKOV_ORDER`](#max_markov_order).
+    - `counts`: How often each (*k* + 1)-mer occurs, as a tuple of `4 ** (k + 1)` counts in `ACGT` order (so `AAA`, `AAC`, ... for *k* = 2).
+
+    The sampling tables of a model, `4 ** k * 256` bytes, are built the first time
+    sequences are drawn from it and kept with the model.
+    """
+
+
+MAX_MARKOV_ORDER = 8
+"""Highest order of a Markov model; the sampling tables of an order 8 model take 22 MB."""
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(".hypothesis", "hypothesis_bio")
+"""Where fitted models are cached, next to Hypothesis' own example database."""
+
+_BASES = "ACGT"
+_CODES_TO_BASES = bytes(ord(_BASES[code % 4]) for code in range(256))
+_CHUNK_SIZE = 1 << 20
+
+
+def _count_words(sequences: Iterable[bytes], order: int) -> List[int]:
+    """Counts the (`order` + 1)-mers made up only of `ACGT` (in any case) in the sequences."""
+    code = {base: i for i, base in enumerate(_BASES.encode("ascii"))}
+    counts = [0] * 4 ** (order + 1)
+    for sequence in sequences:
+        sequence = sequence.upper()
+        # zip over shifted copies counts every window in C
+        windows = Counter(zip(*[sequence[i:] for i in range(order + 1)]))
+        for window, count in windows.items():
+            index = 0
+            for base in window:
+                if base not in code:
+                    break
+                index = index * 4 + code[base]
+            else:
+                counts[index] += count
+    return counts
+
+
+def _file_sequences(path: str, order: int) -> Iterable[bytes]:
+    """Reads the records of a FASTA or 2bit file in overlapping chunks."""
+    pool = reference_pool(path)
+    for index, record in enumerate(pool.records):
+        for start in range(0, record.length, _CHUNK_SIZE):
+            yield bytes(pool.fetch(index, start, start + _CHUNK_SIZE + order))
+
+
+def _check_order(order: int) -> None:
+    if not 0 <= order <= MAX_MARKOV_ORDER:
+        raise InvalidArgument(
+            "order={} must be between 0 and {}".format(order, MAX_MARKOV_ORDER)
+        )
+
+
+def fit_markov_model(
+    source: Union[str, os.PathLike, Iterable[Union[str, bytes]]],
+    order: int = 3,
+    cache_directory: Optional[str] = DEFAULT_CACHE_DIRECTORY,
+) -> MarkovModel:
+    """Fits a *k*-th order Markov model to DNA sequences.
+
+    Models fitted to a file are cached on disk under `cache_directory`, keyed by the
+    path, size and modification time of the file, so each file is only read once.
+    Windows containing anything but `ACGT` (such as `N` runs) are skipped, and case is
+    ignored.
+
+    ### Arguments
+    - `source`: The path of a FASTA or 2bit file (see [`reference_pool`](/api/references#reference_pool)), or an iterable of sequences.
+    - `order`: The number of preceding bases the next base depends on.
+    - `cache_directory`: The directory to cache models of files in. If `None`, models are not cached.
+    """
+    _check_order(order)
+
+    if not isinstance(source, (str, os.PathLike)):
+        sequences = (
+            sequence.encode("ascii") if isinstance(sequence, str) else bytes(sequence)
+            for sequence in source
+        )
+        return MarkovModel(order, tuple(_count_words(sequences, order)))
+
+    path = os.path.realpath(os.fspath(source))
+    cache_path = None
+    if cache_directory is not None:
+        status = os.stat(path)
+        key = "{}:{}:{}:{}".format(path, status.st_size, status.st_mtime_ns, order)
+        cache_path = os.path.join(
+            cache_directory,
+            "markov-{}.json".format(hashlib.sha1(key.encode()).hexdigest()),
+        )
+        if os.path.exists(cache_path):
+            with open(cache_path) as handle:
+                return MarkovModel(order, tuple(json.load(handle)["counts"]))
+
+    counts = _count_words(_file_sequences(path, order), order)
+    if cache_path is not None:
+        os.makedirs(cache_directory, exist_ok=True)
+        temporary_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        with open(temporary_path, "w") as handle:
+            json.dump({"order": order, "counts": counts}, handle)
+        os.replace(temporary_path, cache_path)
+    return MarkovModel(order, tuple(counts))
+
+
+def _sampling_table(weights: List[int]) -> bytes:
+    """Maps the 256 byte values onto base codes in proportion to their weight.
+
+    Zero bytes map to the most likely base. Bases that never follow a context are all
+    equally likely.
+    """
+    if not any(weights):
+        weights = [1] * len(weights)
+    return sampling_table(tuple(weights))
+
+
+def _transition_tables(model: MarkovModel) -> List[bytes]:
+    """Builds one flat table per order up to the model's, indexed by `context * 256 + byte`.
+
+    Lower orders, used for the first bases of a sequence, are marginals of the counts.
+    The tables are kept on the model, so its counts are not hashed on every draw.
+    """
+    try:
+        return model._tables
+    except AttributeError:
+        pass
+    _check_order(model.order)
+    if len(model.counts) != 4 ** (model.order + 1):
+        raise InvalidArgument(
+            "A model of order {} needs {} counts, got {}".format(
+                model.order, 4 ** (model.order + 1), len(model.counts)
+            )
+        )
+
+    tables = []
+    for order in range(model.order + 1):
+        # sum the counts over the leading bases the lower order does not look at
+        group = 4 ** (order + 1)
+        marginal = [0] * group
+        for index, count in enumerate(model.counts):
+            marginal[index % group] += count
+        tables.append(
+            b"".join(
+                _sampling_table(marginal[context * 4 : context * 4 + 4])
+                for context in range(4 ** order)
+            )
+        )
+    model._tables = tables
+    return tables
+
+
+@composite
+def markov_dna(
+    draw, model: MarkovModel, min_size: int = 0, max_size: Optional[int] = None
+) -> str:
+    """Generates DNA sequences from a Markov model, as fitted by [`fit_markov_model`](#fit_markov_model).
+
+    Unlike [`dna`](/api/sequences#dna), which draws every base independently, the
+    sequences reproduce the composition of the data the model was fitted to, such as
+    homopolymer runs, CpG depletion and low-complexity regions. The sequences are
+    uppercase `ACGT`, so they can be used wherever `dna()` is, for example as a
+    `sequence_source`.
+
+    Bases are generated from a block of raw bytes, one table lookup each, so long
+    sequences are cheap to draw. As with `dna(bulk=True)`, without a `max_size` at most
+    `min_size + 64` bases are generated. Sequences shrink towards the most likely base after each context.
+
+    ### Arguments
+    - `model`: The `MarkovModel` to generate sequences from.
+    - `min_size`: The shortest sequence to generate.
+    - `max_size`: The longest sequence to generate.
+    """
+    tables = _transition_tables(model)
+    noise = draw(bulk_bytes(min_size=min_size, max_size=max_size))
+
+    order = model.order
+    mask = 4 ** order - 1
+    top = tables[order]
+    codes = bytearray(len(noise))
+    context = 0
+    for i in range(min(order, len(noise))):
+        codes[i] = tables[i][context * 256 + noise[i]]
+        context = context * 4 + codes[i]
+    for i in range(order, len(noise)):
+        base = top[(context << 8) | noise[i]]
+        codes[i] = base
+        context = ((context << 2) | base) & mask
+
+    return codes.translate(_CODES_TO_BASES).decode("ascii")
@@ -22,6 +22,14 @@ ATOM = "AUCGTNWSMKRYBDHV"
 ALPHANUMERIC = ACHAR + digits
 
 
+def _encode_record(record, as_bytes):
+    """Encodes a record as ASCII `bytes` if requested.
+
+    Records are at most 80 columns wide, so encoding the finished record is cheap.
+    """
+    return record.encode("ascii") if as_bytes else record
+
+
 @composite
 def generate_date(draw):
     """Generates a value of type Date in PDB format
@@ -97,25 +105,32 @@ def generate_specification(
 
 
 @composite
-def generate_header(draw):
+def generate_header(draw, as_bytes=False):
     """Generates the Header record in PDB
+
+    ### Arguments
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     classification = draw(generate_lstring(min_size=0, max_size=40))
     depDate = draw(generate_date())
     idCode = draw(generate_idcode())
-    return (
+    record = (
         "HEADER" + " " * 3 + classification.ljust(40, " ") + depDate + " " * 3 + idCode
     )
+    return _encode_record(record, as_bytes)
 
 
 @composite
-def generate_obslte(draw, continuation_number=None, min_entries=1, max_entries=9):
+def generate_obslte(
+    draw, continuation_number=None, min_entries=1, max_entries=9, as_bytes=False
+):
     """Generates the Obslte record in PDB
 
     ### Arguments
     - `continuation_number`: The number of obslte record in this PDB entry. Must either be None or >=2
     - `min_entries`: The minimum number of extra obsolete entries to be generated.
     - `max_entries`: The maximum number of extra obsolete entries to be generated.
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     generated_record = "OBSLTE "
     if continuation_number is None:
@@ -134,15 +149,16 @@ def generate_obslte(draw, continuation_number=None, min_entries=1, max_entries=9
             generated_record += code + " "
         else:
             generated_record += code
-    return generated_record
+    return _encode_record(generated_record, as_bytes)
 
 
 @composite
-def generate_title(draw, continuation_number=None):
+def generate_title(draw, continuation_number=None, as_bytes=False):
     """Generates the Title record in PDB
 
     ### Arguments
     - `continuation_number`: The number of Title record in this PDB entry. Must either be None or >=2.
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     cont_string = ""
     if continuation_number is None:
@@ -151,17 +167,20 @@ def generate_title(draw, continuation_number=None):
         cont_string = str(continuation_number).rjust(2, " ") + " "
 
     title = draw(generate_lstring(min_size=0, max_size=70))
-    return "TITLE   " + cont_string + title
+    return _encode_record("TITLE   " + cont_string + title, as_bytes)
 
 
 @composite
-def generate_split(draw, continuation_number=None, min_entries=1, max_entries=14):
+def generate_split(
+    draw, continuation_number=None, min_entries=1, max_entries=14, as_bytes=False
+):
     """Generates the Split record in PDB
 
     ### Arguments
     - `continuation_number`: The number of split record in this PDB entry. Must either be None or >=2
     - `min_entries`: The minimum number of entries to be generated.
     - `max_entries`: The maximum number of entries to be generated.
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     cont_string = ""
     if continuation_number is None:
@@ -177,15 +196,16 @@ def generate_split(draw, continuation_number=None, min_entries=1, max_entries=14
             ids_string += code + " "
         else:
             ids_string += code
-    return "SPLIT   " + cont_string + ids_string
+    return _encode_record("SPLIT   " + cont_string + ids_string, as_bytes)
 
 
 @composite
-def generate_caveat(draw, continuation_number=None):
+def generate_caveat(draw, continuation_number=None, as_bytes=False):
     """Generates the Caveat record in PDB
 
     ### Arguments
     - `continuation_number`: The number of caveat record in this PDB entry. Must be either None or >=2.
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     cont_string = ""
     if continuation_number is None:
@@ -195,15 +215,16 @@ def generate_caveat(draw, continuation_number=None):
 
     code = draw(generate_idcode())
     caveat = draw(generate_lstring(min_size=0, max_size=60))
-    return "CAVEAT  " + cont_string + code + "    " + caveat
+    return _encode_record("CAVEAT  " + cont_string + code + "    " + caveat, as_bytes)
 
 
 @composite
-def generate_compnd(draw, continuation_number=None):
+def generate_compnd(draw, continuation_number=None, as_bytes=False):
     """Generates the COMPND record in PDB
 
     ### Arguments
     - `continuation_number`: The number of caveat record in this PDB entry. Must be either None or >=2.
+    - `as_bytes`: Whether to return the record as `bytes` instead of `str`.
     """
     record_string = "COMPND "
     cont_string = ""
@@ -282,4 +303,4 @@ def generate_compnd(draw, continuation_number=None):
             )
         else:
             record_string += "NUMBER NOT ASSIGNED;"
-    return record_string
+    return _encode_record(record_string, as_bytes)
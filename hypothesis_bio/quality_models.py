@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""Models of how [FASTQ](/api/fastq) quality (PHRED) scores are distributed along a read."""
+
+from math import exp
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .utilities import sampling_table
+
+__all__ = [
+    "MAX_PHRED_SCORE",
+    "QualityModel",
+    "uniform_quality",
+    "cycle_decay_quality",
+    "ILLUMINA_BINS",
+    "binned_illumina_quality",
+    "nanopore_quality",
+]
+
+MAX_PHRED_SCORE = 93
+"""Highest PHRED score a quality model may produce."""
+
+
+class QualityModel:
+    """A position-dependent distribution of quality scores.
+
+    A read is split into at most `resolution` equally long segments. For each segment,
+    `distribution(fraction, read_level)` gives the relative weights of the scores,
+    where `fraction` is the position of the middle of the segment along the read
+    (from 0 to 1), and `read_level` varies from read to read: it is the middle of one
+    of `read_levels` equal steps from 0 to 1, so it averages 0.5. Each distribution is
+    turned once into a table mapping random bytes onto scores, so a whole segment is
+    generated with a single `bytes.translate`. Zero bytes map to the most likely score.
+
+    Use the functions below, such as [`cycle_decay_quality`](#cycle_decay_quality), to
+    create the common models, or pass your own `distribution` function.
+
+    ### Arguments
+    - `distribution`: Function from `(fraction, read_level)` to a dictionary mapping scores to weights.
+    - `resolution`: Maximum number of segments a read is split into.
+    - `read_levels`: Number of distinct `read_level`s.
+    """
+
+    def __init__(
+        self,
+        distribution: Callable[[float, float], Dict[int, float]],
+        resolution: int = 20,
+        read_levels: int = 1,
+    ):
+        if resolution < 1 or read_levels < 1:
+            raise ValueError("resolution and read_levels must be positive")
+        self.distribution = distribution
+        self.resolution = resolution
+        self.read_levels = read_levels
+        self._tables = {}  # type: Dict[Tuple[int, int, int], bytes]
+        self._layouts = {}  # type: Dict[Tuple[int, int], List[Tuple[int, int, bytes]]]
+
+    def _table(self, segment: int, segments: int, level: int) -> bytes:
+        key = (segment, segments, level)
+        if key not in self._tables:
+            fraction = (segment + 0.5) / segments
+            read_level = (level + 0.5) / self.read_levels
+            weights = self.distribution(fraction, read_level)
+            self._tables[key] = _sampling_table(weights)
+        return self._tables[key]
+
+    def _layout(self, length: int, level: int) -> List[Tuple[int, int, bytes]]:
+        """Lists the `(start, end, table)` of every segment of a read."""
+        key = (length, level)
+        if key not in self._layouts:
+            if len(self._layouts) >= 4096:
+                self._layouts.clear()
+            segments = min(length, self.resolution)
+            bounds = [length * i // segments for i in range(segments + 1)]
+            self._layouts[key] = [
+                (bounds[i], bounds[i + 1], self._table(i, segments, level))
+                for i in range(segments)
+            ]
+        return self._layouts[key]
+
+    def scores(self, noise: bytes, level_noise: int = 0) -> bytes:
+        """Turns one random byte per position into that position's score.
+
+        `level_noise`, a separate random byte, picks the read level.
+        """
+        if not noise:
+            return b""
+        level = level_noise * self.read_levels // 256
+        return b"".join(
+            [
+                noise[start:end].translate(table)
+                for start, end, table in self._layout(len(noise), level)
+            ]
+        )
+
+
+def _sampling_table(weights: Dict[int, float]) -> bytes:
+    """Builds a table mapping the 256 byte values onto scores in proportion to their weight.
+
+    Zero bytes map to the most likely score.
+    """
+    weights = {
+        score: weight
+        for score, weight in weights.items()
+        if weight > 0 and 0 <= score <= MAX_PHRED_SCORE
+    }
+    if not weights:
+        raise ValueError("A quality distribution needs a positive weight in 0-93")
+    return sampling_table(
+        tuple(weights.get(score, 0) for score in range(max(weights) + 1))
+    )
+
+
+def _normal_weights(
+    mean: float, spread: float, low: int = 0, high: int = MAX_PHRED_SCORE
+) -> Dict[int, float]:
+    return {
+        score: exp(-(((score - mean) / spread) ** 2) / 2)
+        for score in range(low, high + 1)
+    }
+
+
+def uniform_quality(
+    min_score: int = 0, max_score: int = MAX_PHRED_SCORE
+) -> QualityModel:
+    """Draws every score in `[min_score, max_score]` equally often at every position.
+
+    ### Arguments
+    - `min_score`: Lowest quality score.
+    - `max_score`: Highest quality score.
+    """
+    weights = {score: 1.0 for score in range(min_score, max_score + 1)}
+    return QualityModel(lambda fraction, read_level: weights, resolution=1)
+
+
+def cycle_decay_quality(
+    start: float = 38, end: float = 25, spread: float = 3, max_score: int = 41
+) -> QualityModel:
+    """Models Illumina reads, whose quality falls off with every sequencing cycle.
+
+    The mean score falls from `start` at the first base to `end` at the last one,
+    faster towards the end of the read. Scores are normally distributed around it.
+
+    ### Arguments
+    - `start`: Mean score at the start of the read.
+    - `end`: Mean score at the end of the read.
+    - `spread`: Standard deviation of the scores around the mean.
+    - `max_score`: Highest quality score.
+    """
+
+    def distribution(fraction, read_level):
+        mean = start - (start - end) * fraction ** 2
+        return _normal_weights(mean, spread, high=max_score)
+
+    return QualityModel(distribution)
+
+
+ILLUMINA_BINS = [(0, 2), (3, 12), (15, 23), (31, 37)]
+"""Illumina's four quality score bins (RTA3) as `(lowest score, binned score)` pairs."""
+
+
+def binned_illumina_quality(
+    bins: Sequence[Tuple[int, int]] = ILLUMINA_BINS,
+    start: float = 38,
+    end: float = 25,
+    spread: float = 3,
+) -> QualityModel:
+    """Models binned Illumina quality scores, as written by NovaSeq and NextSeq instruments.
+
+    Scores follow [`cycle_decay_quality`](#cycle_decay_quality) and are then replaced by
+    the score of the bin they fall in.
+
+    ### Arguments
+    - `bins`: Sorted `(lowest score, binned score)` pairs. Defaults to `ILLUMINA_BINS`.
+    - `start`: Mean unbinned score at the start of the read.
+    - `end`: Mean unbinned score at the end of the read.
+    - `spread`: Standard deviation of the unbinned scores around the mean.
+    """
+    bins = sorted(bins)
+    if not bins or bins[0][0] > 0:
+        raise ValueError("The bins must start at score 0")
+
+    def distribution(fraction, read_level):
+        mean = start - (start - end) * fraction ** 2
+        binned = {}  # type: Dict[int, float]
+        for score, weight in _normal_weights(mean, spread).items():
+            value = [value for lowest, value in bins if lowest <= score][-1]
+            binned[value] = binned.get(value, 0) + weight
+        return binned
+
+    return QualityModel(distribution)
+
+
+def nanopore_quality(
+    mean: float = 12,
+    spread: float = 4,
+    read_spread: float = 4,
+    end_drop: float = 4,
+    max_score: int = 50,
+) -> QualityModel:
+    """Models Oxford Nanopore reads, whose quality varies more between reads than along them.
+
+    Each read gets its own mean score, up to `read_spread` away from `mean`; scores are
+    spread widely around it, and are lower over the first and last tenth of the read.
+
+    ### Arguments
+    - `mean`: Average mean score of a read.
+    - `spread`: Standard deviation of the scores within a read.
+    - `read_spread`: How far the mean score of a read may be from `mean`.
+    - `end_drop`: How much lower the mean score is at the very ends of the read.
+    - `max_score`: Highest quality score.
+    """
+
+    def distribution(fraction, read_level):
+        read_mean = mean + read_spread * (2 * read_level - 1)
+        edge = min(fraction, 1 - fraction)
+        if edge < 0.1:
+            read_mean -= end_drop * (1 - edge / 0.1)
+        return _normal_weights(read_mean, spread, high=max_score)
+
+    return QualityModel(distribution, read_levels=16)
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""Strategies for simulating sequencing reads from a reference, with known origins (like [wgsim](https://github.com/lh3/wgsim))."""
+
+from bisect import bisect_right
+from collections import namedtuple
+from itertools import accumulate
+from math import log
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import SearchStrategy, composite, randoms
+
+from .sequences import dna
+from .utilities import cigar_string, reverse_complement
+
+__all__ = ["SimulatedRead", "ReadSimulation", "simulated_reads"]
+
+SimulatedRead = namedtuple(
+    "SimulatedRead",
+    ["name", "sequence", "contig", "position", "end", "reverse", "cigar"],
+)
+SimulatedRead.__doc__ = """A simulated read and where it came from.
+
+- `name`: A read name encoding its origin, as `{contig}_{position + 1}_{end}_{+ or -}_{index}`.
+- `sequence`: The sequence of the read, errors included.
+- `contig`: The name of the reference sequence the read was taken from.
+- `position`: The 0-based position of the leftmost reference base the read covers.
+- `end`: The position just past the rightmost reference base the read covers.
+- `reverse`: Whether the read is from the reverse strand.
+- `cigar`: The CIGAR string aligning the read (reverse complemented if `reverse`) to `contig[position:end]`.
+"""
+
+ReadSimulation = namedtuple("ReadSimulation", ["reference", "reads"])
+ReadSimulation.__doc__ = """Reads simulated from a reference.
+
+- `reference`: Dictionary mapping contig names to the reference sequences.
+- `reads`: List of `SimulatedRead`s.
+"""
+
+_BASES = "ACGT"
+
+
+def _error_events(
+    rng, read_length: int, limit: int, rates: Tuple[float, float, float]
+) -> Tuple[List[Tuple[int, str, int]], int]:
+    """Decides where a read has errors, walking along the template it is read from.
+
+    Error-free stretches are skipped in one step by drawing their length from a
+    geometric distribution, so the cost is proportional to the number of errors.
+    Returns the `(template index, kind, value)` of every error and the number of
+    template bases the read covers, which is at most `limit`.
+    """
+    substitution_rate, insertion_rate, deletion_rate = rates
+    total = substitution_rate + insertion_rate + deletion_rate
+    events = []
+    length = 0
+    covered = 0
+    while True:
+        if total > 0:
+            gap = int(log(1 - rng.random()) / log(1 - total))
+        else:
+            gap = read_length
+        if length + gap >= read_length or covered + gap >= limit:
+            covered += min(read_length - length, limit - covered)
+            return events, covered
+        length += gap
+        covered += gap
+
+        kind = rng.random() * total
+        if kind < substitution_rate:
+            events.append((covered, "S", rng.randrange(1, 4)))
+            length += 1
+            covered += 1
+        elif kind < substitution_rate + insertion_rate:
+            events.append((covered, "I", rng.randrange(4)))
+            length += 1
+        elif length and covered + 1 < limit:
+            # a read may neither start nor end with a deletion
+            events.append((covered, "D", 0))
+            covered += 1
+
+
+def _apply_errors(
+    template: str, events: List[Tuple[int, str, int]]
+) -> Tuple[str, List[Tuple[int, str]]]:
+    """Applies error events to a template, returning the read and its CIGAR operations."""
+    pieces = []
+    operations = []
+    previous = 0
+    for index, kind, value in events:
+        pieces.append(template[previous:index])
+        operations.append((index - previous, "M"))
+        if kind == "S":
+            base = template[index].upper()
+            shift = _BASES.index(base) if base in _BASES else 0
+            pieces.append(_BASES[(shift + value) % 4])
+            operations.append((1, "M"))
+            previous = index + 1
+        elif kind == "I":
+            pieces.append(_BASES[value])
+            operations.append((1, "I"))
+            previous = index
+        else:
+            operations.append((1, "D"))
+            previous = index + 1
+    pieces.append(template[previous:])
+    operations.append((len(template) - previous, "M"))
+    return "".join(pieces), operations
+
+
+def _fragment(sequence, start: int, end: int) -> str:
+    """Slices a `str` or `bytes`-like reference, copying only the slice."""
+    if isinstance(sequence, str):
+        return sequence[start:end]
+    return bytes(memoryview(sequence)[start:end]).decode("ascii")
+
+
+@composite
+def simulated_reads(
+    draw,
+    reference: Optional[Union[str, Mapping[str, str]]] = None,
+    reference_source: Optional[SearchStrategy] = None,
+    read_length: int = 100,
+    coverage: float = 1.0,
+    num_reads: Optional[int] = None,
+    substitution_rate: float = 0.01,
+    insertion_rate: float = 0.001,
+    deletion_rate: float = 0.001,
+    allow_reverse: bool = True,
+) -> ReadSimulation:
+    """Generates sequencing reads sampled from a reference, together with their true origin.
+
+    Each read starts at a uniformly chosen position of the reference and is read from a
+    random strand, then gets substitution, insertion and deletion errors at the given
+    rates. Reads are only shorter than `read_length` if they run into the end of a
+    contig. The result is a `ReadSimulation` named tuple of the `reference` and a list
+    of `SimulatedRead`s, whose `position`, `end`, `reverse` and `cigar` give the truth
+    to test mappers, variant callers and coverage tools against.
+
+    Reads are sampled from a pseudo-random generator seeded by Hypothesis, so each one
+    costs time proportional to its length, whatever the size of the reference.
+
+    ### Arguments
+    - `reference`: The reference to sample reads from: a sequence, or a dictionary mapping contig names to sequences. Sequences may also be `bytes`-like, such as a `memoryview` of a memory-mapped file.
+    - `reference_source`: The search strategy to draw the reference from if `reference` is `None`. Defaults to uppercase, unambiguous [`dna`](/api/sequences#dna) of 1 to 10 read lengths.
+    - `read_length`: The length of the reads.
+    - `coverage`: The average number of reads covering each reference base. Decides the number of reads.
+    - `num_reads`: The number of reads to simulate, overriding `coverage`.
+    - `substitution_rate`: The probability of a substitution at each base.
+    - `insertion_rate`: The probability of an inserted base at each base.
+    - `deletion_rate`: The probability of a deleted base at each base.
+    - `allow_reverse`: Whether reads may come from the reverse strand.
+    """
+    rates = (substitution_rate, insertion_rate, deletion_rate)
+    if read_length < 1:
+        raise InvalidArgument("read_length={} must be positive".format(read_length))
+    if min(rates) < 0 or sum(rates) >= 1:
+        raise InvalidArgument(
+            "Error rates must not be negative and must sum to less than 1"
+        )
+
+    if reference is None:
+        if reference_source is None:
+            reference_source = dna(
+                allow_ambiguous=False,
+                allow_gaps=False,
+                uppercase_only=True,
+                min_size=read_length,
+                max_size=10 * read_length,
+                bulk=True,
+            )
+        reference = draw(reference_source)
+    if isinstance(reference, Mapping):
+        contigs = dict(reference)  # type: Dict[str, str]
+    else:
+        contigs = {"reference": reference}
+
+    # index the possible start positions so each read is placed with one bisection
+    names = [name for name in contigs if len(contigs[name]) >= read_length]
+    if not names:
+        raise ValueError(
+            "No reference sequence is at least read_length={} long".format(read_length)
+        )
+    starts = list(accumulate(len(contigs[name]) - read_length + 1 for name in names))
+    if num_reads is None:
+        total_length = sum(len(contigs[name]) for name in names)
+        num_reads = int(round(coverage * total_length / read_length))
+
+    rng = draw(randoms(use_true_random=True))
+    reads = []
+    for index in range(num_reads):
+        offset = rng.randrange(starts[-1])
+        contig_index = bisect_right(starts, offset)
+        name = names[contig_index]
+        sequence = contigs[name]
+        start = offset - (starts[contig_index - 1] if contig_index else 0)
+        reverse = allow_reverse and rng.random() < 0.5
+
+        if reverse:
+            # reverse reads are read leftwards from the end of their window
+            end = start + read_length
+            events, span = _error_events(rng, read_length, end, rates)
+            start = end - span
+            template = reverse_complement(_fragment(sequence, start, end))
+        else:
+            events, span = _error_events(rng, read_length, len(sequence) - start, rates)
+            end = start + span
+            template = _fragment(sequence, start, end)
+
+        read, operations = _apply_errors(template, events)
+        if reverse:
+            operations = operations[::-1]
+        reads.append(
+            SimulatedRead(
+                name="{}_{}_{}_{}_{}".format(
+                    name, start + 1, end, "-" if reverse else "+", index
+                ),
+                sequence=read,
+                contig=name,
+                position=start,
+                end=end,
+                reverse=reverse,
+                cigar=cigar_string(operations),
+            )
+        )
+
+    return ReadSimulation(reference=contigs, reads=reads)
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+
+"""Strategies for drawing sequences from reference genomes on disk, in [FASTA](https://en.wikipedia.org/wiki/FASTA_format) or [2bit](https://genome.ucsc.edu/FAQ/FAQformat.html#format7) format."""
+
+import mmap
+import os
+import re
+import struct
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from itertools import accumulate
+from typing import Dict, List, Tuple, Union
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import composite, integers
+
+__all__ = ["ReferencePool", "reference_pool", "reference_sequence"]
+
+_FastaRecord = namedtuple(
+    "_FastaRecord", ["name", "length", "offset", "line_bases", "line_width"]
+)
+_TwoBitRecord = namedtuple(
+    "_TwoBitRecord",
+    ["name", "length", "offset", "n_starts", "n_sizes", "mask_starts", "mask_sizes"],
+)
+
+_TWO_BIT_SIGNATURE = 0x1A412743
+# each byte of a 2bit file packs four bases, T=0, C=1, A=2 and G=3
+_TWO_BIT_BYTES = [
+    "".join("TCAG"[(byte >> shift) & 3] for shift in (6, 4, 2, 0)).encode("ascii")
+    for byte in range(256)
+]
+
+
+class ReferencePool:
+    """A memory-mapped FASTA or 2bit file with an index of its records.
+
+    The file is indexed once, when the pool is created: for FASTA files like
+    `samtools faidx`, which requires every line of a record but the last to be equally
+    long. Substrings are then read straight from the memory map, so files far larger
+    than memory can be used. Create pools with [`reference_pool`](#reference_pool),
+    which keeps one for each of the files used most recently.
+
+    Pools are closed when they are garbage collected. To close one earlier, call
+    `close()` or use it as a context manager; `reference_pool` then opens the file
+    again the next time it is asked for it. A pool cannot be closed while views
+    returned by `fetch` are still alive.
+
+    ### Arguments
+    - `path`: The path of the FASTA or 2bit file.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._closed = False
+        self._long_records = {}  # type: Dict[int, Tuple[List[int], List[int]]]
+
+        if self._map[:4] in (
+            struct.pack("<I", _TWO_BIT_SIGNATURE),
+            struct.pack(">I", _TWO_BIT_SIGNATURE),
+        ):
+            self.records = self._index_two_bit()
+        else:
+            self.records = self._index_fasta()
+        if not self.records:
+            raise ValueError("{} contains no sequences".format(self.path))
+
+        self.names = [record.name for record in self.records]
+        self.ends = list(accumulate(record.length for record in self.records))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the memory map has been closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Closes the memory map and the file.
+
+        Views returned by `fetch` must be released first: while any is alive, this
+        raises `BufferError` and the pool stays open.
+        """
+        if self._closed:
+            return
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            self._view = memoryview(self._map)
+            raise
+        self._closed = True
+
+    def __enter__(self) -> "ReferencePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _index_fasta(self) -> List[_FastaRecord]:
+        records = []
+        data = self._map
+        if data[:1] == b">":
+            header = 0
+        else:
+            header = data.find(b"\n>")
+            header = header + 1 if header >= 0 else -1
+        while header >= 0:
+            header_end = data.find(b"\n", header)
+            if header_end < 0:
+                header_end = len(data)
+            fields = bytes(data[header + 1 : header_end]).decode().split()
+            if not fields:
+                raise ValueError(
+                    "A record in {} has a header without a name".format(self.path)
+                )
+            name = fields[0]
+            offset = header_end + 1
+            next_header = data.find(b"\n>", header_end)
+            end = len(data) if next_header < 0 else next_header + 1
+
+            # trailing line endings are not part of the sequence
+            sequence_end = end
+            while sequence_end > offset and data[sequence_end - 1] in b"\r\n":
+                sequence_end -= 1
+
+            first_line_end = data.find(b"\n", offset, end)
+            if first_line_end < 0 or first_line_end >= sequence_end:
+                line_bases = line_width = sequence_end - offset
+                line_ending = b""
+            else:
+                line_ending = b"\r\n" if data[first_line_end - 1] == 13 else b"\n"
+                line_bases = first_line_end + 1 - offset - len(line_ending)
+                line_width = line_bases + len(line_ending)
+                layout = re.compile(
+                    rb"(?:[^\r\n>]{%d}%s)*[^\r\n>]{0,%d}"
+                    % (line_bases, re.escape(line_ending), line_bases)
+                )
+                if not layout.fullmatch(data, offset, sequence_end):
+                    raise ValueError(
+                        "Lines of {} in {} are not all equally long".format(
+                            name, self.path
+                        )
+                    )
+
+            raw_length = sequence_end - offset
+            full_lines, rest = divmod(raw_length, line_width) if line_width else (0, 0)
+            records.append(
+                _FastaRecord(
+                    name=name,
+                    length=full_lines * line_bases + rest,
+                    offset=offset,
+                    line_bases=line_bases,
+                    line_width=line_width,
+                )
+            )
+            header = next_header + 1 if next_header >= 0 else -1
+        return records
+
+    def _index_two_bit(self) -> List[_TwoBitRecord]:
+        data = self._map
+        endian = "<" if data[:4] == struct.pack("<I", _TWO_BIT_SIGNATURE) else ">"
+        version, count = struct.unpack_from(endian + "II", data, 4)
+        offset_format = endian + ("Q" if version == 1 else "I")
+
+        records = []
+        position = 16
+        for i in range(count):
+            name_size = data[position]
+            name = bytes(data[position + 1 : position + 1 + name_size]).decode()
+            position += 1 + name_size
+            (offset,) = struct.unpack_from(offset_format, data, position)
+            position += struct.calcsize(offset_format)
+
+            length, n_count = struct.unpack_from(endian + "II", data, offset)
+            offset += 8
+            n_starts = struct.unpack_from(endian + "%dI" % n_count, data, offset)
+            n_sizes = struct.unpack_from(
+                endian + "%dI" % n_count, data, offset + 4 * n_count
+            )
+            offset += 8 * n_count
+            (mask_count,) = struct.unpack_from(endian + "I", data, offset)
+            offset += 4
+            mask_starts = struct.unpack_from(endian + "%dI" % mask_count, data, offset)
+            mask_sizes = struct.unpack_from(
+                endian + "%dI" % mask_count, data, offset + 4 * mask_count
+            )
+            offset += 8 * mask_count + 4  # skipping the reserved field
+
+            records.append(
+                _TwoBitRecord(
+                    name=name,
+                    length=length,
+                    offset=offset,
+                    n_starts=n_starts,
+                    n_sizes=n_sizes,
+                    mask_starts=mask_starts,
+                    mask_sizes=mask_sizes,
+                )
+            )
+        return records
+
+    def long_records(self, min_size: int) -> Tuple[List[int], List[int]]:
+        """Returns the indexes of the records at least `min_size` bases long, and the
+        running totals of their lengths."""
+        if min_size not in self._long_records:
+            indexes = [
+                i for i, record in enumerate(self.records) if record.length >= min_size
+            ]
+            ends = list(accumulate(self.records[i].length for i in indexes))
+            self._long_records[min_size] = (indexes, ends)
+        return self._long_records[min_size]
+
+    def fetch(self, index: int, start: int, end: int) -> memoryview:
+        """Returns bases `start` to `end` of the `index`-th record.
+
+        Substrings of a FASTA record that lie on a single line are views of the memory
+        map and are not copied. Other substrings are copied once.
+        """
+        if self.closed:
+            raise ValueError("The pool of {} is closed".format(self.path))
+        record = self.records[index]
+        start = max(0, start)
+        end = min(end, record.length)
+        if end <= start:
+            return memoryview(b"")
+        if isinstance(record, _TwoBitRecord):
+            return memoryview(self._fetch_two_bit(record, start, end))
+
+        line, column = divmod(start, record.line_bases)
+        first = record.offset + line * record.line_width + column
+        if column + end - start <= record.line_bases:
+            return self._view[first : first + end - start]
+        line, column = divmod(end, record.line_bases)
+        last = record.offset + line * record.line_width + column
+        return memoryview(self._map[first:last].translate(None, b"\r\n"))
+
+    def _fetch_two_bit(self, record: _TwoBitRecord, start: int, end: int) -> bytes:
+        packed = self._map[record.offset + start // 4 : record.offset + (end + 3) // 4]
+        bases = b"".join([_TWO_BIT_BYTES[byte] for byte in packed])
+        bases = bytearray(bases[start % 4 : start % 4 + end - start])
+
+        # runs of N and soft-masked (lowercase) runs are stored separately
+        for starts, sizes, masked in (
+            (record.n_starts, record.n_sizes, False),
+            (record.mask_starts, record.mask_sizes, True),
+        ):
+            block = max(0, bisect_right(starts, start) - 1)
+            while block < len(starts) and starts[block] < end:
+                block_start = max(starts[block], start) - start
+                block_end = min(starts[block] + sizes[block], end) - start
+                if block_end > block_start:
+                    if masked:
+                        bases[block_start:block_end] = bases[
+                            block_start:block_end
+                        ].lower()
+                    else:
+                        bases[block_start:block_end] = b"N" * (block_end - block_start)
+                block += 1
+        return bytes(bases)
+
+
+_POOL_CACHE_SIZE = 8
+_pools = OrderedDict()  # type: OrderedDict
+
+
+def reference_pool(path: Union[str, os.PathLike]) -> ReferencePool:
+    """Opens and indexes a FASTA or 2bit file, reusing the pool for files already opened.
+
+    The pools of the 8 most recently used files are kept open. A pool that has been
+    closed is replaced by a new one.
+
+    ### Arguments
+    - `path`: The path of the FASTA or 2bit file.
+    """
+    path = os.path.realpath(os.fspath(path))
+    key = (path, os.stat(path).st_mtime_ns)
+    pool = _pools.pop(key, None)
+    if pool is None or pool.closed:
+        pool = ReferencePool(path)
+    _pools[key] = pool
+    while len(_pools) > _POOL_CACHE_SIZE:
+        _pools.popitem(last=False)
+    return pool
+
+
+@composite
+def reference_sequence(
+    draw,
+    reference: Union[str, os.PathLike, ReferencePool],
+    min_size: int = 1,
+    max_size: int = 100,
+) -> memoryview:
+    """Generates substrings of a reference genome stored in a local FASTA or 2bit file.
+
+    Substrings start at a uniformly chosen position of the records at least `min_size`
+    bases long. They are
+    `memoryview`s into the memory-mapped file where possible, so even multi-gigabyte
+    references are never loaded into Python strings. Use them as the `sequence_source`
+    of [`fasta_entry`](/api/fasta#fasta_entry) or [`fastq_entry`](/api/fastq#fastq_entry).
+
+    ### Arguments
+    - `reference`: The path of the FASTA or 2bit file, or a [`ReferencePool`](#referencepool).
+    - `min_size`: The shortest substring to generate.
+    - `max_size`: The longest substring to generate. Records shorter than that give shorter substrings.
+
+    ::: tip Tip
+    FASTA files must be laid out like `samtools faidx` requires: every line of a record but the last one equally long.
+    :::
+    """
+    if not isinstance(reference, ReferencePool):
+        reference = reference_pool(reference)
+    if max_size < min_size:
+        raise InvalidArgument(
+            "Cannot have max_size={} < min_size={}".format(max_size, min_size)
+        )
+    indexes, ends = reference.long_records(min_size)
+    if not indexes:
+        raise InvalidArgument(
+            "Cannot have min_size={} when the longest record of {} has {} bases".format(
+                min_size,
+                reference.path,
+                max(record.length for record in reference.records),
+            )
+        )
+
+    size = draw(integers(min_value=min_size, max_value=max_size))
+    position = draw(integers(min_value=0, max_value=ends[-1] - 1))
+    i = bisect_right(ends, position)
+    index = indexes[i]
+    length = reference.records[index].length
+    start = position - (ends[i - 1] if i else 0)
+
+    # keep the substring inside its record, which is at least min_size bases long
+    start = max(0, min(start, length - size))
+    return reference.fetch(index, start, start + size)
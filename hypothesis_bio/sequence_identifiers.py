@@ -2,10 +2,14 @@
 
 """Strategies for generating sequence identifiers for biological data formats such as [FASTA](/api/fasta) and [FASTQ](/api/fastq)."""
 
-from typing import Optional, Sequence
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+from uuid import UUID
 
-from hypothesis import assume
+from hypothesis.errors import InvalidArgument
 from hypothesis.strategies import (
+    binary,
+    booleans,
     characters,
     composite,
     datetimes,
@@ -44,15 +48,48 @@ def sequence_identifier(
     )
 
 
+def _illumina_identifier(
+    instrument: str,
+    run_number: int,
+    flowcell_id: str,
+    lane: int,
+    tile: int,
+    x_pos: int,
+    y_pos: int,
+    umi: str,
+    read_num,
+    is_filtered: str,
+    control_num: int,
+    index: str,
+) -> str:
+    """Lays out the fields of a Casava 1.8 identifier."""
+    return "{}:{}:{}:{}:{}:{}:{}:{} {}:{}:{}:{}".format(
+        instrument,
+        run_number,
+        flowcell_id,
+        lane,
+        tile,
+        x_pos,
+        y_pos,
+        umi,
+        read_num,
+        is_filtered,
+        control_num,
+        index,
+    )
+
+
 @composite
-def illumina_sequence_identifier(draw) -> str:
+def illumina_sequence_identifier(draw, read_num: Optional[int] = None) -> str:
     """Generates Illumina-style sequence identifiers.
 
+    ### Arguments
+    - `read_num`: The member of a read pair (`1` or `2`) the read is. If `None`, either is used.
+
     ::: tip Note
     Specifications taken from Specifications taken from [here](https://support.illumina.com/help/BaseSpace_Sequence_Hub/Source/Informatics/BS/FileFormat_FASTQ-files_swBS.htm)
     :::
     """
-    delim = ":"
     instrument = draw(from_regex(r"[a-zA-Z0-9_]+", fullmatch=True))
     run_number = draw(integers(min_value=0))
     flowcell_id = draw(from_regex(r"[a-zA-Z0-9]+", fullmatch=True))
@@ -61,36 +98,138 @@ def illumina_sequence_identifier(draw) -> str:
     x_pos = draw(integers(min_value=0))
     y_pos = draw(integers(min_value=0))
     umi = draw(from_regex(r"[ACGTN]+\+[ACGTN]+", fullmatch=True))
-    read_num = draw(from_regex(r"[12]", fullmatch=True))
+    if read_num is None:
+        read_num = draw(from_regex(r"[12]", fullmatch=True))
     is_filtered = draw(from_regex(r"[YN]", fullmatch=True))
-    control_num = draw(integers(min_value=0))
-    assume(control_num % 2 == 0)  # control_num must be 0 or even
+    # control_num must be 0 or even, so draw half of it
+    control_num = 2 * draw(integers(min_value=0))
     index = draw(from_regex(r"[ACGTN]+", fullmatch=True))
 
-    return (
-        "{instrument}{delim}{run_number}{delim}{flowcell_id}{delim}{lane}{delim}"
-        "{tile}{delim}{x_pos}{delim}{y_pos}{delim}{umi} {read_num}{delim}"
-        "{is_filtered}{delim}{control_num}{delim}{index}"
-    ).format(
-        instrument=instrument,
-        delim=delim,
-        run_number=run_number,
-        flowcell_id=flowcell_id,
-        lane=lane,
-        tile=tile,
-        x_pos=x_pos,
-        y_pos=y_pos,
-        umi=umi,
-        read_num=read_num,
-        is_filtered=is_filtered,
-        control_num=control_num,
-        index=index,
+    return _illumina_identifier(
+        instrument,
+        run_number,
+        flowcell_id,
+        lane,
+        tile,
+        x_pos,
+        y_pos,
+        umi,
+        read_num,
+        is_filtered,
+        control_num,
+        index,
     )
 
 
 @composite
-def nanopore_sequence_identifier(draw) -> str:
+def illumina_run_identifiers(
+    draw,
+    min_size: int = 1,
+    max_size: int = 100,
+    read_num: Optional[int] = None,
+    max_step: int = 1000,
+) -> List[str]:
+    """Generates the Illumina-style identifiers of all reads in one run, in sorted order.
+
+    The instrument, run number, flowcell ID, lane, read number and index are drawn
+    once and shared by every read, like in the output of a single sequencing run.
+    Each read then moves forward from the previous one: either to a later tile, or
+    further along the same tile, so `(tile, x, y)` strictly increases through the
+    list. Only the position steps, UMI, filter flag and control number are drawn
+    per read.
+
+    ### Arguments
+    - `min_size`: The fewest identifiers to generate.
+    - `max_size`: The most identifiers to generate.
+    - `read_num`: The member of a read pair (`1` or `2`) the reads are. If `None`, either is used.
+    - `max_step`: The furthest a read's tile, x or y position moves from the previous read's.
+
+    ::: tip Tip
+    Use [`fastq`](/api/fastq#fastq) with `illumina_run=True` to generate a FASTQ file with these identifiers.
+    :::
+    """
+    if max_step < 1:
+        raise InvalidArgument("max_step={} must be positive".format(max_step))
+
+    instrument = draw(from_regex(r"[a-zA-Z0-9_]+", fullmatch=True))
+    run_number = draw(integers(min_value=0))
+    flowcell_id = draw(from_regex(r"[a-zA-Z0-9]+", fullmatch=True))
+    lane = draw(integers(min_value=0))
+    if read_num is None:
+        read_num = draw(from_regex(r"[12]", fullmatch=True))
+    index = draw(from_regex(r"[ACGTN]+", fullmatch=True))
+    tile = draw(integers(min_value=0))
+    x_pos = draw(integers(min_value=0, max_value=max_step))
+    y_pos = draw(integers(min_value=0, max_value=max_step))
+
+    num_reads = draw(integers(min_value=min_size, max_value=max_size))
+    identifiers = []
+    for i in range(num_reads):
+        if i:
+            if draw(booleans()):
+                tile += draw(integers(min_value=1, max_value=max_step))
+                x_pos = draw(integers(min_value=0, max_value=max_step))
+                y_pos = draw(integers(min_value=0, max_value=max_step))
+            else:
+                x_pos += draw(integers(min_value=0, max_value=max_step))
+                y_pos += draw(integers(min_value=1, max_value=max_step))
+        identifiers.append(
+            _illumina_identifier(
+                instrument,
+                run_number,
+                flowcell_id,
+                lane,
+                tile,
+                x_pos,
+                y_pos,
+                draw(from_regex(r"[ACGTN]+\+[ACGTN]+", fullmatch=True)),
+                read_num,
+                draw(from_regex(r"[YN]", fullmatch=True)),
+                2 * draw(integers(min_value=0)),
+                index,
+            )
+        )
+    return identifiers
+
+
+def _nanopore_identifier(
+    read_id: str,
+    run_id: str,
+    sample_id: str,
+    read_num: int,
+    channel: int,
+    start_time: datetime,
+) -> str:
+    """Lays out the fields of a Guppy-style identifier."""
+    return "{} runid={} sampleid={} read={} ch={} start_time={}".format(
+        read_id,
+        run_id,
+        sample_id,
+        read_num,
+        channel,
+        start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    )
+
+
+@composite
+def nanopore_read_id(draw) -> str:
+    """Generates Nanopore read IDs, formatting 16 raw bytes as a UUID."""
+    return str(UUID(bytes=draw(binary(min_size=16, max_size=16))))
+
+
+@composite
+def nanopore_run_id(draw) -> str:
+    """Generates 40 character hexadecimal Nanopore run IDs from 20 raw bytes."""
+    return draw(binary(min_size=20, max_size=20)).hex()
+
+
+@composite
+def nanopore_sequence_identifier(draw, run_id: Optional[str] = None) -> str:
     """Generates Nanopore-style sequence identifiers.
+
+    ### Arguments
+    - `run_id`: The run ID of the read. If `None`, one is drawn with [`nanopore_run_id`](#nanopore_run_id).
+
     ::: tip Note
     No formal specifications could be found, this strategy is based off a header produced from `Guppy` v2.1.3:
 
@@ -98,27 +237,60 @@ def nanopore_sequence_identifier(draw) -> str:
 
     :::
     """
-    read_id = draw(
-        from_regex(
-            r"[a-zA-Z0-9]{8}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{12}",
-            fullmatch=True,
-        )
-    )
-    run_id = draw(from_regex(r"[a-zA-Z0-9]{40}", fullmatch=True))
+    read_id = draw(nanopore_read_id())
+    if run_id is None:
+        run_id = draw(nanopore_run_id())
     sample_id = draw(from_regex(r"[!-~]+", fullmatch=True))
     read_num = draw(integers(min_value=0))
     channel = draw(integers(min_value=0))
-    date_time = draw(datetimes())
-    start_time = date_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    return (
-        "{read_id} runid={run_id} sampleid={sample_id} read={read_num} "
-        "ch={channel} start_time={start_time}"
-    ).format(
-        read_id=read_id,
-        run_id=run_id,
-        sample_id=sample_id,
-        read_num=read_num,
-        channel=channel,
-        start_time=start_time,
+    start_time = draw(datetimes())
+
+    return _nanopore_identifier(
+        read_id, run_id, sample_id, read_num, channel, start_time
     )
+
+
+@composite
+def nanopore_run_identifiers(
+    draw, min_size: int = 1, max_size: int = 100, max_channel: int = 512
+) -> List[str]:
+    """Generates the Nanopore-style identifiers of all reads in one run.
+
+    The run ID and sample ID are drawn once and shared by every read. Read IDs are
+    drawn per read from raw bytes, and read numbers and start times increase through
+    the list, like in the output of a single run.
+
+    ### Arguments
+    - `min_size`: The fewest identifiers to generate.
+    - `max_size`: The most identifiers to generate.
+    - `max_channel`: The highest channel number, `512` for a MinION flow cell.
+
+    ::: tip Tip
+    Use [`nanopore_fastq`](/api/fastq#nanopore_fastq) to generate a long-read FASTQ file with these identifiers.
+    :::
+    """
+    if max_channel < 1:
+        raise InvalidArgument("max_channel={} must be positive".format(max_channel))
+
+    run_id = draw(nanopore_run_id())
+    sample_id = draw(from_regex(r"[!-~]+", fullmatch=True))
+    read_num = draw(integers(min_value=0))
+    start_time = draw(datetimes(max_value=datetime(9000, 1, 1)))
+
+    num_reads = draw(integers(min_value=min_size, max_value=max_size))
+    identifiers = []
+    for i in range(num_reads):
+        if i:
+            read_num += draw(integers(min_value=1, max_value=1000))
+            start_time += timedelta(seconds=draw(integers(min_value=0, max_value=60)))
+        identifiers.append(
+            _nanopore_identifier(
+                draw(nanopore_read_id()),
+                run_id,
+                sample_id,
+                read_num,
+                draw(integers(min_value=1, max_value=max_channel)),
+                start_time,
+            )
+        )
+    return identifiers
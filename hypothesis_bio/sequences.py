@@ -2,20 +2,100 @@
 
 """Strategies for generating biological sequences."""
 
-from typing import Optional
-
-from hypothesis import assume
-from hypothesis.strategies import composite, integers, sampled_from, text
+import sys
+from array import array
+from collections import deque
+from functools import lru_cache
+from itertools import cycle, islice, product
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import (
+    booleans,
+    composite,
+    integers,
+    lists,
+    randoms,
+    sampled_from,
+    text,
+    tuples,
+)
 
+from .codon_tables import codon_table
 from .utilities import (
+    BULK_BLOCK_SIZE,
     ambiguous_start_codons,
     ambiguous_stop_codons,
+    bulk_bytes,
     protein_1to3,
+    reverse_complement,
+    sampling_table,
     start_codons,
     stop_codons,
+    swissprot_aa_frequencies,
+    translate_uniform,
+    translation_table,
+    weighted_choices,
 )
 
 
+@composite
+def _bulk_sequence(draw, alphabet: str, min_size=0, max_size: Optional[int] = None):
+    """Generates sequences over `alphabet` by translating a block of raw bytes."""
+    block = draw(bulk_bytes(min_size=min_size, max_size=max_size))
+    return translate_uniform(block, alphabet).decode("ascii")
+
+
+@composite
+def _weighted_sequence(
+    draw,
+    alphabet: str,
+    weights: Tuple[float, ...],
+    min_size=0,
+    max_size: Optional[int] = None,
+):
+    """Generates sequences over `alphabet` whose characters occur in proportion to `weights`."""
+    if max_size is None:
+        max_size = min_size + BULK_BLOCK_SIZE
+    size = draw(integers(min_value=min_size, max_value=max_size))
+    noise = draw(bulk_bytes(min_size=2 * size, max_size=2 * size))
+    indices = weighted_choices(noise, sampling_table(weights, bits=16))
+    return indices.translate(translation_table(alphabet)).decode("ascii")
+
+
+def _gc_weights(alphabet: str, gc_content: float) -> Tuple[float, ...]:
+    """Weighs `alphabet` so that `gc_content` of its unambiguous bases are G or C.
+
+    Unambiguous bases keep their combined share of the alphabet, and every other
+    character (ambiguity codes and gaps) keeps its own share.
+    """
+    if not 0 <= gc_content <= 1:
+        raise InvalidArgument(
+            "gc_content={} must be between 0 and 1".format(gc_content)
+        )
+    strong = [char for char in alphabet if char in "GCgc"]
+    weak = [char for char in alphabet if char in "ATUatu"]
+    share = len(strong) + len(weak)
+    weights = []
+    for char in alphabet:
+        if char in strong:
+            weights.append(gc_content * share / len(strong))
+        elif char in weak:
+            weights.append((1 - gc_content) * share / len(weak))
+        else:
+            weights.append(1.0)
+    return tuple(weights)
+
+
+def _dna_alphabet(allow_ambiguous=True, allow_gaps=True, uppercase_only=False) -> str:
+    """Decides the character list [`dna`](#dna) uses."""
+    chars = "ATGC" if not allow_ambiguous else "ACGTNUKSYMWRBDHV"
+    if not uppercase_only:
+        chars += chars.lower()
+    chars += "-" if allow_gaps else ""
+    return chars
+
+
 @composite
 def dna(
     draw,
@@ -24,6 +104,8 @@ def dna(
     uppercase_only=False,
     min_size=0,
     max_size: Optional[int] = None,
+    bulk=False,
+    gc_content: Optional[float] = None,
 ):
     """Generates DNA sequences.
 
@@ -33,14 +115,17 @@ def dna(
     - `uppercase_only`: Whether to use only uppercase characters.
     - `min_size`: The shortest DNA sequence to generate.
     - `max_size`: The longest DNA sequence to generate.
+    - `bulk`: Whether to translate a block of raw bytes instead of drawing one character at a time. Much faster for long sequences, but without a `max_size` at most `min_size + 64` characters are generated.
+    - `gc_content`: The expected fraction of G and C among the A, C, G and T (or U) bases. If `None`, all characters are equally likely. Like `bulk`, generates from a block of raw bytes.
     """
 
-    # decide the character list to use
-    chars = "ATGC" if not allow_ambiguous else "ACGTNUKSYMWRBDHV"
-    if not uppercase_only:
-        chars += chars.lower()
-    chars += "-" if allow_gaps else ""
+    chars = _dna_alphabet(allow_ambiguous, allow_gaps, uppercase_only)
 
+    if gc_content is not None:
+        weights = _gc_weights(chars, gc_content)
+        return draw(_weighted_sequence(chars, weights, min_size, max_size))
+    if bulk:
+        return draw(_bulk_sequence(chars, min_size=min_size, max_size=max_size))
     return draw(text(alphabet=chars, min_size=min_size, max_size=max_size))
 
 
@@ -52,6 +137,8 @@ def rna(
     allow_lowercase=True,
     min_size=0,
     max_size: Optional[int] = None,
+    bulk=False,
+    gc_content: Optional[float] = None,
 ):
     """Generates RNA sequences.
 
@@ -61,6 +148,8 @@ def rna(
     - `allow_lowercase`: Whether lowercase characters should be used.
     - `min_size`: The shortest RNA sequence to generate
     - `max_size`: The longest RNA sequence to generate
+    - `bulk`: Whether to translate a block of raw bytes instead of drawing one character at a time. Much faster for long sequences, but without a `max_size` at most `min_size + 64` characters are generated.
+    - `gc_content`: The expected fraction of G and C among the A, C, G and U (or T) bases. If `None`, all characters are equally likely. Like `bulk`, generates from a block of raw bytes.
     """
 
     chars = "AUCG" if not allow_ambiguous else "AUCGNTWSMKRYBDHV"
@@ -68,9 +157,24 @@ def rna(
         chars += chars.lower()
     chars += "-" if allow_gaps else ""
 
+    if gc_content is not None:
+        weights = _gc_weights(chars, gc_content)
+        return draw(_weighted_sequence(chars, weights, min_size, max_size))
+    if bulk:
+        return draw(_bulk_sequence(chars, min_size=min_size, max_size=max_size))
     return draw(text(alphabet=chars, min_size=min_size, max_size=max_size))
 
 
+@lru_cache(maxsize=None)
+def _three_letter_table(uppercase_only: bool, separator: str = "") -> Dict[int, str]:
+    """Maps 1-letter amino acids, in either case, to their 3-letter abbreviation and a separator."""
+    table = {}
+    for one, three in protein_1to3.items():
+        three = (three.upper() if uppercase_only else three) + separator
+        table[ord(one)] = table[ord(one.lower())] = three
+    return table
+
+
 @composite
 def protein(
     draw,
@@ -80,6 +184,8 @@ def protein(
     uppercase_only=False,
     min_size=0,
     max_size: Optional[int] = None,
+    aa_frequencies: Optional[Mapping[str, float]] = None,
+    separator: str = "",
 ):
     """Generates protein sequences.
 
@@ -94,6 +200,8 @@ def protein(
     - `uppercase_only`: Whether to restrict the protein sequence to uppercase characters.
     - `min_size`: The shortest protein sequence to generate.
     - `max_size`: The longest protein sequence to generate.
+    - `aa_frequencies`: Relative frequencies of the one-letter amino acids, such as `swissprot_aa_frequencies` for proteome-like composition. Amino acids that are left out do not occur. Generates from a block of raw bytes, so without a `max_size` at most `min_size + 64` amino acids are generated.
+    - `separator`: The string to put between 3-letter abbreviations, such as `"-"` for `Met-Ala-...`. Ignored for 1-letter sequences.
     """
     chars = "ACDEFGHIKLMNPQRSTVWY"
     if allow_ambiguous:
@@ -102,36 +210,74 @@ def protein(
         chars += "BJOUZ"
     if not uppercase_only:
         chars += chars.lower()
-    sequence = draw(text(alphabet=chars, min_size=min_size, max_size=max_size))
+
+    if aa_frequencies is not None:
+        cases = 1 if uppercase_only else 2
+        weights = tuple(aa_frequencies.get(char.upper(), 0) / cases for char in chars)
+        if not any(weights):
+            raise InvalidArgument("aa_frequencies must give some amino acid a weight")
+        sequence = draw(_weighted_sequence(chars, weights, min_size, max_size))
+    else:
+        sequence = draw(text(alphabet=chars, min_size=min_size, max_size=max_size))
     if single_letter_protein:
         return sequence
-    else:
-        sequence_3 = ""
-        for s in sequence:
-            sequence_3 += protein_1to3[s.upper()]
-        return sequence_3.upper() if uppercase_only else sequence_3
+    # every abbreviation is followed by the separator, so drop the last one
+    sequence_3 = sequence.translate(_three_letter_table(uppercase_only, separator))
+    return sequence_3[: len(sequence_3) - len(separator)] if sequence else ""
+
+
+def _start_codons(allow_ambiguous=True, table: Optional[int] = None):
+    if table is None:
+        return ambiguous_start_codons if allow_ambiguous else start_codons
+    return codon_table(table, allow_ambiguous=allow_ambiguous).start_codons
+
+
+def _stop_codons(allow_ambiguous=True, table: Optional[int] = None):
+    if table is None:
+        return ambiguous_stop_codons if allow_ambiguous else stop_codons
+    return codon_table(table, allow_ambiguous=allow_ambiguous).stop_codons
 
 
 @composite
-def start_codon(draw, allow_ambiguous=True) -> str:
+def start_codon(draw, allow_ambiguous=True, table: Optional[int] = None) -> str:
     """Generates [start codons](https://en.wikipedia.org/wiki/Start_codon).
 
     ### Arguments
     - `allow_ambiguous`: Whether ambiguous bases are permitted.
+    - `table`: The [NCBI translation table](/api/codon_tables) to take start codons from. If `None`, start codons of any table are used.
     """
-    return draw(
-        sampled_from(ambiguous_start_codons if allow_ambiguous else start_codons)
-    )
+    return draw(sampled_from(_start_codons(allow_ambiguous, table)))
 
 
 @composite
-def stop_codon(draw, allow_ambiguous=True) -> str:
+def stop_codon(draw, allow_ambiguous=True, table: Optional[int] = None) -> str:
     """Generates [stop codons](https://en.wikipedia.org/wiki/Stop_codon).
 
     ### Arguments
     - `allow_ambiguous`: Whether ambiguous bases are permitted.
+    - `table`: The [NCBI translation table](/api/codon_tables) to take stop codons from. If `None`, stop codons of any table are used.
     """
-    return draw(sampled_from(ambiguous_stop_codons if allow_ambiguous else stop_codons))
+    return draw(sampled_from(_stop_codons(allow_ambiguous, table)))
+
+
+@lru_cache(maxsize=None)
+def _codons(
+    allow_ambiguous=True,
+    uppercase_only=False,
+    allow_stop_codons=True,
+    table: Optional[int] = None,
+):
+    """Lists every codon over the [`dna`](#dna) alphabet, optionally without stop codons."""
+    chars = "ATGC" if not allow_ambiguous else "ACGTNUKSYMWRBDHV"
+    if not uppercase_only:
+        chars += chars.lower()
+    excluded = set(_stop_codons(allow_ambiguous, table))
+
+    return [
+        "".join(codon)
+        for codon in product(chars, repeat=3)
+        if allow_stop_codons or "".join(codon).upper().replace("U", "T") not in excluded
+    ]
 
 
 @composite
@@ -144,6 +290,7 @@ def cds(
     uppercase_only=False,
     min_size=0,
     max_size=None,
+    table: Optional[int] = None,
 ) -> str:
     """Generates [coding DNA sequences](https://en.wikipedia.org/wiki/Coding_region) (CDSs).
 
@@ -155,6 +302,11 @@ def cds(
     - `uppercase_only`: Whether to use only uppercase characters.
     - `min_size`: The shortest CDS to generate in base pairs.
     - `max_size`: The longest CDS to generate in base pairs.
+    - `table`: The [NCBI translation table](/api/codon_tables) whose start and stop codons to use. If `None`, start and stop codons of any table are used.
+
+    ::: tip Tip
+    Use [`translate`](/api/codon_tables#translate) with the same `table` to get the protein a CDS encodes.
+    :::
     """
 
     # ensure that what we're trying to do is even possible
@@ -165,49 +317,39 @@ def cds(
         min_possible_size += 3
     if max_size is not None and max_size < min_possible_size:
         raise ValueError("Sequence is to short to include start/stop codons.")
+    if max_size is not None and max_size < min_size:
+        raise InvalidArgument(
+            "Cannot have max_size={} < min_size={}".format(max_size, min_size)
+        )
 
-    # first, create the main DNA sequence
-    if include_start_codon:
-        min_size -= 3
-        if max_size is not None:
-            max_size -= 3
-    if include_stop_codon:
-        min_size -= 3
-        if max_size is not None:
-            max_size -= 3
-
-    # make sure that the sizes are not negative
-    min_size = max(0, min_size)
-    if max_size is not None:
-        max_size = max(0, max_size)
-
-    sequence = draw(
-        dna(
-            allow_ambiguous=allow_ambiguous,
-            allow_gaps=False,
-            uppercase_only=uppercase_only,
-            min_size=min_size,
-            max_size=max_size,
+    # the start/stop codons are drawn separately, so only size the body
+    min_codons = -(-max(0, min_size - min_possible_size) // 3)
+    max_codons = None if max_size is None else (max_size - min_possible_size) // 3
+
+    if max_codons is not None and max_codons < min_codons:
+        raise InvalidArgument(
+            "No whole number of codons fits between min_size={} and max_size={}".format(
+                min_size, max_size
+            )
         )
-    )
-    assume(len(sequence) % 3 == 0)
 
-    # remove stop codons that aren't at the end if requested
-    if not allow_internal_stop_codons:
-        for codon in range(
-            3 if include_start_codon else 0,
-            len(sequence) - (3 if include_stop_codon else 0),
-            3,
-        ):
-            assume(sequence[codon : codon + 3].upper() not in ambiguous_start_codons)
+    codons = _codons(
+        allow_ambiguous=allow_ambiguous,
+        uppercase_only=uppercase_only,
+        allow_stop_codons=allow_internal_stop_codons,
+        table=table,
+    )
+    sequence = "".join(
+        draw(lists(sampled_from(codons), min_size=min_codons, max_size=max_codons))
+    )
 
     # now determine start/stop codons
     if include_start_codon:
-        _start_codon = draw(start_codon(allow_ambiguous=allow_ambiguous))
+        _start_codon = draw(start_codon(allow_ambiguous=allow_ambiguous, table=table))
     else:
         _start_codon = ""
     if include_stop_codon:
-        _stop_codon = draw(stop_codon(allow_ambiguous=allow_ambiguous))
+        _stop_codon = draw(stop_codon(allow_ambiguous=allow_ambiguous, table=table))
     else:
         _stop_codon = ""
 
@@ -233,3 +375,319 @@ def kmers(draw, seq: str, k: int) -> str:
     kmer_index = draw(integers(min_value=0, max_value=len(seq) - k))
     kmer = seq[kmer_index : kmer_index + k]
     return kmer
+
+
+def _minimizers(kmers: Sequence[str], window: int) -> List[int]:
+    """Finds the smallest *k*-mer of every `window` consecutive ones, leftmost on ties.
+
+    Returns their positions in `kmers`. A monotone queue of candidates makes this
+    linear in the number of *k*-mers. Windows that share their minimizer report it once.
+    """
+    window = min(window, len(kmers))
+    chosen = []
+    candidates = deque()  # type: deque
+    last = -1
+    for i, kmer in enumerate(kmers):
+        while candidates and kmers[candidates[-1]] > kmer:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 and candidates[0] != last:
+            last = candidates[0]
+            chosen.append(last)
+    return chosen
+
+
+@lru_cache(maxsize=4)
+def _kmer_index(
+    seq: str,
+    k: int,
+    canonical: bool = False,
+    distinct: bool = False,
+    minimizer_window: Optional[int] = None,
+) -> array:
+    """Lists where the *k*-mers of `seq` start once, so batches are drawn by slicing.
+
+    Only one 8-byte offset is kept per *k*-mer; the strings are sliced while the index
+    is built and then dropped. An offset `~i` stands for the reverse complement of the
+    *k*-mer starting at `i`.
+    """
+    size = len(seq) - k + 1
+    kmers = [seq[i : i + k] for i in range(size)]
+    offsets = list(range(size))
+    if canonical:
+        # the reverse complement of the k-mer at i ends where that k-mer starts
+        complement = reverse_complement(seq)
+        end = len(complement)
+        reverse = [complement[end - i - k : end - i] for i in range(size)]
+        offsets = [i if kmers[i] <= reverse[i] else ~i for i in offsets]
+        kmers = list(map(min, kmers, reverse))
+    if minimizer_window is not None:
+        chosen = _minimizers(kmers, minimizer_window)
+        offsets = [offsets[i] for i in chosen]
+        kmers = [kmers[i] for i in chosen]
+    if distinct:
+        first = {}  # type: Dict[str, int]
+        for kmer, offset in zip(kmers, offsets):
+            first.setdefault(kmer, offset)
+        offsets = list(first.values())
+    return array("q", offsets)
+
+
+def _kmers_at(seq: str, k: int, offsets: Sequence[int]) -> List[str]:
+    """Slices the *k*-mers at `offsets` of a *k*-mer index out of `seq`."""
+    return [
+        seq[offset : offset + k]
+        if offset >= 0
+        else reverse_complement(seq[~offset : ~offset + k])
+        for offset in offsets
+    ]
+
+
+@composite
+def kmer_batch(
+    draw,
+    seq: str,
+    k: int,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+    canonical: bool = False,
+    distinct: bool = False,
+    minimizer_window: Optional[int] = None,
+) -> List[str]:
+    """Generates lists of *k*-mers from a given sequence, for testing *k*-mer counters and minimizer schemes.
+
+    Where the *k*-mers of each sequence start is listed once and cached, and batches
+    are picked from that list with a block of raw bytes, so drawing 100,000 *k*-mers
+    costs little more than slicing them. Batches shrink towards the first *k*-mers of
+    the sequence. The indexes of the 4 most recently used sequences are kept, each
+    holding its sequence and 8 bytes per *k*-mer.
+
+    ### Arguments
+    - `seq`: The sequence to take *k*-mers from.
+    - `k`: The size of the *k*-mers.
+    - `min_size`: The fewest *k*-mers to generate.
+    - `max_size`: The most *k*-mers to generate. Defaults to `min_size + 64`. With `distinct`, at most the number of distinct *k*-mers.
+    - `canonical`: Whether to use the lexicographically smaller of each *k*-mer and its reverse complement.
+    - `distinct`: Whether each *k*-mer may only occur once in a batch.
+    - `minimizer_window`: If given, only the [minimizers](https://doi.org/10.1093/bioinformatics/bth408) are used: the lexicographically smallest *k*-mer of each `minimizer_window` consecutive ones. Lexicographic rather than hash order keeps the minimizers predictable in tests.
+    """
+    if len(seq) < k:
+        raise ValueError(
+            "The value of k: "
+            + str(k)
+            + " is greater than the length of the sequence: "
+            + str(len(seq))
+        )
+    if minimizer_window is not None and minimizer_window < 1:
+        raise InvalidArgument(
+            "minimizer_window={} must be positive".format(minimizer_window)
+        )
+
+    index = _kmer_index(seq, k, canonical, distinct, minimizer_window)
+    if distinct and min_size > len(index):
+        raise InvalidArgument(
+            "Cannot draw min_size={} distinct k-mers from {} distinct k-mers".format(
+                min_size, len(index)
+            )
+        )
+    if max_size is None:
+        max_size = min_size + BULK_BLOCK_SIZE
+    if distinct:
+        max_size = min(max_size, len(index))
+
+    size = draw(integers(min_value=min_size, max_value=max_size))
+    noise = draw(bulk_bytes(min_size=4 * size, max_size=4 * size))
+    offsets = array("I", noise)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    if not distinct:
+        return _kmers_at(seq, k, [index[offset % len(index)] for offset in offsets])
+
+    # a partial Fisher-Yates shuffle of the positions, which leaves the order alone
+    # for zero noise; only the positions it moves are stored, not a copy of the index
+    moved = {}  # type: Dict[int, int]
+    positions = []
+    for i, offset in enumerate(offsets):
+        j = i + offset % (len(index) - i)
+        positions.append(moved.get(j, j))
+        moved[j] = moved.get(i, i)
+    return _kmers_at(seq, k, [index[position] for position in positions])
+
+
+def _lyndon_de_bruijn(size: int, k: int) -> List[int]:
+    """Builds the lexicographically smallest cyclic De Bruijn sequence over `range(size)`.
+
+    Concatenates the Lyndon words whose length divides `k`, generated in order with
+    Duval's algorithm (the Fredricksen-Kessler-Maiorana construction), in linear time.
+    """
+    sequence = []  # type: List[int]
+    word = [-1]
+    while word:
+        word[-1] += 1
+        length = len(word)
+        if k % length == 0:
+            sequence.extend(word)
+        while len(word) < k:
+            word.append(word[len(word) - length])
+        while word and word[-1] == size - 1:
+            word.pop()
+    return sequence
+
+
+def _eulerian_de_bruijn(size: int, k: int, multiplicity: int, rng) -> List[int]:
+    """Builds a random cyclic sequence containing every *k*-mer `multiplicity` times.
+
+    Walks an Eulerian circuit of the De Bruijn graph, whose nodes are the (*k* - 1)-mers
+    and whose edges are the *k*-mers, each repeated `multiplicity` times. Hierholzer's
+    algorithm takes the outgoing edges of every node in a shuffled order, so its cost is
+    linear in the number of edges.
+    """
+    nodes = size ** (k - 1)
+    edges = []
+    for _ in range(nodes):
+        symbols = list(range(size)) * multiplicity
+        rng.shuffle(symbols)
+        edges.append(symbols)
+
+    # extend the walk until it is stuck, then back up onto the circuit edge by edge
+    circuit = []
+    sources = []
+    walk = []
+    node = 0
+    while True:
+        out = edges[node]
+        while out:
+            symbol = out.pop()
+            sources.append(node)
+            walk.append(symbol)
+            node = (node * size + symbol) % nodes
+            out = edges[node]
+        if not walk:
+            break
+        node = sources.pop()
+        circuit.append(walk.pop())
+    circuit.reverse()
+    return circuit
+
+
+@composite
+def de_bruijn(
+    draw,
+    alphabet: str = "ACGT",
+    min_k: int = 1,
+    max_k: int = 6,
+    min_alphabet_size: int = 1,
+    multiplicity: int = 1,
+    randomize: bool = True,
+    cyclic: bool = False,
+) -> str:
+    """Generates [De Bruijn sequences](https://en.wikipedia.org/wiki/De_Bruijn_sequence), which contain every *k*-mer over an alphabet exactly once.
+
+    Useful for stress-testing *k*-mer counters and hash tables at full occupancy. The
+    sequences are either the lexicographically smallest De Bruijn sequence or, with
+    `randomize`, a random Eulerian circuit of the De Bruijn graph. Both are built in time
+    linear in their length. Sequences shrink towards smaller *k*, fewer letters of the
+    alphabet and the lexicographically smallest sequence.
+
+    ### Arguments
+    - `alphabet`: The letters to build *k*-mers from. Only its first letters are used if the alphabet shrinks.
+    - `min_k`: The smallest *k*.
+    - `max_k`: The largest *k*. Sequences are `len(alphabet) ** max_k` long, so keep it small.
+    - `min_alphabet_size`: The fewest letters of `alphabet` to use.
+    - `multiplicity`: How many times each *k*-mer occurs.
+    - `randomize`: Whether random Eulerian circuits may be generated as well as the lexicographically smallest sequence.
+    - `cyclic`: Whether the *k*-mers are counted around the end of the sequence. Otherwise the first *k* - 1 letters are repeated at the end, so every *k*-mer occurs as a substring.
+    """
+    if len(set(alphabet)) != len(alphabet) or not alphabet:
+        raise InvalidArgument(
+            "alphabet={!r} must be non-empty and not repeat letters".format(alphabet)
+        )
+    if not 1 <= min_k <= max_k:
+        raise InvalidArgument(
+            "Must have 1 <= min_k={} <= max_k={}".format(min_k, max_k)
+        )
+    if not 1 <= min_alphabet_size <= len(alphabet):
+        raise InvalidArgument(
+            "min_alphabet_size={} must be between 1 and len(alphabet)={}".format(
+                min_alphabet_size, len(alphabet)
+            )
+        )
+    if multiplicity < 1:
+        raise InvalidArgument("multiplicity={} must be positive".format(multiplicity))
+
+    k = draw(integers(min_value=min_k, max_value=max_k))
+    size = draw(integers(min_value=min_alphabet_size, max_value=len(alphabet)))
+    if randomize and draw(booleans()):
+        rng = draw(randoms(use_true_random=True))
+        symbols = _eulerian_de_bruijn(size, k, multiplicity, rng)
+    else:
+        # a cyclic sequence repeated is still cyclic, with every k-mer repeated
+        symbols = _lyndon_de_bruijn(size, k) * multiplicity
+    if not cyclic:
+        symbols += list(islice(cycle(symbols), k - 1))
+    return bytes(symbols).translate(translation_table(alphabet[:size])).decode("ascii")
+
+
+@composite
+def run_length_sequence(
+    draw,
+    alphabet: str = "ACGT",
+    min_segments: int = 0,
+    max_segments: int = 100,
+    max_motif_size: int = 1,
+    max_repeat: int = 1000,
+    max_size: Optional[int] = None,
+) -> str:
+    """Generates sequences made of runs of repeated bases or motifs, such as homopolymers and tandem repeats.
+
+    The sequence is drawn as a list of `(motif, repeat count)` segments and only
+    expanded at the end, so even sequences of millions of bases cost a few hundred
+    draws. They shrink by deleting whole segments, shortening motifs and lowering
+    repeat counts, rather than character by character.
+
+    ### Arguments
+    - `alphabet`: The characters to build motifs from.
+    - `min_segments`: The fewest segments.
+    - `max_segments`: The most segments.
+    - `max_motif_size`: The longest motif to repeat. With the default of `1`, segments are homopolymer runs.
+    - `max_repeat`: The most times a motif is repeated in a segment.
+    - `max_size`: If given, sequences are cut off after this many characters. Segments past the cut-off are never expanded.
+
+    ::: tip Tip
+    Sequences are at most `max_segments * max_motif_size * max_repeat` long, so raise `max_repeat` for sequences of megabases.
+    :::
+    """
+    if not alphabet:
+        raise InvalidArgument("alphabet must not be empty")
+    if max_motif_size < 1 or max_repeat < 1:
+        raise InvalidArgument(
+            "max_motif_size={} and max_repeat={} must be positive".format(
+                max_motif_size, max_repeat
+            )
+        )
+
+    segments = draw(
+        lists(
+            tuples(
+                text(alphabet=alphabet, min_size=1, max_size=max_motif_size),
+                integers(min_value=1, max_value=max_repeat),
+            ),
+            min_size=min_segments,
+            max_size=max_segments,
+        )
+    )
+    if max_size is None:
+        return "".join([motif * count for motif, count in segments])
+
+    # only expand as many repeats as can still fit, rather than cutting off afterwards
+    runs = []
+    remaining = max_size
+    for motif, count in segments:
+        if remaining <= 0:
+            break
+        run = motif * min(count, -(-remaining // len(motif)))
+        runs.append(run)
+        remaining -= len(run)
+    return "".join(runs)[:max_size]
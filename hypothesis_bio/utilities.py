@@ -1,3 +1,32 @@
+"""Shared constants and helpers used by the strategies."""
+
+import hashlib
+import os
+import random
+import sys
+import tempfile
+from array import array
+from collections import namedtuple
+from functools import lru_cache, partial
+from typing import BinaryIO, List, Optional, Sequence, Set, Tuple, Union
+
+from hypothesis.control import cleanup
+from hypothesis.strategies import binary, composite, integers
+
+StreamedFile = namedtuple(
+    "StreamedFile", ["path", "handle", "num_entries", "num_bytes"]
+)
+StreamedFile.__doc__ = """Summary of a file written entry by entry.
+
+- `path`: The path of the file, if it has one.
+- `handle`: The file object that was written to, or `None` if a temporary file was used.
+- `num_entries`: The number of entries written.
+- `num_bytes`: The number of bytes written.
+"""
+
+BULK_BLOCK_SIZE = 64
+"""Number of bytes that [`bulk_bytes`](#bulk_bytes) draws directly from Hypothesis."""
+
 ambiguous_bases = {
     "A": ["A", "W", "M", "R", "D", "H", "V", "N"],
     "T": ["T", "W", "K", "Y", "B", "D", "H", "N"],
@@ -99,3 +128,417 @@ ambiguous_stop_codons = [
     "TVA",
     "TWA",
 ]
+
+# amino acid composition of UniProtKB/Swiss-Prot, in percent
+swissprot_aa_frequencies = {
+    "A": 8.25,
+    "R": 5.53,
+    "N": 4.06,
+    "D": 5.45,
+    "C": 1.37,
+    "Q": 3.93,
+    "E": 6.75,
+    "G": 7.07,
+    "H": 2.27,
+    "I": 5.96,
+    "L": 9.66,
+    "K": 5.84,
+    "M": 2.42,
+    "F": 3.86,
+    "P": 4.70,
+    "S": 6.56,
+    "T": 5.34,
+    "W": 1.08,
+    "Y": 2.92,
+    "V": 6.87,
+}
+
+# IUPAC complements, including U (which complements to A) and gaps
+_complement = ("ACGTUMRWSYKVHDBN-", "TGCAAKYWSRMBDHVN-")
+_complement_str = str.maketrans(
+    _complement[0] + _complement[0].lower(), _complement[1] + _complement[1].lower()
+)
+_complement_bytes = bytes.maketrans(
+    (_complement[0] + _complement[0].lower()).encode("ascii"),
+    (_complement[1] + _complement[1].lower()).encode("ascii"),
+)
+
+
+def to_bytes(value: Union[str, bytes]) -> bytes:
+    """Encodes `str` values as UTF-8, passing `bytes`-like values through unchanged."""
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return value
+
+
+def wrap(sequence: Union[str, bytes], width: int) -> Union[str, bytes]:
+    """Splits a sequence into lines of `width` characters joined by `\\n`.
+
+    Sequences contain no whitespace, so unlike `textwrap.fill` there is no word
+    splitting: the lines are plain slices, joined once. Other `bytes`-like input, such
+    as a `bytearray` or a `memoryview` of a memory-mapped file, is sliced through a
+    `memoryview` so that it is only copied into the result, which is `bytes`.
+
+    ### Arguments
+    - `sequence`: The `str` or `bytes`-like sequence to wrap.
+    - `width`: The maximum length of each line. Must be positive.
+    """
+    if isinstance(sequence, str):
+        return "\n".join(
+            [sequence[i : i + width] for i in range(0, len(sequence), width)]
+        )
+    # slicing bytes directly is cheaper than creating a memoryview per line
+    if isinstance(sequence, bytes):
+        return b"\n".join(
+            [sequence[i : i + width] for i in range(0, len(sequence), width)]
+        )
+
+    view = memoryview(sequence)
+    return b"\n".join([view[i : i + width] for i in range(0, len(view), width)])
+
+
+def reverse_complement(sequence: Union[str, bytes]) -> Union[str, bytes]:
+    """Reverse complements a DNA sequence, keeping IUPAC ambiguity codes and case.
+
+    ### Arguments
+    - `sequence`: The `str` or `bytes` sequence to reverse complement.
+    """
+    if isinstance(sequence, str):
+        return sequence.translate(_complement_str)[::-1]
+    return bytes(sequence).translate(_complement_bytes)[::-1]
+
+
+def cigar_string(operations: List[Tuple[int, str]]) -> str:
+    """Builds a CIGAR string, merging adjacent operations of the same kind.
+
+    ### Arguments
+    - `operations`: The alignment, as `(length, operation)` tuples. Operations of length 0 are left out.
+    """
+    merged = []  # type: List[List]
+    for count, operation in operations:
+        if not count:
+            continue
+        if merged and merged[-1][1] == operation:
+            merged[-1][0] += count
+        else:
+            merged.append([count, operation])
+    return "".join("{}{}".format(count, operation) for count, operation in merged)
+
+
+@composite
+def bulk_bytes(draw, min_size: int = 0, max_size: Optional[int] = None) -> bytes:
+    """Generates blocks of raw bytes of arbitrary size using a bounded number of draws.
+
+    The first `BULK_BLOCK_SIZE` bytes are drawn directly, so short blocks shrink byte
+    by byte. Any remaining bytes are expanded from those with a seeded PRNG, which
+    keeps the size of the example small however long the block is. A block whose
+    drawn bytes are all zero is zero throughout, which is what it shrinks towards.
+
+    ### Arguments
+    - `min_size`: The smallest block to generate.
+    - `max_size`: The largest block to generate. Defaults to `min_size + BULK_BLOCK_SIZE`.
+    """
+    if max_size is None:
+        max_size = min_size + BULK_BLOCK_SIZE
+    size = draw(integers(min_value=min_size, max_value=max_size))
+    block_size = min(size, BULK_BLOCK_SIZE)
+    block = draw(binary(min_size=block_size, max_size=block_size))
+
+    remaining = size - block_size
+    if remaining == 0 or not any(block):
+        return block + bytes(remaining)
+    return block + random.Random(block).getrandbits(8 * remaining).to_bytes(
+        remaining, "little"
+    )
+
+
+def draw_size(draw, min_size: int, max_size: Optional[int]) -> int:
+    """Draws the length of a sequence that is generated from a block of bytes.
+
+    Without a `max_size` the length is unbounded, like that of `text()`: it exceeds
+    `min_size` by the length of a drawn `binary()`, which follows the size
+    distribution of Hypothesis' unbounded collections.
+
+    ### Arguments
+    - `draw`: The `draw` function of the calling strategy.
+    - `min_size`: The shortest length.
+    - `max_size`: The longest length, if any.
+    """
+    if max_size is None:
+        return min_size + len(draw(binary()))
+    return draw(integers(min_value=min_size, max_value=max_size))
+
+
+@lru_cache(maxsize=None)
+def translation_table(alphabet: str) -> bytes:
+    """Builds a `bytes.translate` table mapping every byte value onto `alphabet`.
+
+    Byte `b` maps to `alphabet[b % len(alphabet)]`, so zero bytes map to the first
+    character of the alphabet. Unless `len(alphabet)` divides 256, the first
+    `256 % len(alphabet)` characters are favoured, so use
+    [`translate_uniform`](#translate_uniform) to map random bytes.
+
+    ### Arguments
+    - `alphabet`: The ASCII characters to map onto.
+    """
+    encoded = alphabet.encode("ascii")
+    return bytes(encoded[b % len(encoded)] for b in range(256))
+
+
+@lru_cache(maxsize=None)
+def _rejected_bytes(size: int) -> bytes:
+    """The byte values at or above the largest multiple of `size` not exceeding 256."""
+    return bytes(range(256 - 256 % size, 256))
+
+
+def translate_uniform(block: bytes, alphabet: str) -> bytes:
+    """Maps random bytes onto `alphabet` with every character equally likely.
+
+    Like [`translation_table`](#translation_table), byte `b` maps to
+    `alphabet[b % len(alphabet)]`, but the bytes that would favour the first
+    characters are dropped and made up for with bytes from a PRNG seeded by `block`.
+    The result is exactly as long as `block`, and zero bytes still map to the first
+    character, so shrinking is unaffected.
+
+    ### Arguments
+    - `block`: Uniformly random bytes.
+    - `alphabet`: The ASCII characters to map onto.
+    """
+    table = translation_table(alphabet)
+    rejected = _rejected_bytes(len(alphabet))
+    if not rejected:
+        return block.translate(table)
+
+    result = block.translate(table, rejected)
+    missing = len(block) - len(result)
+    if not missing:
+        return result
+    rng = random.Random(hashlib.sha256(block).digest())
+    parts = [result]
+    while missing:
+        # enough bytes to make up the rest on average, plus some slack
+        size = missing * 256 // (256 - len(rejected)) + 16
+        extra = rng.getrandbits(8 * size).to_bytes(size, "little")
+        extra = extra.translate(table, rejected)[:missing]
+        parts.append(extra)
+        missing -= len(extra)
+    return b"".join(parts)
+
+
+@lru_cache(maxsize=256)
+def sampling_table(weights: Tuple[float, ...], bits: int = 8) -> bytes:
+    """Builds a lookup table sampling indices in proportion to `weights`.
+
+    The `2 ** bits` entries of the table are shared out between the indices by
+    largest remainder, so indexing it with uniform `bits`-bit values samples every
+    index exactly to within `2 ** -bits`. The most likely indices come first, with
+    ties broken by index, so the value 0 samples the most likely index.
+
+    With the default of 8 bits the table can be passed straight to `bytes.translate`.
+    With 16 bits it is used through [`weighted_choices`](#weighted_choices).
+
+    ### Arguments
+    - `weights`: The relative weights of at most 256 indices.
+    - `bits`: The number of bits of noise used per sample, either 8 or 16.
+    """
+    if not 0 < len(weights) <= 256:
+        raise ValueError("Can only sample between 1 and 256 indices")
+    if min(weights) < 0 or not sum(weights) > 0:
+        raise ValueError("Weights must not be negative and must not all be 0")
+    if bits not in (8, 16):
+        raise ValueError("bits={} must be 8 or 16".format(bits))
+
+    size = 2 ** bits
+    total = sum(weights)
+    ranked = sorted(range(len(weights)), key=lambda index: -weights[index])
+    shares = [size * weight / total for weight in weights]
+    counts = [int(share) for share in shares]
+    leftover = size - sum(counts)
+    for index in sorted(ranked, key=lambda index: counts[index] - shares[index])[
+        :leftover
+    ]:
+        counts[index] += 1
+    return b"".join([bytes([index]) * counts[index] for index in ranked])
+
+
+def weighted_choices(noise: bytes, table: bytes) -> bytes:
+    """Samples one index from a 16-bit [`sampling_table`](#sampling_table) for every two bytes of noise.
+
+    Every two bytes are read as a little-endian 16-bit value whatever the byte order
+    of the machine, so the same noise samples the same indices everywhere.
+
+    ### Arguments
+    - `noise`: Uniformly random bytes, two per index. Its length must be even.
+    - `table`: The table built by `sampling_table(weights, bits=16)`.
+    """
+    if len(noise) % 2:
+        raise ValueError("Need two bytes of noise per index, got {}".format(len(noise)))
+    values = array("H", noise)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return bytes(map(table.__getitem__, values))
+
+
+def unique_entry(entry: Union[str, bytes], seen: Set[int]) -> Union[str, bytes]:
+    """Gives a FASTA or FASTQ entry an identifier that is not yet in `seen`, and records it there.
+
+    The identifier is the header up to its first space. If it was seen before, the
+    smallest suffix `_<n>`, counting up from the number of identifiers seen so far,
+    that makes it new is appended to it (and to a FASTQ `+` line repeating the
+    header), so no entry is ever rejected. Only the hash of each identifier is kept,
+    which keeps `seen` small for millions of entries; a hash collision merely
+    suffixes an identifier that was in fact new.
+
+    ### Arguments
+    - `entry`: A `str` or `bytes` entry starting with `>` or `@`.
+    - `seen`: The hashes of the identifiers used so far, updated in place.
+    """
+    encoded = not isinstance(entry, str)
+    if encoded:
+        entry = bytes(entry)
+        header_end = entry.find(b"\n")
+    else:
+        header_end = entry.find("\n")
+    if header_end == -1:
+        header_end = len(entry)
+    header = entry[1:header_end]
+    if encoded:
+        header = header.decode("latin-1")
+    identifier, space, rest = header.partition(" ")
+
+    if hash(identifier) not in seen:
+        seen.add(hash(identifier))
+        return entry
+    n = len(seen)
+    while hash("{}_{}".format(identifier, n)) in seen:
+        n += 1
+    identifier = "{}_{}".format(identifier, n)
+    seen.add(hash(identifier))
+
+    old = "\n+{}\n".format(header)
+    new = "\n+{}{}{}\n".format(identifier, space, rest)
+    renamed = [identifier + space + rest, old, new]
+    if encoded:
+        renamed = [part.encode("latin-1") for part in renamed]
+    renamed_header, old, new = renamed
+    body = entry[header_end:]
+    if entry[:1] in ("@", b"@"):
+        body = body.replace(old, new, 1)
+    return entry[:1] + renamed_header + body
+
+
+def stream_entries(
+    draw,
+    entry_source,
+    num_entries: int,
+    destination: Optional[BinaryIO] = None,
+    suffix: str = "",
+    unique_ids: bool = False,
+) -> StreamedFile:
+    """Draws entries one at a time and writes them to a binary file, newline-separated.
+
+    Only one entry is held in memory at a time. If no `destination` is given, the
+    entries are written to a new temporary file that is closed afterwards and
+    deleted once the current example finishes. A `destination` is rewound and
+    truncated before anything is written, so it only ever holds one example.
+
+    ### Arguments
+    - `draw`: The `draw` function of the calling strategy.
+    - `entry_source`: The search strategy to draw entries from.
+    - `num_entries`: The number of entries to write.
+    - `destination`: The seekable binary file object to write to.
+    - `suffix`: The file name suffix of the temporary file.
+    - `unique_ids`: Whether to make the identifiers of the entries unique with [`unique_entry`](#unique_entry).
+    """
+    if unique_ids:
+        seen = set()  # type: Set[int]
+        entries = (
+            [unique_entry(draw(entry_source), seen)] for i in range(num_entries)
+        )
+    else:
+        entries = ([draw(entry_source)] for i in range(num_entries))
+    (streamed,) = _stream(entries, num_entries, [destination], suffix)
+    return streamed
+
+
+def stream_paired_entries(
+    draw,
+    pair_source,
+    num_pairs: int,
+    destinations: Optional[Sequence[Optional[BinaryIO]]] = None,
+    suffix: str = "",
+) -> List[StreamedFile]:
+    """Draws pairs of entries one at a time and writes each half to its own file.
+
+    Works like [`stream_entries`](#stream_entries), writing the first entry of every
+    pair to the first file and the second to the second.
+
+    ### Arguments
+    - `draw`: The `draw` function of the calling strategy.
+    - `pair_source`: The search strategy to draw pairs of entries from.
+    - `num_pairs`: The number of pairs to write.
+    - `destinations`: The two seekable binary file objects to write to. Either may be `None` to use a temporary file.
+    - `suffix`: The file name suffix of the temporary files.
+    """
+    if destinations is None:
+        destinations = [None, None]
+    if len(destinations) != 2:
+        raise ValueError("Paired entries need exactly two destinations")
+    pairs = (draw(pair_source) for i in range(num_pairs))
+    return _stream(pairs, num_pairs, destinations, suffix)
+
+
+def _remove(path: str) -> None:
+    """Removes a file, if it still exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _stream(
+    entries, num_entries: int, destinations: Sequence[Optional[BinaryIO]], suffix: str
+) -> List[StreamedFile]:
+    """Writes the i-th item of every entry to the i-th destination.
+
+    Temporary files are removed when the current example finishes, whether or not it
+    reached the test, and given destinations are rewound and truncated first, so
+    neither collects the output of discarded examples.
+    """
+    handles = []
+    try:
+        for destination in destinations:
+            if destination is None:
+                handle = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+                cleanup(partial(_remove, handle.name))
+                handles.append(handle)
+            else:
+                destination.seek(0)
+                destination.truncate()
+                handles.append(destination)
+
+        num_bytes = [0] * len(handles)
+        for i, entry in enumerate(entries):
+            for j, (handle, item) in enumerate(zip(handles, entry)):
+                item = to_bytes(item)
+                if i:
+                    handle.write(b"\n")
+                    num_bytes[j] += 1
+                handle.write(item)
+                num_bytes[j] += len(item)
+        for handle in handles:
+            handle.flush()
+    finally:
+        for handle, destination in zip(handles, destinations):
+            if destination is None:
+                handle.close()
+
+    return [
+        StreamedFile(
+            path=getattr(handle, "name", None),
+            handle=destination,
+            num_entries=num_entries,
+            num_bytes=count,
+        )
+        for handle, destination, count in zip(handles, destinations, num_bytes)
+    ]
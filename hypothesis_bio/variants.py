@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""Strategies for applying known variants (SNPs and indels) to a reference sequence."""
+
+from bisect import bisect_right
+from collections import namedtuple
+from typing import List, Optional, Tuple
+
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import SearchStrategy, composite, integers, randoms
+
+from .sequences import dna
+
+__all__ = ["Variant", "MutatedSequence", "lift_over", "mutated_sequence"]
+
+Variant = namedtuple("Variant", ["position", "ref", "alt"])
+Variant.__doc__ = """A variant, written the way [VCF](https://samtools.github.io/hts-specs/VCFv4.3.pdf) writes them.
+
+- `position`: The 0-based position of the first reference base of the variant.
+- `ref`: The reference bases replaced by the variant.
+- `alt`: The bases replacing them. Insertions and deletions share their first (anchor) base with `ref`.
+"""
+
+MutatedSequence = namedtuple(
+    "MutatedSequence", ["reference", "sequence", "variants", "liftover"]
+)
+MutatedSequence.__doc__ = """A reference sequence with variants applied to it.
+
+- `reference`: The reference sequence.
+- `sequence`: The reference with every variant applied.
+- `variants`: The sorted, non-overlapping list of `Variant`s that were applied.
+- `liftover`: The blocks shared by the reference and the mutated sequence, as sorted `(reference start, reference end, sequence start)` tuples. See [`lift_over`](#lift_over).
+"""
+
+_BASES = "ACGT"
+
+
+def _draw_variants(
+    rng,
+    reference: str,
+    num_variants: int,
+    weights: Tuple[float, float, float],
+    max_indel_size: int,
+) -> List[Variant]:
+    """Places up to `num_variants` variants on `reference`, left to right.
+
+    Positions are sampled without replacement and sorted, so the cost depends on the
+    number of variants rather than the length of the reference. A position is
+    skipped if it falls within, or right after, the previous variant, which keeps
+    the variants separate and their anchor bases unchanged.
+    """
+    kinds = [kind for kind, weight in zip("SID", weights) if weight]
+    kind_weights = [weight for weight in weights if weight]
+    variants = []
+    previous_end = -1
+    for position in sorted(rng.sample(range(len(reference)), num_variants)):
+        if position <= previous_end:
+            continue
+        kind = rng.choices(kinds, kind_weights)[0]
+        base = reference[position]
+        if kind == "D":
+            size = min(rng.randint(1, max_indel_size), len(reference) - position - 1)
+            if not size:
+                continue
+            variant = Variant(position, reference[position : position + size + 1], base)
+        elif kind == "I":
+            inserted = "".join(rng.choices(_BASES, k=rng.randint(1, max_indel_size)))
+            variant = Variant(position, base, base + inserted)
+        else:
+            alt = rng.choice([other for other in _BASES if other != base.upper()])
+            variant = Variant(position, base, alt)
+        variants.append(variant)
+        previous_end = position + len(variant.ref)
+    return variants
+
+
+def _piece_table(
+    reference: str, variants: List[Variant]
+) -> Tuple[List[Tuple[int, int, int]], str]:
+    """Describes the mutated sequence as a piece table over the reference and an add buffer.
+
+    Each piece is a `(buffer, start, end)` tuple, where buffer `0` is the reference
+    and buffer `1` holds the bases introduced by the variants, so the table is built
+    without copying any of the reference.
+    """
+    pieces = []
+    added = []
+    added_size = 0
+    previous = 0
+    for position, ref, alt in variants:
+        # indels keep their anchor base, so it stays part of the reference piece
+        shared = 1 if len(ref) != len(alt) else 0
+        pieces.append((0, previous, position + shared))
+        novel = alt[shared:]
+        if novel:
+            added.append(novel)
+            pieces.append((1, added_size, added_size + len(novel)))
+            added_size += len(novel)
+        previous = position + len(ref)
+    pieces.append((0, previous, len(reference)))
+    return pieces, "".join(added)
+
+
+def _render(
+    reference: str, pieces: List[Tuple[int, int, int]], added: str
+) -> Tuple[str, List[Tuple[int, int, int]]]:
+    """Joins a piece table into the mutated sequence, recording the blocks it shares with the reference."""
+    buffers = (reference, added)
+    parts = []
+    liftover = []
+    size = 0
+    for buffer, start, end in pieces:
+        if start == end:
+            continue
+        parts.append(buffers[buffer][start:end])
+        if buffer == 0:
+            liftover.append((start, end, size))
+        size += end - start
+    return "".join(parts), liftover
+
+
+def lift_over(liftover: List[Tuple[int, int, int]], position: int) -> Optional[int]:
+    """Maps a 0-based reference position to its position in the mutated sequence.
+
+    Returns `None` if the base at `position` was changed or deleted by a variant.
+
+    ### Arguments
+    - `liftover`: The `liftover` of a [`MutatedSequence`](#mutatedsequence).
+    - `position`: The reference position to map.
+    """
+    index = bisect_right(liftover, (position, float("inf"))) - 1
+    if index < 0:
+        return None
+    start, end, sequence_start = liftover[index]
+    if position >= end:
+        return None
+    return sequence_start + position - start
+
+
+@composite
+def mutated_sequence(
+    draw,
+    reference: Optional[str] = None,
+    reference_source: Optional[SearchStrategy] = None,
+    min_variants: int = 0,
+    max_variants: int = 100,
+    snp_weight: float = 1.0,
+    insertion_weight: float = 1.0,
+    deletion_weight: float = 1.0,
+    max_indel_size: int = 10,
+) -> MutatedSequence:
+    """Generates a reference sequence together with a mutated copy of it and the variants between them.
+
+    A sorted set of SNPs, insertions and deletions is placed on the reference and
+    applied through a piece table, so the mutated sequence is joined once from
+    slices of the reference rather than rebuilt after every variant. The result is a
+    `MutatedSequence` named tuple whose `variants` and `liftover` give the truth to
+    test variant callers and coordinate conversion against. Thousands of variants on
+    megabase references cost time proportional to the number of variants plus one
+    copy of the reference.
+
+    Variant positions and bases come from a pseudo-random generator seeded by
+    Hypothesis, and examples shrink towards fewer variants.
+
+    ### Arguments
+    - `reference`: The reference to apply variants to.
+    - `reference_source`: The search strategy to draw the reference from if `reference` is `None`. Defaults to uppercase, unambiguous [`dna`](/api/sequences#dna) of 1 to 1000 bases.
+    - `min_variants`: The fewest variants to place. Fewer may be applied if the reference is too short to keep them apart.
+    - `max_variants`: The most variants to place.
+    - `snp_weight`: The relative frequency of SNPs.
+    - `insertion_weight`: The relative frequency of insertions.
+    - `deletion_weight`: The relative frequency of deletions.
+    - `max_indel_size`: The most bases an insertion adds or a deletion removes.
+    """
+    weights = (snp_weight, insertion_weight, deletion_weight)
+    if min(weights) < 0 or not sum(weights):
+        raise InvalidArgument(
+            "Variant weights must not be negative and must not all be zero"
+        )
+    if max_indel_size < 1:
+        raise InvalidArgument(
+            "max_indel_size={} must be positive".format(max_indel_size)
+        )
+    if not 0 <= min_variants <= max_variants:
+        raise InvalidArgument(
+            "Cannot have min_variants={} and max_variants={}".format(
+                min_variants, max_variants
+            )
+        )
+
+    if reference is None:
+        if reference_source is None:
+            reference_source = dna(
+                allow_ambiguous=False,
+                allow_gaps=False,
+                uppercase_only=True,
+                min_size=1,
+                max_size=1000,
+                bulk=True,
+            )
+        reference = draw(reference_source)
+
+    num_variants = draw(integers(min_value=min_variants, max_value=max_variants))
+    rng = draw(randoms(use_true_random=True))
+    variants = _draw_variants(
+        rng,
+        reference,
+        min(num_variants, len(reference)),
+        weights,
+        max_indel_size,
+    )
+    sequence, liftover = _render(reference, *_piece_table(reference, variants))
+    return MutatedSequence(
+        reference=reference, sequence=sequence, variants=variants, liftover=liftover
+    )
@@ -0,0 +1,97 @@
+import re
+
+import pytest
+from hypothesis import errors, given
+
+from hypothesis_bio import aligned_pair, alignment_score
+
+from .minimal import minimal
+
+
+def operations(cigar):
+    return [(int(count), op) for count, op in re.findall(r"(\d+)([M=XID])", cigar)]
+
+
+def naive_score(query, target, cigar, substitution, gap_open, gap_extend):
+    score = 0
+    query_index = target_index = 0
+    for length, op in operations(cigar):
+        if op in "M=X":
+            for offset in range(length):
+                score += substitution(
+                    query[query_index + offset], target[target_index + offset]
+                )
+            query_index += length
+            target_index += length
+        elif op == "I":
+            score += gap_open + length * gap_extend
+            query_index += length
+        else:
+            score += gap_open + length * gap_extend
+            target_index += length
+    return score
+
+
+def test_aligned_pair_minimal():
+    pair = minimal(aligned_pair())
+
+    assert len(pair.query) == 1
+    assert pair.query == pair.target
+    assert pair.cigar == "1M"
+    assert pair.score == 2
+
+
+@given(aligned_pair(extended_cigar=True))
+def test_cigar_describes_sequences(pair):
+    query_index = target_index = 0
+    previous = None
+    for length, op in operations(pair.cigar):
+        assert op != previous
+        previous = op
+        query_run = pair.query[query_index : query_index + length]
+        target_run = pair.target[target_index : target_index + length]
+        if op == "=":
+            assert query_run == target_run
+        elif op == "X":
+            assert all(q != t for q, t in zip(query_run, target_run))
+        if op in "=XI":
+            query_index += length
+        if op in "=XD":
+            target_index += length
+    assert (query_index, target_index) == (len(pair.query), len(pair.target))
+
+
+@given(aligned_pair(match=1, mismatch=-2, gap_open=-3, gap_extend=-1))
+def test_score(pair):
+    assert pair.score == naive_score(
+        *pair[:3], lambda q, t: 1 if q == t else -2, -3, -1
+    )
+
+
+MATRIX = {("A", "A"): 5, ("A", "B"): 1, ("B", "A"): -1, ("B", "B"): 3}
+
+
+@given(aligned_pair(alphabet="AB", matrix=MATRIX))
+def test_matrix(pair):
+    assert pair.score == naive_score(*pair[:3], lambda q, t: MATRIX[q, t], -5, -2)
+
+
+def test_alignment_score():
+    operations = [(1, "M"), (1, "I"), (2, "M"), (2, "D")]
+
+    # 5 (A/A) - 7 (gap of 1) + 3 (B/B) - 1 (B/A) - 9 (gap of 2)
+    assert alignment_score("AABB", "ABAAB", operations, MATRIX, -5, -2) == -9
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"alphabet": "AA"},
+        {"max_run": 0},
+        {"alphabet": "AB", "matrix": {("A", "A"): 1}},
+        {"min_operations": 3, "max_operations": 2},
+    ],
+)
+def test_invalid_arguments(arguments):
+    with pytest.raises(errors.InvalidArgument):
+        minimal(aligned_pair(**arguments))
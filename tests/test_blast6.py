@@ -1,4 +1,18 @@
-from hypothesis_bio.blast6 import BLAST6_DEFAULT_HEADERS, BLAST6_HEADERS
+import re
+
+import pytest
+from hypothesis import errors, given
+
+import hypothesis_bio
+from hypothesis_bio import blast6_table
+from hypothesis_bio.blast6 import (
+    _COLUMNS,
+    BLAST6_DEFAULT_COLUMNS,
+    BLAST6_DEFAULT_HEADERS,
+    BLAST6_HEADERS,
+)
+
+from .minimal import minimal
 
 
 def test_all_headers_is_dict():
@@ -7,3 +21,96 @@ def test_all_headers_is_dict():
 
 def test_default_headers_is_list():
     assert type(BLAST6_DEFAULT_HEADERS) == list
+
+
+def test_blast6_module_is_not_shadowed():
+    assert hypothesis_bio.blast6.BLAST6_HEADERS is BLAST6_HEADERS
+    assert not hasattr(hypothesis_bio, "Blast6Hit")
+
+
+ALL_COLUMNS = list(_COLUMNS)
+
+
+def test_every_header_can_be_written():
+    assert set(BLAST6_HEADERS) == set(_COLUMNS)
+
+
+def parse(blast6_string, columns):
+    return [
+        dict(zip(columns, line.split("\t"))) for line in blast6_string.splitlines()
+    ]
+
+
+def test_blast6_minimal():
+    rows = parse(minimal(blast6_table()), BLAST6_DEFAULT_COLUMNS)
+
+    assert len(rows) == 1
+    assert rows[0]["qseqid"] == rows[0]["sseqid"] == "0"
+
+
+@given(blast6_table(columns=ALL_COLUMNS, max_hits=20, max_sequence_length=300))
+def test_blast6_columns_agree(blast6_string):
+    for row in parse(blast6_string, ALL_COLUMNS):
+        qstart, qend, sstart, send = (
+            int(row[name]) for name in ["qstart", "qend", "sstart", "send"]
+        )
+        length, nident, mismatch, gaps = (
+            int(row[name]) for name in ["length", "nident", "mismatch", "gaps"]
+        )
+        qseq, sseq = row["qseq"], row["sseq"]
+
+        assert 1 <= qstart <= qend <= int(row["qlen"])
+        assert 1 <= min(sstart, send) <= max(sstart, send) <= int(row["slen"])
+        assert (sstart > send) == (row["sstrand"] == "minus")
+        assert length == nident + mismatch + gaps == len(qseq) == len(sseq)
+        assert qend - qstart + 1 == length - qseq.count("-")
+        assert abs(sstart - send) + 1 == length - sseq.count("-")
+        assert gaps == qseq.count("-") + sseq.count("-")
+        assert int(row["gapopen"]) == len(re.findall("-+", qseq + " " + sseq))
+        assert nident == sum(q == s for q, s in zip(qseq, sseq))
+        assert float(row["pident"]) == pytest.approx(100 * nident / length, abs=1e-3)
+        assert int(row["qcovs"]) >= int(row["qcovhsp"]) >= 0
+        assert float(row["evalue"]) >= 0 and float(row["bitscore"]) > 0
+
+
+@given(blast6_table(columns=["qseqid", "qseq", "sseq", "btop"], max_hits=20))
+def test_blast6_btop(blast6_string):
+    for row in parse(blast6_string, ["qseqid", "qseq", "sseq", "btop"]):
+        query = []
+        subject = []
+        position = 0
+        for identical, pair in re.findall(r"(\d+)|(\D\D)", row["btop"]):
+            if identical:
+                run = row["qseq"][position : position + int(identical)]
+                query.append(run)
+                subject.append(run)
+                position += int(identical)
+            else:
+                position += 1
+                query.append(pair[0])
+                subject.append(pair[1])
+
+        assert "".join(query) == row["qseq"]
+        assert "".join(subject) == row["sseq"]
+
+
+@given(blast6_table(max_hits=50, max_queries=3))
+def test_blast6_sorted_by_query_then_bitscore(blast6_string):
+    rows = parse(blast6_string, BLAST6_DEFAULT_COLUMNS)
+    for previous, row in zip(rows, rows[1:]):
+        if previous["qseqid"] == row["qseqid"]:
+            assert float(previous["bitscore"]) >= float(row["bitscore"])
+
+
+@given(blast6_table(as_bytes=True))
+def test_blast6_as_bytes(blast6_bytes):
+    assert isinstance(blast6_bytes, bytes)
+    assert all(line.count(b"\t") == 11 for line in blast6_bytes.splitlines())
+
+
+@pytest.mark.parametrize(
+    "arguments", [{"columns": ["qseqid", "nonsense"]}, {"max_sequence_length": 0}]
+)
+def test_blast6_invalid_arguments(arguments):
+    with pytest.raises(errors.InvalidArgument):
+        minimal(blast6_table(**arguments))
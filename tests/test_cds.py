@@ -1,8 +1,9 @@
 import pytest
-from hypothesis import HealthCheck, given, settings
-from hypothesis.errors import InvalidArgument, Unsatisfiable
+from hypothesis import given
+from hypothesis.errors import InvalidArgument
 
 from hypothesis_bio import cds
+from hypothesis_bio.utilities import ambiguous_stop_codons
 
 from .minimal import minimal
 
@@ -89,28 +90,28 @@ def test_min_size_equal_to_max_size():
     )
 
     # non mod 3 specific sizes won't work
-    with pytest.raises(Unsatisfiable):
-
-        @given(cds(min_size=7, max_size=7))
-        @settings(suppress_health_check=HealthCheck.all())
-        def inner(x):
-            pass
-
-        inner()
-
-    with pytest.raises(Unsatisfiable):
-
-        @given(cds(min_size=8, max_size=8))
-        @settings(suppress_health_check=HealthCheck.all())
-        def inner(x):
-            pass
+    with pytest.raises(InvalidArgument):
+        minimal(cds(min_size=7, max_size=7))
 
-        inner()
+    with pytest.raises(InvalidArgument):
+        minimal(cds(min_size=8, max_size=8))
 
     # if start and stop codons are included, there is no other codon in a 6-mer
     assert minimal(cds(min_size=6, max_size=6)) == "ATAAGA"
 
 
+def test_no_whole_codon_in_size_range():
+    with pytest.raises(InvalidArgument):
+        minimal(
+            cds(
+                min_size=7,
+                max_size=8,
+                include_start_codon=False,
+                include_stop_codon=False,
+            )
+        )
+
+
 def test_allow_internal_stop_codons():
     assert (
         minimal(
@@ -127,3 +128,10 @@ def test_allow_internal_stop_codons():
         )
         == "AAA"
     )
+
+
+@given(cds(min_size=3000, max_size=3000, allow_internal_stop_codons=False))
+def test_long_cds_without_internal_stop_codons(seq):
+    assert len(seq) == 3000
+    internal = [seq[i : i + 3].upper() for i in range(3, len(seq) - 3, 3)]
+    assert not set(internal) & set(ambiguous_stop_codons)
@@ -0,0 +1,108 @@
+import pytest
+from hypothesis import given
+
+import hypothesis_bio
+from hypothesis_bio import (
+    back_translate,
+    cds,
+    codon_table,
+    protein,
+    start_codon,
+    stop_codon,
+    translate,
+    unambiguous_dna_by_id,
+)
+from hypothesis_bio.utilities import (
+    ambiguous_start_codons,
+    ambiguous_stop_codons,
+    start_codons,
+    stop_codons,
+)
+
+from .minimal import minimal
+
+
+def test_standard_table():
+    table = codon_table(1)
+    assert table.name == "Standard"
+    assert table.start_codons == ("ATG", "CTG", "TTG")
+    assert table.stop_codons == ("TAA", "TAG", "TGA")
+    assert len(table.forward_table) == 64
+
+
+def test_tables_are_read_only():
+    with pytest.raises(TypeError):
+        codon_table(1).forward_table["ATG"] = "X"
+
+
+def test_merged_codons_match_tables():
+    tables = unambiguous_dna_by_id.values()
+    assert sorted({c for t in tables for c in t.start_codons}) == start_codons
+    assert sorted({c for t in tables for c in t.stop_codons}) == stop_codons
+
+
+def test_merged_ambiguous_codons_match_tables():
+    tables = [codon_table(i, allow_ambiguous=True) for i in unambiguous_dna_by_id]
+    assert sorted({c for t in tables for c in t.start_codons}) == ambiguous_start_codons
+    assert sorted({c for t in tables for c in t.stop_codons}) == ambiguous_stop_codons
+
+
+def test_unknown_table():
+    with pytest.raises(ValueError):
+        codon_table(7)
+
+
+def test_translate():
+    assert translate("ATGGCCTGA") == "MA*"
+    assert translate("ATGGCCTGA", table=2) == "MAW"
+    assert translate("augRAYnnn") == "MBX"
+    assert translate("ATGTAAGCC", to_stop=True) == "M"
+
+
+def test_translate_partial_codon():
+    with pytest.raises(ValueError):
+        translate("ATGC")
+
+
+@given(protein(allow_ambiguous=False, uppercase_only=True))
+def test_back_translate_roundtrip(seq):
+    assert translate(back_translate(seq)) == seq
+
+
+def test_start_codon_table():
+    assert minimal(start_codon(allow_ambiguous=False, table=1)) == "ATG"
+
+
+def test_stop_codon_table():
+    assert minimal(stop_codon(allow_ambiguous=False, table=2)) == "AGA"
+
+
+@given(cds(allow_ambiguous=False, allow_internal_stop_codons=False, table=11))
+def test_cds_table(seq):
+    protein = translate(seq, table=11)
+    assert seq[:3] in codon_table(11).start_codons
+    assert protein.endswith("*") and protein.count("*") == 1
+
+
+def test_back_translate_stop_codon():
+    for table in unambiguous_dna_by_id:
+        stop = back_translate("*", table)
+        assert stop in codon_table(table).stop_codons
+        expected = {27: "W", 28: "Q", 31: "E"}.get(table, "*")
+        assert translate(stop, table) == expected
+
+
+def test_package_exports_only_public_names():
+    for module in (
+        hypothesis_bio.alignments,
+        hypothesis_bio.codon_tables,
+        hypothesis_bio.markov,
+        hypothesis_bio.quality_models,
+        hypothesis_bio.read_simulation,
+        hypothesis_bio.references,
+        hypothesis_bio.variants,
+    ):
+        for name in module.__all__:
+            assert getattr(hypothesis_bio, name) is getattr(module, name)
+    for name in ("MappingProxyType", "accumulate", "bisect_right", "exp"):
+        assert not hasattr(hypothesis_bio, name)
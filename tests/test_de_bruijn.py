@@ -0,0 +1,60 @@
+from collections import Counter
+from itertools import product
+
+import pytest
+from hypothesis import errors, given
+from hypothesis.strategies import data, integers
+
+from hypothesis_bio import de_bruijn
+
+from .minimal import minimal
+
+
+def kmer_counts(seq, k):
+    return Counter(seq[i : i + k] for i in range(len(seq) - k + 1))
+
+
+def test_smallest_example():
+    assert minimal(de_bruijn()) == "A"
+
+
+def test_smallest_example_k_3():
+    assert minimal(de_bruijn(alphabet="01", min_k=3, max_k=3, min_alphabet_size=2)) == (
+        "0001011100"
+    )
+
+
+@given(data(), integers(min_value=1, max_value=4), integers(min_value=1, max_value=3))
+def test_every_kmer_once(data, k, multiplicity):
+    seq = data.draw(
+        de_bruijn(min_k=k, max_k=k, min_alphabet_size=4, multiplicity=multiplicity)
+    )
+    counts = kmer_counts(seq, k)
+    assert set(counts) == {"".join(kmer) for kmer in product("ACGT", repeat=k)}
+    assert set(counts.values()) == {multiplicity}
+
+
+@given(de_bruijn(alphabet="ACGT", min_k=3, max_k=3, min_alphabet_size=4, cyclic=True))
+def test_cyclic(seq):
+    assert len(seq) == 64
+    assert len(kmer_counts(seq + seq[:2], 3)) == 64
+
+
+@given(de_bruijn(alphabet="xyz", max_k=3))
+def test_alphabet(seq):
+    assert set(seq) <= set("xyz")
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"alphabet": "AAC"},
+        {"min_k": 0},
+        {"min_k": 3, "max_k": 2},
+        {"min_alphabet_size": 5},
+        {"multiplicity": 0},
+    ],
+)
+def test_invalid_arguments(arguments):
+    with pytest.raises(errors.InvalidArgument):
+        minimal(de_bruijn(**arguments))
@@ -1,4 +1,5 @@
-from hypothesis import given
+import pytest
+from hypothesis import errors, given
 
 from hypothesis_bio import dna
 
@@ -73,3 +74,34 @@ def test_allow_lowercase_2_mer():
         lambda x: all(c not in ["A", "T", "C", "G"] for c in x),
     )
     assert seq == "aa"
+
+
+def test_bulk_smallest_non_empty_example():
+    assert minimal(dna(min_size=1, bulk=True)) == "A"
+
+
+@given(dna(min_size=1000000, max_size=1000000, bulk=True))
+def test_bulk_long_sequence(seq):
+    assert len(seq) == 1000000
+    assert set(seq).issubset(set("ACGTNUKSYMWRBDHVacgtnuksymwrbdhv-"))
+
+
+@given(dna(max_size=10, allow_ambiguous=False, uppercase_only=True, bulk=True))
+def test_bulk_alphabet(seq):
+    assert len(seq) <= 10
+    assert set(seq).issubset(set("ATGC-"))
+
+
+@given(dna(allow_ambiguous=False, allow_gaps=False, gc_content=1))
+def test_gc_content_one(seq):
+    assert set(seq) <= set("GCgc")
+
+
+@given(dna(gc_content=0, allow_gaps=False))
+def test_gc_content_zero_keeps_ambiguous_bases(seq):
+    assert not set(seq) & set("GCgc")
+
+
+def test_gc_content_out_of_range():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(dna(gc_content=1.5))
@@ -1,6 +1,12 @@
-from hypothesis import given
+import io
+import os
+import tempfile
 
-from hypothesis_bio import dna, fasta, fasta_entry
+from hypothesis import HealthCheck, given, settings
+from hypothesis.strategies import sampled_from
+
+from hypothesis_bio import dna, fasta, fasta_entry, fasta_file
+from hypothesis_bio.fasta import _random_layout
 
 from .minimal import minimal
 
@@ -51,3 +57,109 @@ def test_fasta_min_and_max_reads_the_same_no_wrapping(fasta_file):
     expected = 6
 
     assert actual == expected
+
+
+@given(fasta_entry(sequence_source=dna(min_size=200, max_size=300)))
+def test_random_wrapping_layout_is_valid(seq):
+    sequence = seq.split("\n", 1)[1]
+    assert not sequence.startswith(("\n", "\r"))
+    assert "\n\n" not in sequence and "\r\r" not in sequence and "\n\r" not in sequence
+    assert len(sequence.replace("\r", "").replace("\n", "")) >= 200
+
+
+def test_random_wrapping_layout_has_many_short_lines():
+    layout = minimal(_random_layout("A" * 200), lambda seq: seq.count("\n") > 20)
+
+    assert layout == "A\n" * 21 + "A" * 179
+
+
+@given(fasta_file(entry_source=fasta_entry(wrap_length=0), min_reads=3, max_reads=3))
+def test_fasta_file(streamed):
+    with open(streamed.path, "rb") as f:
+        contents = f.read()
+
+    assert streamed.handle is None
+    assert streamed.num_entries == 3
+    assert streamed.num_bytes == len(contents)
+    assert contents.count(b">") >= 3
+    assert len(contents.split(b"\n")) == 6
+
+
+def test_fasta_file_to_handle():
+    buffer = io.BytesIO()
+    streamed = minimal(fasta_file(destination=buffer))
+
+    assert streamed.handle is buffer
+    assert streamed.path is None
+    assert (streamed.num_entries, streamed.num_bytes) == (1, 2)
+    assert buffer.getvalue() == b">\n"
+
+
+_shared_buffer = io.BytesIO()
+
+
+@given(fasta_file(destination=_shared_buffer, max_reads=5))
+def test_fasta_file_to_handle_holds_one_example(streamed):
+    contents = _shared_buffer.getvalue()
+
+    assert len(contents) == streamed.num_bytes
+    assert contents.count(b"\n>") == streamed.num_entries - 1
+
+
+def test_fasta_file_removes_temporary_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    # entries are rejected half the time, after the file has been created
+    entry_source = fasta_entry(wrap_length=0).filter(lambda entry: len(entry) % 2)
+
+    @settings(max_examples=50, suppress_health_check=list(HealthCheck))
+    @given(fasta_file(entry_source=entry_source))
+    def inner(streamed):
+        assert os.path.exists(streamed.path)
+
+    inner()
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_fasta_as_bytes_minimal():
+    assert minimal(fasta(as_bytes=True)) == b">\n"
+
+
+@given(fasta_entry(as_bytes=True))
+def test_fasta_entry_as_bytes(entry):
+    assert type(entry) == bytes
+    assert entry.startswith(b">")
+
+
+@given(fasta_entry(wrap_length=0, as_bytes=True))
+def test_fasta_entry_as_bytes_default_sequence(entry):
+    sequence = entry.split(b"\n", 1)[1]
+
+    assert set(sequence) <= set(b"ACGTNUKSYMWRBDHVacgtnuksymwrbdhv-")
+
+
+@given(fasta_entry(wrap_length=5, as_bytes=True))
+def test_fasta_entry_as_bytes_wrapped(entry):
+    assert all(len(line) <= 5 for line in entry.split(b"\n")[1:])
+
+
+def test_fasta_unique_ids_minimal():
+    actual = minimal(fasta(min_reads=3, max_reads=3, unique_ids=True))
+    expected = ">\n\n>_1\n\n>_2\n"
+
+    assert actual == expected
+
+
+@given(
+    fasta(
+        entry_source=fasta_entry(
+            comment_source=sampled_from(["a", "a b", "b"]), wrap_length=0
+        ),
+        max_reads=20,
+        unique_ids=True,
+    )
+)
+def test_fasta_unique_ids(fasta_string):
+    identifiers = [line[1:].split(" ")[0] for line in fasta_string.split("\n")[::2]]
+
+    assert len(identifiers) == len(set(identifiers))
@@ -1,13 +1,28 @@
+import io
+import os
+import re
+import tempfile
+import uuid
+
 import pytest
-from hypothesis import errors, given
+from hypothesis import errors, given, settings
+from hypothesis.strategies import sampled_from
 
 from hypothesis_bio import (
     MAX_ASCII,
+    binned_illumina_quality,
     fastq,
     fastq_entry,
+    fastq_file,
+    fastq_pair,
     fastq_quality,
+    illumina_run_identifiers,
     illumina_sequence_identifier,
+    nanopore_fastq,
+    nanopore_run_identifiers,
     nanopore_sequence_identifier,
+    paired_fastq,
+    paired_fastq_files,
     protein,
     sequence_identifier,
 )
@@ -215,3 +230,231 @@ def test_fastq_min_and_max_reads_the_same_no_wrapping(fastq_file):
     expected = 12
 
     assert actual == expected
+
+
+@given(fastq_file(entry_source=fastq_entry(wrap_length=0), min_reads=3, max_reads=3))
+def test_fastq_file(streamed):
+    with open(streamed.path) as f:
+        lines = f.read().split("\n")
+
+    assert streamed.path.endswith(".fastq")
+    assert streamed.num_entries == 3
+    assert len(lines) == 12
+
+
+def test_fastq_entry_as_bytes_minimal():
+    actual = minimal(
+        fastq_entry(
+            min_size=1, identifier_source=sequence_identifier(min_size=1), as_bytes=True
+        )
+    )
+    expected = b"@0\nA\n+0\n0"
+
+    assert actual == expected
+
+
+@given(fastq(as_bytes=True, min_reads=2, max_reads=2))
+def test_fastq_as_bytes(fastq_file):
+    assert type(fastq_file) == bytes
+    assert fastq_file.count(b"\n+") >= 2
+
+
+@given(fastq_entry(min_size=100000, max_size=100000, wrap_length=0))
+def test_fastq_entry_long_read(fastq_string):
+    fields = fastq_string.split("\n")
+
+    assert len(fields[1]) == len(fields[3]) == 100000
+    assert all(33 <= ord(c) <= MAX_ASCII for c in fields[3])
+
+
+@given(fastq_quality(min_size=5, max_size=5, min_score=-5, max_score=62, offset=64))
+def test_fastq_quality_solexa_range(quality):
+    assert len(quality) == 5
+    assert all(59 <= ord(c) <= 126 for c in quality)
+
+
+def test_fastq_pair_minimal():
+    actual = minimal(fastq_pair(min_size=1, wrap_length=0))
+    seq_id = "0:0:0:0:0:0:0:A+A {}:N:0:A"
+    expected = (
+        "@{0}\nA\n+{0}\n0".format(seq_id.format(1)),
+        "@{0}\nT\n+{0}\n0".format(seq_id.format(2)),
+    )
+
+    assert actual == expected
+
+
+@given(fastq_pair(min_size=30, max_size=30, wrap_length=0))
+def test_fastq_pair_default_insert_fits_min_size(pair):
+    assert [len(entry.split("\n")[1]) for entry in pair] == [30, 30]
+
+
+@given(
+    fastq_pair(
+        min_size=20,
+        max_size=20,
+        min_insert_size=20,
+        max_insert_size=20,
+        identifier_source=sequence_identifier(min_size=1, blacklist_characters=" "),
+        wrap_length=0,
+    )
+)
+def test_fastq_pair_reads_both_ends_of_the_template(pair):
+    first, second = [entry.split("\n") for entry in pair]
+    complement = str.maketrans("ACGT", "TGCA")
+
+    assert first[0][:-2] == second[0][:-2]
+    assert first[0].endswith("/1") and second[0].endswith("/2")
+    assert second[1] == first[1].translate(complement)[::-1]
+
+
+@given(
+    fastq(
+        entry_source=fastq_pair(interleaved=True, wrap_length=0),
+        min_reads=2,
+        max_reads=2,
+    )
+)
+def test_fastq_pair_interleaved(fastq_string):
+    lines = fastq_string.split("\n")
+
+    assert len(lines) == 16
+    assert [line.split(" ")[1][0] for line in lines[::4]] == ["1", "2", "1", "2"]
+
+
+@given(paired_fastq(min_pairs=3, max_pairs=3, as_bytes=True))
+def test_paired_fastq(files):
+    assert all(type(f) == bytes and f.count(b"\n+") >= 3 for f in files)
+
+
+@given(paired_fastq_files(min_pairs=3, max_pairs=3))
+def test_paired_fastq_files(streamed):
+    contents = []
+    for streamed_file in streamed:
+        with open(streamed_file.path, "rb") as f:
+            contents.append(f.read())
+
+    assert [streamed_file.num_entries for streamed_file in streamed] == [3, 3]
+    assert [len(c) for c in contents] == [s.num_bytes for s in streamed]
+    assert contents[0].count(b" 1:") == contents[1].count(b" 2:") >= 3
+
+
+_shared_buffers = [io.BytesIO(), io.BytesIO()]
+
+
+@given(paired_fastq_files(max_pairs=5, destinations=_shared_buffers))
+def test_paired_fastq_files_to_handles_hold_one_example(streamed):
+    contents = [buffer.getvalue() for buffer in _shared_buffers]
+
+    assert [len(c) for c in contents] == [s.num_bytes for s in streamed]
+
+
+def test_paired_fastq_files_removes_temporary_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    @settings(max_examples=20)
+    @given(paired_fastq_files(max_pairs=3))
+    def inner(streamed):
+        assert all(os.path.exists(s.path) for s in streamed)
+
+    inner()
+    assert os.listdir(str(tmp_path)) == []
+
+
+@given(fastq_quality(min_size=100, max_size=100, score_weights={2: 1, 40: 3}))
+def test_fastq_quality_score_weights(quality):
+    assert set(quality) <= {"#", "I"}
+
+
+def test_fastq_quality_score_weights_with_model_raises_error():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(fastq_quality(model=binned_illumina_quality(), score_weights={40: 1}))
+
+
+def test_illumina_run_identifiers_minimal():
+    actual = minimal(illumina_run_identifiers(min_size=2, max_size=2))
+    expected = ["0:0:0:0:0:0:0:A+A 1:N:0:A", "0:0:0:0:0:0:1:A+A 1:N:0:A"]
+
+    assert actual == expected
+
+
+@given(illumina_run_identifiers(max_size=50))
+def test_illumina_run_identifiers_are_sorted(identifiers):
+    fields = [seq_id.split(" ")[0].split(":") for seq_id in identifiers]
+    comments = [seq_id.split(" ")[1].split(":") for seq_id in identifiers]
+    positions = [tuple(int(value) for value in field[4:7]) for field in fields]
+
+    assert len({tuple(field[:4]) for field in fields}) == 1
+    assert len({(comment[0], comment[3]) for comment in comments}) == 1
+    assert positions == sorted(set(positions))
+    assert all(int(comment[2]) % 2 == 0 for comment in comments)
+
+
+@given(fastq(illumina_run=True, max_reads=20))
+def test_fastq_illumina_run(fastq_string):
+    identifiers = [line[1:] for line in fastq_string.split("\n")[::4]]
+    flowcells = {seq_id.split(":")[2] for seq_id in identifiers}
+
+    assert len(flowcells) == 1
+
+
+def test_fastq_illumina_run_with_entry_source():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(fastq(entry_source=fastq_entry(), illumina_run=True))
+
+
+@given(nanopore_run_identifiers(max_size=20))
+def test_nanopore_run_identifiers(identifiers):
+    fields = [dict(field.split("=", 1) for field in i.split(" ")[1:]) for i in identifiers]
+    read_ids = [seq_id.split(" ")[0] for seq_id in identifiers]
+    read_nums = [int(field["read"]) for field in fields]
+
+    assert len({(field["runid"], field["sampleid"]) for field in fields}) == 1
+    assert all(re.fullmatch(r"[0-9a-f]{40}", field["runid"]) for field in fields)
+    assert all(str(uuid.UUID(read_id)) == read_id for read_id in read_ids)
+    assert read_nums == sorted(set(read_nums))
+
+
+@given(nanopore_fastq(max_reads=3, min_size=1000, max_size=5000, as_bytes=True))
+def test_nanopore_fastq(fastq_bytes):
+    lines = fastq_bytes.split(b"\n")
+    run_ids = {line.split(b" ")[1] for line in lines[::4]}
+
+    assert len(lines) % 4 == 0
+    assert len(run_ids) == 1
+    assert all(line == b"+" for line in lines[2::4])
+    assert all(1000 <= len(line) <= 5000 for line in lines[1::4])
+    assert all(set(line) <= set(b"ACGT") for line in lines[1::4])
+    assert [len(line) for line in lines[1::4]] == [len(line) for line in lines[3::4]]
+
+
+@given(nanopore_fastq(max_reads=3, min_size=10, max_size=100))
+def test_nanopore_fastq_as_str(fastq_string):
+    lines = fastq_string.split("\n")
+
+    assert all(re.fullmatch("[ACGT]{10,100}", line) for line in lines[1::4])
+
+
+@given(
+    fastq_file(
+        entry_source=fastq_entry(
+            identifier_source=sampled_from(["r", "r 1:N:0:A"]), wrap_length=0
+        ),
+        max_reads=20,
+        unique_ids=True,
+    )
+)
+def test_fastq_file_unique_ids(streamed):
+    with open(streamed.path) as f:
+        lines = f.read().split("\n")
+    identifiers = [line[1:].split(" ")[0] for line in lines[::4]]
+
+    assert len(identifiers) == len(set(identifiers))
+    assert [line[1:] for line in lines[::4]] == [line[1:] for line in lines[2::4]]
+
+
+@given(fastq(illumina_run=True, max_reads=5, unique_ids=True, as_bytes=True))
+def test_fastq_unique_ids_as_bytes(fastq_bytes):
+    identifiers = [line.split(b" ")[0] for line in fastq_bytes.split(b"\n")[::4]]
+
+    assert len(identifiers) == len(set(identifiers))
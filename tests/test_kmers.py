@@ -1,6 +1,8 @@
 import pytest
+from hypothesis import errors, given
 
-from hypothesis_bio import kmers
+from hypothesis_bio import kmer_batch, kmers
+from hypothesis_bio.sequences import _kmer_index
 
 from .minimal import minimal
 
@@ -28,3 +30,62 @@ def test_long_seq_example_big_k():
 def test_exception():
     with pytest.raises(Exception):
         print(minimal(kmers(seq="A", k=5)))
+
+
+def test_batch_smallest_example():
+    assert minimal(kmer_batch(seq="ACGTACGT", k=4)) == []
+
+
+def test_batch_smallest_non_empty_example():
+    assert minimal(kmer_batch(seq="ACGTACGT", k=4, min_size=3)) == ["ACGT"] * 3
+
+
+def test_batch_distinct_smallest_example():
+    assert minimal(kmer_batch(seq="AAAC", k=2, min_size=2, distinct=True)) == [
+        "AA",
+        "AC",
+    ]
+
+
+@given(kmer_batch(seq="ACGTTGCAAC", k=3, max_size=100, distinct=True))
+def test_batch_distinct(batch):
+    assert len(batch) == len(set(batch))
+    assert len(batch) <= 8
+
+
+@given(kmer_batch(seq="ACGTTGCAAC", k=3, min_size=8, max_size=8, distinct=True))
+def test_batch_distinct_can_take_every_kmer(batch):
+    assert sorted(batch) == sorted({"ACGTTGCAAC"[i : i + 3] for i in range(8)})
+
+
+@given(kmer_batch(seq="TTTTGGGG", k=3, min_size=1, canonical=True))
+def test_batch_canonical(batch):
+    assert set(batch) <= {"AAA", "CAA", "CCA", "CCC"}
+
+
+@given(kmer_batch(seq="CAGTACGTT", k=3, min_size=1, minimizer_window=3))
+def test_batch_minimizers(batch):
+    assert set(batch) <= {"AGT", "ACG"}
+
+
+@given(kmer_batch(seq="ACGT" * 1000, k=5, min_size=1000, max_size=1000))
+def test_batch_large(batch):
+    assert len(batch) == 1000
+    assert set(batch) <= {"ACGTA", "CGTAC", "GTACG", "TACGT"}
+
+
+def test_batch_exception():
+    with pytest.raises(ValueError):
+        minimal(kmer_batch(seq="A", k=5))
+
+
+def test_batch_too_few_distinct_kmers():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(kmer_batch(seq="AAAA", k=2, min_size=2, distinct=True))
+
+
+def test_batch_index_stores_offsets():
+    index = _kmer_index("TTTTGGGG", 3, canonical=True, distinct=True)
+
+    assert index.typecode == "q"
+    assert list(index) == [~0, ~2, ~3, ~4]
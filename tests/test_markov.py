@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from hypothesis import errors, given
+
+from hypothesis_bio import MAX_MARKOV_ORDER, MarkovModel, fit_markov_model, markov_dna
+
+from .minimal import minimal
+
+
+def test_fit_markov_model_counts_windows():
+    model = fit_markov_model(["AACGTn", b"ac"], order=1)
+
+    assert model.order == 1
+    assert sum(model.counts) == 5
+    # AA, AC, CG and GT in ACGT order
+    assert [model.counts[i] for i in (0, 1, 6, 11)] == [1, 2, 1, 1]
+
+
+def test_fit_markov_model_caches_file_models(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    reference.write_text(">a\nACGTACGT\nAC\n>b\nTTTT\n")
+    cache = tmp_path / "cache"
+
+    model = fit_markov_model(str(reference), order=2, cache_directory=str(cache))
+    (cached,) = os.listdir(str(cache))
+    with open(str(cache / cached), "w") as handle:
+        handle.write('{"order": 2, "counts": [7]}')
+
+    assert sum(model.counts) == 8 + 2
+    assert fit_markov_model(str(reference), order=2, cache_directory=str(cache)) == (
+        MarkovModel(2, (7,))
+    )
+
+
+def test_fit_markov_model_negative_order():
+    with pytest.raises(errors.InvalidArgument):
+        fit_markov_model(["ACGT"], order=-1)
+
+
+def test_fit_markov_model_order_too_high():
+    with pytest.raises(errors.InvalidArgument):
+        fit_markov_model(["ACGT"], order=MAX_MARKOV_ORDER + 1)
+
+
+def test_markov_dna_model_with_wrong_number_of_counts():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(markov_dna(MarkovModel(2, (7,))))
+
+
+def test_markov_dna_keeps_tables_on_the_model():
+    model = fit_markov_model(["ACGT"], order=2)
+    minimal(markov_dna(model))
+    tables = model._tables
+
+    minimal(markov_dna(model, min_size=3))
+    assert model._tables is tables
+    assert [len(table) for table in tables] == [256, 4 * 256, 16 * 256]
+
+
+def test_markov_dna_smallest_example():
+    model = fit_markov_model(["CCCCCCCCCCCCAC"], order=1)
+
+    assert minimal(markov_dna(model, min_size=4)) == "CCCC"
+
+
+@given(markov_dna(fit_markov_model(["ACACACAC"], order=1), max_size=1000))
+def test_markov_dna_follows_transitions(sequence):
+    assert set(sequence) <= {"A", "C"}
+    assert "AA" not in sequence and "CC" not in sequence
@@ -168,3 +168,14 @@ def test_generate_compnd_ec_assigned():
 
 def test_generate_compnd_continuation_count():
     assert minimal(generate_compnd(continuation_number=5)) == "COMPND  5  MOL_ID: 0;"
+
+
+def test_generate_header_as_bytes():
+    assert (
+        minimal(generate_header(as_bytes=True))
+        == b"HEADER" + b" " * 43 + b"01-JAN-00   0000"
+    )
+
+
+def test_generate_split_as_bytes():
+    assert minimal(generate_split(as_bytes=True)) == b"SPLIT      0000"
@@ -1,6 +1,7 @@
 from hypothesis import given
 
-from hypothesis_bio import protein
+from hypothesis_bio import protein, swissprot_aa_frequencies
+from hypothesis_bio.utilities import protein_1to3
 
 from .minimal import minimal
 
@@ -153,3 +154,43 @@ norm_AA = {
     "W": "Trp",
     "Y": "Tyr",
 }
+
+
+def test_aa_frequencies_smallest_example():
+    assert minimal(protein(min_size=3, aa_frequencies={"W": 1, "M": 3})) == "MMM"
+
+
+@given(
+    protein(
+        uppercase_only=True,
+        min_size=1000,
+        max_size=1000,
+        aa_frequencies=swissprot_aa_frequencies,
+    )
+)
+def test_aa_frequencies_proteome(seq):
+    # unknown residues have no frequency, so are never generated
+    assert "X" not in seq
+
+
+@given(protein(aa_frequencies={"C": 1}, single_letter_protein=False))
+def test_aa_frequencies_3_letter_abbrv(seq):
+    assert seq.lower() == "cys" * (len(seq) // 3)
+
+
+def test_3_letter_abbrv_separator_smallest_example():
+    assert (
+        minimal(protein(min_size=2, single_letter_protein=False, separator="-"))
+        == "Ala-Ala"
+    )
+
+
+@given(protein(single_letter_protein=False, uppercase_only=True, separator="-"))
+def test_3_letter_abbrv_separator(seq):
+    residues = seq.split("-") if seq else []
+    assert all(len(residue) == 3 and residue.isupper() for residue in residues)
+
+
+@given(protein(single_letter_protein=False, max_size=20))
+def test_3_letter_abbrv_matches_1_letter(seq):
+    assert all(seq[i : i + 3] in protein_1to3.values() for i in range(0, len(seq), 3))
@@ -0,0 +1,85 @@
+import pytest
+from hypothesis import given
+
+from hypothesis_bio import (
+    ILLUMINA_BINS,
+    QualityModel,
+    binned_illumina_quality,
+    cycle_decay_quality,
+    fastq_entry,
+    fastq_quality,
+    nanopore_quality,
+    uniform_quality,
+)
+
+from .minimal import minimal
+
+
+def test_zero_noise_gives_most_likely_scores():
+    model = cycle_decay_quality(start=38, end=20, spread=2)
+    scores = model.scores(bytes(100))
+
+    assert scores[0] == 38
+    assert scores[-1] == 21  # the middle of the last segment
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_scores_follow_weights():
+    model = QualityModel(lambda fraction, read_level: {10: 3, 20: 1}, resolution=1)
+    scores = model.scores(bytes(range(256)))
+
+    assert scores.count(10) == 192
+    assert scores.count(20) == 64
+
+
+def test_empty_and_invalid_distributions():
+    assert uniform_quality().scores(b"") == b""
+    with pytest.raises(ValueError):
+        QualityModel(lambda fraction, read_level: {100: 1}).scores(b"\x00")
+
+
+@given(
+    fastq_quality(min_size=1, max_size=300, model=binned_illumina_quality(), offset=0)
+)
+def test_binned_illumina_quality_only_uses_bins(quality):
+    bins = {chr(value) for lowest, value in ILLUMINA_BINS}
+    assert set(quality) <= bins
+
+
+def test_nanopore_quality_varies_between_reads():
+    model = nanopore_quality()
+    low = model.scores(bytes(100), 0)
+    high = model.scores(bytes(100), 255)
+
+    assert sum(low) < sum(high)
+    assert low[0] < low[50]
+    # the first score does not pick the read level
+    assert model.scores(bytes([255]) + bytes(99), 0)[50] == low[50]
+
+
+def test_read_levels_are_symmetric():
+    levels = []
+    model = QualityModel(
+        lambda fraction, read_level: levels.append(read_level) or {0: 1},
+        resolution=1,
+        read_levels=4,
+    )
+    for level_noise in range(256):
+        model.scores(b"\x00", level_noise)
+
+    assert levels == [0.125, 0.375, 0.625, 0.875]
+
+
+def test_fastq_quality_with_model_minimal():
+    actual = minimal(
+        fastq_quality(min_size=3, model=cycle_decay_quality(start=40, end=40))
+    )
+    expected = "III"
+
+    assert actual == expected
+
+
+@given(fastq_entry(quality_model=nanopore_quality(), min_score=5, max_score=20))
+def test_fastq_entry_quality_model_clamps_scores(fastq_string):
+    quality = fastq_string.split("\n")[-1]
+    assert all(5 + 33 <= ord(char) <= 20 + 33 for char in quality)
@@ -0,0 +1,83 @@
+import re
+
+import pytest
+from hypothesis import errors, given
+
+from hypothesis_bio import simulated_reads
+from hypothesis_bio.utilities import reverse_complement
+
+from .minimal import minimal
+
+
+def aligned_lengths(cigar):
+    read_length = reference_length = 0
+    for count, operation in re.findall(r"(\d+)([MID])", cigar):
+        if operation in "MI":
+            read_length += int(count)
+        if operation in "MD":
+            reference_length += int(count)
+    return read_length, reference_length
+
+
+def test_simulated_reads_minimal():
+    simulation = minimal(simulated_reads(read_length=3))
+
+    assert simulation.reference == {"reference": "AAA"}
+    assert len(simulation.reads) == 1
+    assert simulation.reads[0].position == 0
+    assert simulation.reads[0].end == 3
+
+
+@given(simulated_reads(read_length=10, coverage=5))
+def test_simulated_reads_coverage(simulation):
+    expected = round(5 * len(simulation.reference["reference"]) / 10)
+
+    assert len(simulation.reads) == expected
+
+
+@given(
+    simulated_reads(
+        read_length=20, substitution_rate=0.1, insertion_rate=0.1, deletion_rate=0.1
+    )
+)
+def test_simulated_reads_cigar_matches_origin(simulation):
+    for read in simulation.reads:
+        reference = simulation.reference[read.contig]
+        sequence = reverse_complement(read.sequence) if read.reverse else read.sequence
+
+        assert aligned_lengths(read.cigar) == (len(sequence), read.end - read.position)
+        assert 0 <= read.position < read.end <= len(reference)
+        assert not read.cigar.endswith("D") and not re.match(r"\d+D", read.cigar)
+
+
+@given(
+    simulated_reads(
+        reference={"chr1": "ACGTACGTAC", "chr2": b"GGGGGGGGGGCCCCC", "short": "A"},
+        read_length=5,
+        num_reads=50,
+        substitution_rate=0,
+        insertion_rate=0,
+        deletion_rate=0,
+        allow_reverse=False,
+    )
+)
+def test_simulated_reads_without_errors_are_substrings(simulation):
+    for read in simulation.reads:
+        reference = simulation.reference[read.contig]
+        if not isinstance(reference, str):
+            reference = reference.decode()
+
+        assert read.contig != "short"
+        assert read.cigar == "5M"
+        assert reference[read.position : read.end] == read.sequence
+        assert read.name.startswith("{}_{}_".format(read.contig, read.position + 1))
+
+
+def test_simulated_reads_invalid_rates():
+    with pytest.raises(errors.InvalidArgument):
+        minimal(simulated_reads(substitution_rate=0.5, deletion_rate=0.5))
+
+
+def test_simulated_reads_reference_too_short():
+    with pytest.raises(ValueError):
+        minimal(simulated_reads(reference="ACGT", read_length=5))
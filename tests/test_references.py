@@ -0,0 +1,190 @@
+import struct
+
+import pytest
+from hypothesis import given, settings
+from hypothesis.errors import InvalidArgument
+from hypothesis.strategies import data
+
+from hypothesis_bio import (
+    ReferencePool,
+    fasta_entry,
+    reference_pool,
+    reference_sequence,
+)
+
+from .minimal import minimal
+
+SEQUENCES = {"chr1": "ACGTNacgtnGATTACA" * 5, "chr2": "TTAGGC", "empty": ""}
+
+
+def write_two_bit(path, sequences):
+    """Writes a little-endian 2bit file, marking N and lowercase runs one base at a time."""
+    names = list(sequences)
+    offset = 16 + sum(1 + len(name) + 4 for name in names)
+    index, records = b"", b""
+    for name in names:
+        sequence = sequences[name]
+        blocks = []
+        for kind in ("N", "lower"):
+            starts = [
+                i
+                for i, base in enumerate(sequence)
+                if (base in "Nn" if kind == "N" else base.islower())
+            ]
+            blocks.append(
+                struct.pack(
+                    "<I%dI%dI" % (len(starts), len(starts)),
+                    len(starts),
+                    *(starts + [1] * len(starts))
+                )
+            )
+        bases = sequence.upper().replace("N", "T") + "TTT"
+        packed = bytes(
+            sum(
+                "TCAG".index(base) << (6 - 2 * j)
+                for j, base in enumerate(bases[i : i + 4])
+            )
+            for i in range(0, len(sequence), 4)
+        )
+        record = (
+            struct.pack("<I", len(sequence)) + blocks[0] + blocks[1] + bytes(4) + packed
+        )
+        index += bytes([len(name)]) + name.encode() + struct.pack("<I", offset)
+        records += record
+        offset += len(record)
+    with open(path, "wb") as handle:
+        handle.write(
+            struct.pack("<IIII", 0x1A412743, 0, len(names), 0) + index + records
+        )
+
+
+@pytest.fixture(scope="module", params=["fasta", "windows", "2bit"])
+def reference(request, tmp_path_factory):
+    path = tmp_path_factory.mktemp("references") / "reference"
+    if request.param == "2bit":
+        write_two_bit(str(path), SEQUENCES)
+    else:
+        line_ending = "\r\n" if request.param == "windows" else "\n"
+        with open(str(path), "w", newline="") as handle:
+            for name, sequence in SEQUENCES.items():
+                handle.write(">{} description{}".format(name, line_ending))
+                for i in range(0, len(sequence), 7):
+                    handle.write(sequence[i : i + 7] + line_ending)
+    return str(path)
+
+
+def test_reference_pool_index(reference):
+    pool = reference_pool(reference)
+
+    assert pool is reference_pool(reference)
+    assert pool.names == list(SEQUENCES)
+    assert pool.ends == [85, 91, 91]
+
+
+def test_reference_pool_fetch(reference):
+    pool = ReferencePool(reference)
+    sequence = SEQUENCES["chr1"]
+    for start in range(len(sequence)):
+        for end in range(start, len(sequence) + 2):
+            assert bytes(pool.fetch(0, start, end)).decode() == sequence[start:end]
+
+
+def test_reference_sequence_minimal(reference):
+    assert bytes(minimal(reference_sequence(reference))) == b"A"
+
+
+@settings(max_examples=20)
+@given(data=data())
+def test_reference_sequence_is_substring(reference, data):
+    sequence = data.draw(reference_sequence(reference, min_size=3, max_size=10))
+
+    assert 3 <= len(sequence) <= 10
+    assert any(bytes(sequence).decode() in s for s in SEQUENCES.values())
+
+
+def test_reference_sequence_as_sequence_source(reference):
+    entry = minimal(
+        fasta_entry(
+            sequence_source=reference_sequence(reference, min_size=6), wrap_length=0
+        )
+    )
+
+    assert entry == ">\nACGTNa"
+
+
+def test_unevenly_wrapped_fasta_raises_error(tmp_path):
+    path = tmp_path / "uneven.fasta"
+    path.write_text(">a\nACGT\nAC\nACGT\n")
+    with pytest.raises(ValueError):
+        ReferencePool(str(path))
+
+
+def test_reference_pool_reopens_after_close(tmp_path):
+    path = str(tmp_path / "closed.fasta")
+    with open(path, "w") as handle:
+        handle.write(">a\nACGT\n")
+
+    with reference_pool(path) as pool:
+        assert bytes(pool.fetch(0, 0, 4)) == b"ACGT"
+    assert pool.closed
+    with pytest.raises(ValueError):
+        pool.fetch(0, 0, 4)
+
+    reopened = reference_pool(path)
+    assert reopened is not pool
+    assert bytes(reopened.fetch(0, 1, 3)) == b"CG"
+    assert reopened is reference_pool(path)
+
+
+def test_reference_pool_close_with_fetched_view(tmp_path):
+    path = str(tmp_path / "held.fasta")
+    with open(path, "w") as handle:
+        handle.write(">a\nACGT\n")
+    pool = ReferencePool(path)
+
+    view = pool.fetch(0, 0, 4)
+    with pytest.raises(BufferError):
+        pool.close()
+    assert not pool.closed
+    assert bytes(pool.fetch(0, 1, 3)) == b"CG"
+
+    view.release()
+    pool.close()
+    assert pool.closed
+
+
+def test_reference_pool_replaces_only_closed_pool(tmp_path):
+    paths = []
+    for name in "ab":
+        paths.append(str(tmp_path / "{}.fasta".format(name)))
+        with open(paths[-1], "w") as handle:
+            handle.write(">{}\nACGT\n".format(name))
+    kept = reference_pool(paths[0])
+    reference_pool(paths[1]).close()
+
+    assert not reference_pool(paths[1]).closed
+    assert reference_pool(paths[0]) is kept
+
+
+def test_reference_sequence_longer_than_every_record(reference):
+    with pytest.raises(InvalidArgument):
+        minimal(reference_sequence(reference, min_size=86, max_size=100))
+
+
+def test_reference_sequence_skips_short_records(tmp_path):
+    path = str(tmp_path / "short.fasta")
+    with open(path, "w") as handle:
+        handle.write(">short\nAC\n>long\nGATTACA\n")
+
+    @given(reference_sequence(path, min_size=5, max_size=5))
+    def check(sequence):
+        assert bytes(sequence) in (b"GATTA", b"ATTAC", b"TTACA")
+
+    check()
+
+
+def test_nameless_fasta_header_raises_error(tmp_path):
+    path = tmp_path / "nameless.fasta"
+    path.write_text(">\nACGT\n")
+    with pytest.raises(ValueError, match="without a name"):
+        ReferencePool(str(path))
@@ -73,3 +73,9 @@ def test_allow_ambiguous_2_mer():
         lambda x: all(c not in ["A", "U", "C", "G"] for c in x),
     )
     assert seq == "BB"
+
+
+@given(rna(min_size=100000, max_size=100000, allow_ambiguous=False, bulk=True))
+def test_bulk_long_sequence(seq):
+    assert len(seq) == 100000
+    assert set(seq).issubset(set("AUCGaucg-"))
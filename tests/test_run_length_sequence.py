@@ -0,0 +1,60 @@
+import re
+
+import pytest
+from hypothesis import errors, given
+
+from hypothesis_bio import run_length_sequence
+
+from .minimal import minimal
+
+
+def test_smallest_example():
+    assert minimal(run_length_sequence()) == ""
+
+
+def test_smallest_non_empty_example():
+    assert minimal(run_length_sequence(min_segments=1)) == "A"
+
+
+def test_shrinks_towards_fewer_segments():
+    assert minimal(run_length_sequence(), lambda seq: len(seq) >= 10) == "A" * 10
+
+
+@given(run_length_sequence(alphabet="AC", max_motif_size=3, max_repeat=5))
+def test_alphabet(seq):
+    assert set(seq) <= set("AC")
+
+
+@given(run_length_sequence(max_segments=5, max_motif_size=2, max_repeat=10))
+def test_max_length(seq):
+    assert len(seq) <= 5 * 2 * 10
+
+
+@given(run_length_sequence(max_repeat=10 ** 6, max_size=1000))
+def test_max_size(seq):
+    assert len(seq) <= 1000
+
+
+# expanding every segment in full would need up to 10 ** 10 characters
+@given(run_length_sequence(max_motif_size=10, max_repeat=10 ** 7, max_size=10))
+def test_max_size_only_expands_what_fits(seq):
+    assert len(seq) <= 10
+
+
+@given(run_length_sequence(alphabet="A", min_segments=1, max_segments=1, max_repeat=7))
+def test_homopolymer(seq):
+    assert re.fullmatch("A{1,7}", seq)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"alphabet": ""},
+        {"max_motif_size": 0},
+        {"max_repeat": 0},
+        {"min_segments": 3, "max_segments": 2},
+    ],
+)
+def test_invalid_arguments(arguments):
+    with pytest.raises(errors.InvalidArgument):
+        minimal(run_length_sequence(**arguments))
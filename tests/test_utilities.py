@@ -0,0 +1,167 @@
+import random
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from hypothesis_bio import dna
+from hypothesis_bio.utilities import (
+    bulk_bytes,
+    cigar_string,
+    draw_size,
+    reverse_complement,
+    sampling_table,
+    translate_uniform,
+    translation_table,
+    unique_entry,
+    weighted_choices,
+    wrap,
+)
+
+from .minimal import minimal
+
+
+def test_wrap_empty():
+    assert wrap("", 3) == ""
+    assert wrap(b"", 3) == b""
+
+
+def test_wrap_exact_multiple():
+    assert wrap("ACGTAC", 3) == "ACG\nTAC"
+
+
+def test_wrap_bytes():
+    assert wrap(b"ACGTA", 2) == b"AC\nGT\nA"
+
+
+def test_wrap_bytearray_returns_bytes():
+    assert wrap(bytearray(b"ACGTA"), 3) == b"ACG\nTA"
+
+
+@given(dna(), integers(min_value=1, max_value=100))
+def test_wrap_roundtrip(seq, width):
+    wrapped = wrap(seq, width)
+    assert wrapped.replace("\n", "") == seq
+    assert all(len(line) <= width for line in wrapped.split("\n"))
+    assert wrap(seq.encode(), width) == wrapped.encode()
+
+
+def test_bulk_bytes_shrinks_to_zeros():
+    assert minimal(bulk_bytes(min_size=1000)) == bytes(1000)
+
+
+@given(bulk_bytes(min_size=500, max_size=600))
+def test_bulk_bytes_size(block):
+    assert 500 <= len(block) <= 600
+
+
+def test_cigar_string_merges_operations():
+    assert cigar_string([(2, "M"), (0, "I"), (3, "M"), (1, "D")]) == "5M1D"
+
+
+def test_draw_size_without_max_size_is_unbounded():
+    # the extra length is that of an unbounded binary() draw, with no cap of its own
+    assert draw_size(lambda strategy: bytes(1000), 10, None) == 1010
+
+
+def test_translation_table():
+    table = translation_table("ACGT")
+    assert len(table) == 256
+    assert bytes(range(8)).translate(table) == b"ACGTACGT"
+
+
+QUALITY_ALPHABET = "".join(chr(c) for c in range(33, 127))
+
+
+def test_translate_uniform_keeps_unbiased_bytes():
+    translated = translate_uniform(bytes(range(188)), QUALITY_ALPHABET)
+
+    assert translated == QUALITY_ALPHABET.encode() * 2
+
+
+@given(bulk_bytes(max_size=1000))
+def test_translate_uniform_size(block):
+    translated = translate_uniform(block, QUALITY_ALPHABET)
+
+    assert len(translated) == len(block)
+    assert set(translated) <= set(QUALITY_ALPHABET.encode())
+
+
+def test_translate_uniform_is_unbiased():
+    block = random.Random(0).getrandbits(8 * 10 ** 6).to_bytes(10 ** 6, "little")
+    translated = translate_uniform(block, QUALITY_ALPHABET)
+    counts = [translated.count(c) for c in QUALITY_ALPHABET.encode()]
+
+    # 256 % 94 = 68, so a plain table would make the first 68 characters 1.5x as likely
+    assert max(counts) < 1.1 * min(counts)
+
+
+def test_reverse_complement():
+    assert reverse_complement("AACGTn-") == "-nACGTT"
+    assert reverse_complement(b"GATTACA") == b"TGTAATC"
+
+
+@given(dna())
+def test_reverse_complement_twice_is_identity(sequence):
+    assert reverse_complement(
+        reverse_complement(sequence)
+    ).upper() == sequence.upper().replace("U", "T")
+
+
+def test_sampling_table_is_exact():
+    table = sampling_table((1, 2, 5), bits=16)
+
+    assert len(table) == 65536
+    assert [table.count(i) for i in range(3)] == [8192, 16384, 40960]
+
+
+def test_sampling_table_apportions_remainders():
+    table = sampling_table((1, 1, 1))
+
+    assert len(table) == 256
+    assert sorted(table.count(i) for i in range(3)) == [85, 85, 86]
+
+
+def test_sampling_table_zero_samples_most_likely_index():
+    assert sampling_table((1, 1))[0] == 0
+    assert sampling_table((0, 1))[0] == 1
+    assert sampling_table((1, 3, 2), bits=16)[0] == 1
+
+
+def test_weighted_choices():
+    assert weighted_choices(bytes(6), sampling_table((3, 1), bits=16)) == bytes(3)
+
+
+def test_weighted_choices_reads_little_endian():
+    table = sampling_table((1, 1), bits=16)
+
+    # 0x8000 falls in the second half of the table, 0x0080 in the first
+    assert weighted_choices(b"\x00\x80\x80\x00", table) == b"\x01\x00"
+
+
+def test_weighted_choices_odd_noise_raises_error():
+    with pytest.raises(ValueError):
+        weighted_choices(bytes(3), sampling_table((1, 1), bits=16))
+
+
+def test_unique_entry_keeps_new_identifiers():
+    seen = set()
+
+    assert unique_entry(">a comment\nACGT", seen) == ">a comment\nACGT"
+    assert unique_entry(">b\nACGT", seen) == ">b\nACGT"
+
+
+def test_unique_entry_suffixes_repeated_identifiers():
+    seen = set()
+    entries = [unique_entry(">a x\nA", seen) for _ in range(3)]
+
+    assert entries == [">a x\nA", ">a_1 x\nA", ">a_2 x\nA"]
+
+
+def test_unique_entry_renames_fastq_description():
+    seen = set()
+    unique_entry(b"@r 1:N\nACGT\n+r 1:N\n++++", seen)
+
+    assert unique_entry(b"@r 1:N\nACGT\n+r 1:N\n++++", seen) == (
+        b"@r_1 1:N\nACGT\n+r_1 1:N\n++++"
+    )
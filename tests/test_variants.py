@@ -0,0 +1,80 @@
+import pytest
+from hypothesis import errors, given
+
+from hypothesis_bio import lift_over, mutated_sequence
+
+from .minimal import minimal
+
+
+def apply_naively(reference, variants):
+    for position, ref, alt in reversed(variants):
+        assert reference[position : position + len(ref)] == ref
+        reference = reference[:position] + alt + reference[position + len(ref) :]
+    return reference
+
+
+def test_mutated_sequence_minimal():
+    mutation = minimal(mutated_sequence())
+
+    assert mutation.reference == mutation.sequence == "A"
+    assert mutation.variants == []
+    assert mutation.liftover == [(0, 1, 0)]
+
+
+@given(mutated_sequence(max_variants=50, max_indel_size=5))
+def test_variants_are_applied(mutation):
+    assert mutation.sequence == apply_naively(mutation.reference, mutation.variants)
+
+
+@given(mutated_sequence(max_variants=50))
+def test_variants_are_sorted_and_separate(mutation):
+    for previous, variant in zip(mutation.variants, mutation.variants[1:]):
+        assert previous.position + len(previous.ref) < variant.position
+    for variant in mutation.variants:
+        assert variant.ref != variant.alt
+        assert len(variant.ref) == 1 or len(variant.alt) == 1
+        assert variant.ref[0] == variant.alt[0] or len(variant.ref) == len(variant.alt)
+
+
+@given(mutated_sequence(max_variants=50))
+def test_lift_over(mutation):
+    changed = set()
+    for position, ref, alt in mutation.variants:
+        shared = 1 if len(ref) != len(alt) else 0
+        changed.update(range(position + shared, position + len(ref)))
+
+    lifted = [lift_over(mutation.liftover, i) for i in range(len(mutation.reference))]
+    for position, target in enumerate(lifted):
+        if position in changed:
+            assert target is None
+        else:
+            assert mutation.sequence[target] == mutation.reference[position]
+    kept = [target for target in lifted if target is not None]
+    assert kept == sorted(kept)
+
+
+@given(
+    mutated_sequence(
+        reference="ACGT" * 100,
+        min_variants=10,
+        snp_weight=0,
+        insertion_weight=0,
+    )
+)
+def test_deletions_only(mutation):
+    assert len(mutation.sequence) < len(mutation.reference)
+    assert all(len(variant.alt) == 1 for variant in mutation.variants)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"snp_weight": 0, "insertion_weight": 0, "deletion_weight": 0},
+        {"snp_weight": -1},
+        {"max_indel_size": 0},
+        {"min_variants": 3, "max_variants": 2},
+    ],
+)
+def test_invalid_arguments(arguments):
+    with pytest.raises(errors.InvalidArgument):
+        minimal(mutated_sequence(**arguments))